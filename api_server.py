@@ -1,23 +1,191 @@
 """Flask API server for BondsAI frontend integration."""
 
-import asyncio
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, g, request, jsonify, render_template
 from flask_cors import CORS
+from werkzeug.middleware.proxy_fix import ProxyFix
 import sys
 import os
-import glob
-from server.AssessmentFileLoader import parse_assessment_file
+import json
+import time
+import hashlib
+from datetime import datetime, timezone
+from server.AssessmentIndex import decode_cursor, get_assessment_index
+from server.AssessmentFileLoader import get_assessment_cache
+from server.AssessmentStore import get_assessment_store
 from server.ApplicantManager import ApplicantManager
+from server.AsyncLoopRunner import AsyncLoopRunner
+from server.AssessmentJobQueue import get_assessment_queue
+from server.CohortStats import DEFAULT_TREND_WEEKS, MAX_TREND_WEEKS, cohort_stats
+from server.Compression import compress_response
+from server.Metrics import HTTP_REQUEST_SECONDS, HTTP_RESPONSE_BYTES, SESSIONS, SESSION_EVENTS, registry
+from server.Tracing import RequestProfiler, finish_span, get_tracer, server_timing, start_trace
+from bondsai.config import config
+from bondsai.llm_client import get_llm_pool
+from bondsai.report import SKILL_LABELS
 
 # Add the src directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+# Every interview needs the LLM, so the server refuses to start without an API key, whether it is
+# run directly or imported by a WSGI server; offline tools such as `bondsai reparse` do not need one
+config.require_openai_api_key()
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend integration
 
+# Applicants are keyed by IP address, so behind a proxy take it from X-Forwarded-For
+if config.trust_proxy_headers:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1)
+
 # Global instances to maintain conversation state
 applicant_manager = ApplicantManager()
 
+# One long-lived event loop shared by every request, so async LLM clients and their
+# connection pools survive between turns instead of dying with a per-request loop
+async_runner = AsyncLoopRunner()
+
+# Writes cProfile dumps of single requests on demand (see start_request)
+request_profiler = RequestProfiler(config.profile_dir)
+
+# Time every request, trace it as a root span, and profile it if asked to with ?profile=1 or an
+# X-Profile: 1 header (only when PROFILE_REQUESTS is enabled, as profiling slows the whole server)
+@app.before_request
+def start_request():
+    g.request_started = time.perf_counter()
+    g.request_span = start_trace(f"{request.method} {request.url_rule.rule if request.url_rule else 'unmatched'}")
+    g.profile = None
+    if config.profile_requests and (request.args.get('profile') == '1' or request.headers.get('X-Profile') == '1'):
+        g.profile = request_profiler.start(async_runner.start())
+
+# Record request latency and finish the request's trace and profile; streamed replies are finished
+# when the stream closes, so they count in full (static files are passed straight to the server,
+# which never calls their close hooks)
+# Routes are labelled by their URL rule, not the concrete path, to keep the label set small
+@app.after_request
+def finish_request(response):
+    started = g.get('request_started')
+    if started is None:
+        return response
+    
+    labels = {
+        "method": request.method,
+        "route": request.url_rule.rule if request.url_rule else "unmatched",
+        "status": response.status_code
+    }
+    request_span, profile = g.request_span, g.profile
+    
+    def finish():
+        HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, **labels)
+        request_span.attrs["status"] = labels["status"]
+        finish_span(request_span)
+        if profile is not None:
+            path = request_profiler.stop(profile, f"{labels['method']} {labels['route']}")
+            print(f"Profile of {labels['method']} {labels['route']} written to {path}")
+            return path
+    
+    if response.is_streamed and not response.direct_passthrough:
+        response.call_on_close(finish)
+    else:
+        profile_path = finish()
+        response.headers["Server-Timing"] = server_timing(request_span)
+        if profile_path:
+            response.headers["X-Profile-File"] = profile_path
+    return response
+
+# Compress JSON and text replies for clients that accept it (registered after finish_request, so it
+# runs first and its time counts towards the request)
+@app.after_request
+def compress(response):
+    encoding = compress_response(response, request.accept_encodings, config.compress_min_bytes)
+    if not (response.is_streamed or response.direct_passthrough):
+        HTTP_RESPONSE_BYTES.inc(response.content_length or 0, encoding=encoding or "identity")
+    return response
+
+# Build the chat response body, including the profile summary once the interview is complete
+def build_chat_response(ip_address, applicant_job_assistant, ai_response):
+    # Check if conversation is complete (ready for assessment)
+    is_complete = applicant_job_assistant.ready_for_assessment
+    
+    # If complete, generate assessment summary
+    profile_data = None
+    if is_complete:
+        applicant_manager.stop_conversation_timer(ip_address)
+        conversation_duration = applicant_manager.get_conversation_duration(ip_address)
+        profile_data = {
+            "name": applicant_job_assistant.candidate.name or "Candidate",
+            "conversation_count": applicant_job_assistant.candidate.conversation_count,
+            "conversation_duration": conversation_duration,
+            "assessment_summary": "Assessment is being prepared",
+            "assessment_job_id": applicant_job_assistant.assessment_job_id
+        }
+    
+    return {
+        "message": ai_response,
+        "isComplete": is_complete,
+        "profile": profile_data,
+        "conversation_count": applicant_job_assistant.candidate.conversation_count
+    }
+
+# Largest page the applicant listing will return
+MAX_APPLICANT_PAGE_SIZE = 100
+
+# Read the applicant listing's paging and filter query parameters; raises ValueError on bad input
+def parse_applicant_query(args):
+    limit = int(args.get('limit', 5))
+    if not 1 <= limit <= MAX_APPLICANT_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_APPLICANT_PAGE_SIZE}")
+    
+    cursor = args.get('cursor') or None
+    if cursor:
+        decode_cursor(cursor)
+    
+    min_score = args.get('min_score')
+    return {
+        "limit": limit,
+        "cursor": cursor,
+        "name": args.get('name', '').strip() or None,
+        "date_from": datetime.strptime(args['date_from'], '%Y-%m-%d').date() if args.get('date_from') else None,
+        "date_to": datetime.strptime(args['date_to'], '%Y-%m-%d').date() if args.get('date_to') else None,
+        "min_score": int(min_score) if min_score else None
+    }
+
+# Most raw assessments one batch request may ask for
+MAX_RAW_BATCH_SIZE = 50
+
+# ETag for raw assessment text, from the identity (name, mtime, size) of the files it is read from,
+# so a client's copy can be validated without reading any file; None stands for a missing file
+# The raw and HTML routes send it as a weak ETag (W/"...") through conditional_json
+def assessment_etag(filenames, filepaths):
+    digest = hashlib.sha256()
+    for filename, filepath in zip(filenames, filepaths):
+        if filepath is None:
+            digest.update(f"{filename}:missing;".encode('utf-8'))
+        else:
+            stat = os.stat(filepath)
+            digest.update(f"{filename}:{stat.st_mtime_ns}:{stat.st_size};".encode('utf-8'))
+    return digest.hexdigest()
+
+# Send a JSON body with its ETag (and Last-Modified, a Unix timestamp, if given), or an empty 304
+# without building the body if the client already has it
+# Only If-None-Match is checked: Last-Modified has one-second resolution, so two writes within the same
+# second would share it and If-Modified-Since could answer 304 for a stale copy; it is sent for information
+# The ETag is weak as the body may be sent compressed, and any encoding of it is as good as another
+# no-cache makes browsers keep the response but revalidate it on every use, as reports can be regenerated
+def conditional_json(etag, build_body, last_modified=None):
+    not_modified = bool(request.if_none_match) and request.if_none_match.contains_weak(etag)
+    
+    response = Response(status=304) if not_modified else jsonify(build_body())
+    response.set_etag(etag, weak=True)
+    if last_modified is not None:
+        response.last_modified = datetime.fromtimestamp(int(last_modified), timezone.utc)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+# Format one Server-Sent Events message
+def sse_event(data, event=None):
+    payload = f"data: {json.dumps(data)}\n\n"
+    return f"event: {event}\n{payload}" if event else payload
+
 @app.route('/applicant')
 def applicant():
     """
@@ -40,44 +208,57 @@ def applicant_chat():
         if not user_message:
             return jsonify({"error": "Message cannot be empty"}), 400
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # Get AI response
+        ai_response = async_runner.run(applicant_job_assistant.chat(user_message))
+        applicant_manager.save_conversation(request.remote_addr, applicant_job_assistant)
         
-        try:
-            # Get AI response
-            ai_response = loop.run_until_complete(applicant_job_assistant.chat(user_message))
-            
-            # Check if conversation is complete (ready for assessment)
-            is_complete = applicant_job_assistant.ready_for_assessment
-            
-            # If complete, generate assessment summary
-            profile_data = None
-            if is_complete:
-                applicant_manager.stop_conversation_timer(request.remote_addr)
-                conversation_duration = applicant_manager.get_conversation_duration(request.remote_addr)
-                profile_data = {
-                    "name": applicant_job_assistant.candidate.name or "Candidate",
-                    "conversation_count": applicant_job_assistant.candidate.conversation_count,
-                    "conversation_duration": conversation_duration,
-                    "assessment_summary": "Assessment completed based on interview"
-                }
-            
-            response = {
-                "message": ai_response,
-                "isComplete": is_complete,
-                "profile": profile_data,
-                "conversation_count": applicant_job_assistant.candidate.conversation_count
-            }
-            
-            return jsonify(response)
-            
-        finally:
-            loop.close()
+        return jsonify(build_chat_response(request.remote_addr, applicant_job_assistant, ai_response))
 
     except Exception as e:
         print(f"Error in job chat: {str(e)}")
         return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
+@app.route('/applicant/chat/stream', methods=['POST'])
+def applicant_chat_stream():
+    """
+    Streaming variant of /applicant/chat.
+
+    Sends the interviewer reply as Server-Sent Events while it is generated:
+    one {"token": ...} event per chunk, then a final "done" event carrying the
+    same body /applicant/chat returns (message, isComplete, profile, ...).
+    """
+    try:
+        ip_address = request.remote_addr
+        applicant_job_assistant = applicant_manager.get_job_assistant(ip_address)
+        data = request.get_json()
+        user_message = data.get('message', '').strip()
+        
+        if not user_message:
+            return jsonify({"error": "Message cannot be empty"}), 400
+    
+    except Exception as e:
+        print(f"Error in job chat stream: {str(e)}")
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    
+    def generate():
+        tokens = []
+        try:
+            for token in async_runner.iterate(applicant_job_assistant.chat_stream(user_message)):
+                tokens.append(token)
+                yield sse_event({"token": token})
+            
+            applicant_manager.save_conversation(ip_address, applicant_job_assistant)
+            yield sse_event(build_chat_response(ip_address, applicant_job_assistant, "".join(tokens)), event="done")
+        
+        except Exception as e:
+            print(f"Error in job chat stream: {str(e)}")
+            yield sse_event({"error": f"Internal server error: {str(e)}"}, event="error")
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+
 @app.route('/applicant/end', methods=['POST'])
 def end_applicant_conversation():
     try:
@@ -111,40 +292,106 @@ def send_icon(filename):
 #Health check endpoint to verify SERVER is running
 @app.route('/api/health', methods=['GET'])
 def health_check():
-    return jsonify({"status": "healthy", "message": "BondsAI API is running"})
+    llm_cache = get_llm_pool().cache
+    return jsonify({
+        "status": "healthy",
+        "message": "BondsAI API is running",
+        "assessment_cache": get_assessment_cache().stats(),
+        "sessions": applicant_manager.stats(),
+        "llm_cache": llm_cache.stats() if llm_cache is not None else None
+    })
+
+# Prometheus metrics: request and LLM latency, token usage, live sessions and report parse times
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    stats = applicant_manager.stats()
+    SESSIONS.set(stats["live"], state="live")
+    SESSIONS.set(stats["bytes"], state="bytes")
+    for event in ("created", "expired", "evicted"):
+        SESSION_EVENTS.set(stats[event], event=event)
+    return Response(registry.render(), mimetype='text/plain; version=0.0.4')
+
+# Recent request and assessment job traces (nested span timings), slowest first
+@app.route('/api/traces', methods=['GET'])
+def traces():
+    try:
+        min_ms = float(request.args.get('min_ms', 0))
+        limit = int(request.args.get('limit', 50))
+    except ValueError:
+        return jsonify({"error": "min_ms and limit must be numbers"}), 400
+    return jsonify({"traces": get_tracer().recent(min_ms, limit)})
 
 # Get all job applicants and their assessment data
 @app.route('/api/recruiter/applicants', methods=['GET'])
 def get_applicants():
     try:
-        assessments_dir = "assessments"
-        applicants = []
+        assessment_index = get_assessment_index()
         
-        if not os.path.exists(assessments_dir):
-            return jsonify({"applicants": []})
-        
-        # Get all assessment files
-        assessment_files = glob.glob(os.path.join(assessments_dir, "*_assessment_*.txt"))
+        try:
+            query = parse_applicant_query(request.args)
+        except ValueError as e:
+            return jsonify({"error": f"Invalid query: {str(e)}"}), 400
         
-        for filepath in assessment_files:
-            candidate_data = parse_assessment_file(filepath)
-            if candidate_data:
-                # Add filepath for later retrieval
-                candidate_data['filepath'] = filepath
-                applicants.append(candidate_data)
+        # Pick up reports written before the index existed or by another process
+        assessment_index.sync_once(get_assessment_store())
         
-        # Sort by interview date (ascending for journey progression)
-        applicants.sort(key=lambda x: x.get('interview_date', ''))
+        # A page only changes when the index does, so an unchanged dashboard is answered with a 304
+        # from the index version alone, without querying the page
+        version, modified = assessment_index.state()
+        etag = hashlib.sha256(f"{version}:{modified}:".encode('utf-8') + request.query_string).hexdigest()
         
-        # Limit to 5 most recent sessions
-        applicants = applicants[-5:]
+        # Most recent sessions (5 by default), in ascending order for journey progression;
+        # next_cursor fetches the page of sessions before these
+        def build_body():
+            applicants, next_cursor = assessment_index.page(**query)
+            return {"applicants": applicants, "next_cursor": next_cursor}
         
-        return jsonify({"applicants": applicants})
+        return conditional_json(etag, build_body, modified)
         
     except Exception as e:
         print(f"Error getting applicants: {str(e)}")
         return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
+# Score statistics over every indexed assessment: per-skill mean, spread, percentiles, histogram and weekly trend
+@app.route('/api/recruiter/stats', methods=['GET'])
+def get_cohort_stats():
+    try:
+        assessment_index = get_assessment_index()
+        
+        try:
+            weeks = int(request.args.get('weeks', DEFAULT_TREND_WEEKS))
+            if not 1 <= weeks <= MAX_TREND_WEEKS:
+                raise ValueError(f"weeks must be between 1 and {MAX_TREND_WEEKS}")
+        except ValueError as e:
+            return jsonify({"error": f"Invalid query: {str(e)}"}), 400
+        
+        assessment_index.sync_once(get_assessment_store())
+        
+        # Statistics come from score counts the index keeps up to date on every write, so they only
+        # change with the index version, and building them never reads a report
+        version, modified = assessment_index.state()
+        etag = hashlib.sha256(f"stats:{version}:{modified}:{weeks}".encode('utf-8')).hexdigest()
+        
+        def build_body():
+            sections = {section: list(skills) for section, skills in SKILL_LABELS.items()}
+            return cohort_stats(assessment_index.score_counts(recent_weeks=weeks), sections, weeks)
+        
+        return conditional_json(etag, build_body, modified)
+        
+    except Exception as e:
+        print(f"Error getting cohort stats: {str(e)}")
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+@app.route('/api/assessment/jobs/<job_id>', methods=['GET'])
+def get_assessment_job(job_id):
+    """Poll the status of a background assessment job; 'filename' is set once the report is saved."""
+    job = get_assessment_queue().get_job(job_id)
+    if job is None:
+        return jsonify({"error": "Assessment job not found"}), 404
+    
+    job["filename"] = os.path.basename(job["result"]) if job["status"] == 'done' else None
+    return jsonify(job)
+
 @app.route('/api/assessment/raw/<path:filename>', methods=['GET'])
 def get_raw_assessment(filename):
     """Get raw assessment text for parsing detailed feedback."""
@@ -152,20 +399,85 @@ def get_raw_assessment(filename):
         from server.AssessmentFileLoader import get_raw_assessment_text
         import urllib.parse
         
-        # Decode filename
+        # Decode filename; only bare report filenames are accepted, so no path can escape the store
         decoded_filename = urllib.parse.unquote(filename)
-        filepath = os.path.join("assessments", decoded_filename)
+        try:
+            filepath = get_assessment_store().resolve(decoded_filename)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         
-        if not os.path.exists(filepath):
+        if filepath is None:
             return jsonify({"error": "Assessment file not found"}), 404
         
-        raw_text = get_raw_assessment_text(filepath)
-        return jsonify({"assessment_text": raw_text})
+        return conditional_json(
+            assessment_etag([decoded_filename], [filepath]),
+            lambda: {"assessment_text": get_raw_assessment_text(filepath)}
+        )
         
     except Exception as e:
         print(f"Error getting raw assessment: {str(e)}")
         return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
+@app.route('/api/assessment/html/<path:filename>', methods=['GET'])
+def get_assessment_html(filename):
+    """Get one assessment rendered as HTML, for showing a report on demand."""
+    try:
+        from server.AssessmentFileLoader import get_assessment_html as render_assessment
+        import urllib.parse
+        
+        decoded_filename = urllib.parse.unquote(filename)
+        try:
+            filepath = get_assessment_store().resolve(decoded_filename)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
+        if filepath is None:
+            return jsonify({"error": "Assessment file not found"}), 404
+        
+        return conditional_json(
+            assessment_etag([decoded_filename], [filepath]),
+            lambda: {"assessment_html": render_assessment(filepath)}
+        )
+        
+    except Exception as e:
+        print(f"Error getting assessment HTML: {str(e)}")
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+@app.route('/api/assessment/raw', methods=['GET'])
+def get_raw_assessments():
+    """
+    Batch variant of /api/assessment/raw/<filename>, for pages showing several sessions.
+
+    Takes one or more ?filename= parameters and returns {"assessments": {filename: text}, "missing": [...]}.
+    """
+    try:
+        from server.AssessmentFileLoader import get_raw_assessment_text
+        
+        filenames = list(dict.fromkeys(request.args.getlist('filename')))
+        if not 1 <= len(filenames) <= MAX_RAW_BATCH_SIZE:
+            return jsonify({"error": f"Between 1 and {MAX_RAW_BATCH_SIZE} filename parameters are required"}), 400
+        
+        store = get_assessment_store()
+        try:
+            filepaths = [store.resolve(filename) for filename in filenames]
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
+        def build_body():
+            return {
+                "assessments": {
+                    filename: get_raw_assessment_text(filepath)
+                    for filename, filepath in zip(filenames, filepaths) if filepath is not None
+                },
+                "missing": [filename for filename, filepath in zip(filenames, filepaths) if filepath is None]
+            }
+        
+        return conditional_json(assessment_etag(filenames, filepaths), build_body)
+        
+    except Exception as e:
+        print(f"Error getting raw assessments: {str(e)}")
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
 @app.errorhandler(404)
 def page_not_found(e):
     return app.send_static_file('404.html'), 404
@@ -174,4 +486,7 @@ if __name__ == '__main__':
     print("Starting BondsAI API Server...")
     print("Make sure you have set up your OpenAI API key in the .env file")
     print("Server will be available at http://localhost:8000")
-    app.run(debug=True, host='0.0.0.0', port=8000)
+    async_runner.start()
+    # Open the shared LLM connection before the first student arrives
+    async_runner.submit(get_llm_pool().warm_up())
+    app.run(debug=True, host='0.0.0.0', port=8000, threaded=True)
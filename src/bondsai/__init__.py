@@ -1,6 +1,19 @@
 """BondsAI - Dual Purpose AI Assistant Package."""
 
-from .job_screening import JobScreeningAssistant, JobCandidate
-
 __version__ = "1.0.0"
 __all__ = ["DatingAssistant", "Assistant", "JobScreeningAssistant", "JobCandidate"]
+
+
+def __getattr__(name):
+    """Load JobScreeningAssistant and JobCandidate on first access.
+
+    job_screening imports the server modules, and they import bondsai.config
+    at the top. Importing job_screening here would make whichever of them
+    is imported first import itself again, half initialised, through this
+    package; loading it lazily leaves bondsai.config free of that cycle.
+    """
+    if name in ("JobScreeningAssistant", "JobCandidate"):
+        from . import job_screening
+
+        return getattr(job_screening, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,269 @@
+"""Command-line tools for reprocessing stored assessment reports.
+
+    bondsai reparse                 # re-parse every report and rebuild the index (no API key needed)
+    bondsai regenerate --since 2025-01-01 --concurrency 4
+
+Both commands checkpoint the reports they finish, so an interrupted run
+resumes where it stopped when started again (--restart starts over).
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from typing import Iterable, List, Optional, Set
+
+import typer
+
+from server.AssessmentFileLoader import (
+    build_assessment_document,
+    parse_transcript,
+    reparse_assessment_file,
+    split_structured_assessment,
+    write_assessment_sidecar,
+)
+from server.AssessmentIndex import PARALLEL_PARSE_THRESHOLD, get_assessment_index
+from server.AssessmentStore import REPORT_DATE_PATTERN, get_assessment_store
+
+from .job_screening import JobScreeningAssistant
+
+app = typer.Typer(help="Reprocess stored assessment reports.", no_args_is_help=True)
+
+
+class Checkpoint:
+    """Filenames of the reports a run has finished, appended as it goes so the run can resume."""
+
+    def __init__(self, path: str, restart: bool = False):
+        """Load the reports finished by an earlier run of the same command, unless restarting."""
+        self.path = path
+        self.done: Set[str] = set()
+        if restart and os.path.exists(path):
+            os.remove(path)
+        elif os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.done = {line.strip() for line in f if line.strip()}
+
+    def add(self, filenames: Iterable[str]) -> None:
+        """Record finished reports; each batch is flushed before the next one starts."""
+        filenames = list(filenames)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(f"{filename}\n" for filename in filenames)
+        self.done.update(filenames)
+
+    def clear(self) -> None:
+        """Remove the checkpoint once the run has finished."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class ProgressReport:
+    """Prints progress, throughput and time remaining, at most once per interval."""
+
+    def __init__(self, label: str, total: int, interval: float = 2.0):
+        self.label = label
+        self.total = total
+        self.interval = interval
+        self.done = 0
+        self.failed = 0
+        self.started = time.monotonic()
+        self._last_report = 0.0
+
+    def advance(self, count: int = 1, failed: int = 0) -> None:
+        """Count finished reports, of which `failed` could not be processed."""
+        self.done += count
+        self.failed += failed
+        if time.monotonic() - self._last_report >= self.interval:
+            self.report()
+
+    def report(self) -> None:
+        """Print one progress line."""
+        self._last_report = time.monotonic()
+        elapsed = self._last_report - self.started
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        eta = _format_seconds((self.total - self.done) / rate) if rate > 0 else "?"
+        percent = 100.0 * self.done / self.total if self.total else 100.0
+        typer.echo(
+            f"{self.label}: {self.done}/{self.total} ({percent:.1f}%)  {rate:.1f} reports/s  "
+            f"ETA {eta}  failed {self.failed}"
+        )
+
+    def finish(self) -> None:
+        """Print the final line with the total time taken."""
+        self.report()
+        typer.echo(f"{self.label}: finished in {_format_seconds(time.monotonic() - self.started)}")
+
+
+@app.command()
+def reparse(
+    workers: Optional[int] = typer.Option(None, help="Parser processes (default: one per CPU; 1 parses in this process)."),
+    batch_size: int = typer.Option(256, min=1, help="Reports indexed and checkpointed together."),
+    checkpoint: Optional[str] = typer.Option(None, help="Checkpoint file (default: .reparse.checkpoint in ASSESSMENTS_DIR)."),
+    restart: bool = typer.Option(False, help="Ignore the checkpoint of an earlier run and start over."),
+) -> None:
+    """Re-parse every stored report and rewrite its sidecar and index row, e.g. after a parser change.
+
+    Reports are parsed from their text, not their sidecar, except where the
+    sidecar holds the model's own scores (score_source "model"). Index rows
+    whose report is gone are removed at the end.
+    """
+    store = get_assessment_store()
+    index = get_assessment_index()
+    progress_file = Checkpoint(checkpoint or os.path.join(store.root, ".reparse.checkpoint"), restart)
+
+    reports = list(store.iter_reports())
+    pending = [path for path in reports if os.path.basename(path) not in progress_file.done]
+    typer.echo(f"{len(reports)} reports, {len(reports) - len(pending)} already done by an earlier run")
+
+    progress = ProgressReport("reparse", len(pending))
+    pool = None
+    if len(pending) >= PARALLEL_PARSE_THRESHOLD and workers != 1:
+        pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            if pool is not None:
+                parsed = list(pool.map(reparse_assessment_file, batch, chunksize=16))
+            else:
+                parsed = [reparse_assessment_file(path) for path in batch]
+            index.add_many(zip(batch, parsed))
+            progress_file.add(os.path.basename(path) for path in batch)
+            progress.advance(len(batch), failed=parsed.count(None))
+    except KeyboardInterrupt:
+        typer.echo(f"Interrupted after {progress.done} reports; run again to resume")
+        raise typer.Exit(130)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    progress.finish()
+    # Every report on disk is indexed by now, so the sync only drops rows of reports that are gone
+    added, repointed, removed = index.sync(store, workers)
+    typer.echo(f"Index synced: {added} new reports indexed, {repointed} rows moved, {removed} stale rows removed")
+    progress_file.clear()
+
+
+@app.command()
+def regenerate(
+    since: Optional[datetime] = typer.Option(None, formats=["%Y-%m-%d"], help="Only reports from this date on."),
+    until: Optional[datetime] = typer.Option(None, formats=["%Y-%m-%d"], help="Only reports up to this date."),
+    concurrency: int = typer.Option(4, min=1, help="Reports generated at once (each is five LLM requests)."),
+    checkpoint: Optional[str] = typer.Option(None, help="Checkpoint file (default: .regenerate.checkpoint in ASSESSMENTS_DIR)."),
+    restart: bool = typer.Option(False, help="Ignore the checkpoint of an earlier run and start over."),
+    dry_run: bool = typer.Option(False, help="Only count the reports that would be regenerated."),
+) -> None:
+    """Regenerate reports from their stored interview transcripts with the current prompts.
+
+    Each report keeps its header and transcript; its assessment, JSON sidecar
+    and index row are replaced.
+    """
+    store = get_assessment_store()
+    date_from, date_to = (since.date() if since else None), (until.date() if until else None)
+    reports = [
+        path for path in store.iter_reports(date_from, date_to) if _in_date_range(path, date_from, date_to)
+    ]
+    progress_file = Checkpoint(checkpoint or os.path.join(store.root, ".regenerate.checkpoint"), restart)
+    pending = [path for path in reports if os.path.basename(path) not in progress_file.done]
+    typer.echo(f"{len(reports)} reports, {len(reports) - len(pending)} already done by an earlier run")
+    if dry_run:
+        typer.echo(f"{len(pending)} reports would be regenerated")
+        return
+
+    try:
+        failed = asyncio.run(_regenerate_all(pending, concurrency, progress_file))
+    except KeyboardInterrupt:
+        typer.echo("Interrupted; run again to resume")
+        raise typer.Exit(130)
+    if failed:
+        typer.echo(f"{failed} reports could not be regenerated; run again to retry them")
+        raise typer.Exit(1)
+    progress_file.clear()
+
+
+async def _regenerate_all(paths: List[str], concurrency: int, progress_file: Checkpoint) -> int:
+    """Regenerate reports with at most `concurrency` in progress at once.
+
+    Returns the number that failed; they are left out of the checkpoint.
+    """
+    assistant = JobScreeningAssistant()
+    index = get_assessment_index()
+    progress = ProgressReport("regenerate", len(paths))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def regenerate_one(path: str) -> None:
+        async with semaphore:
+            try:
+                await _regenerate_report(assistant, path)
+                index.index_file(path)
+            except Exception as e:
+                typer.echo(f"Error regenerating {path}: {str(e)}")
+                progress.advance(failed=1)
+                return
+        progress_file.add([os.path.basename(path)])
+        progress.advance()
+
+    try:
+        await asyncio.gather(*(regenerate_one(path) for path in paths))
+    finally:
+        # The pooled client belongs to this run's event loop, so it is closed before the loop is
+        await assistant.llm_pool.aclose()
+    progress.finish()
+    return progress.failed
+
+
+async def _regenerate_report(assistant, path: str) -> None:
+    """Replace one report's assessment, and its sidecar, with a newly generated one."""
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    header_start = content.find("Generated on:")
+    header_end = content.find("\n\n", content.find("Conversation Duration:"))
+    transcript_start = content.find("\n---\nFull Interview Transcript:")
+    messages = parse_transcript(content)
+    if -1 in (header_start, header_end, transcript_start) or not messages:
+        raise ValueError("report has no header or transcript to regenerate from")
+
+    report = await assistant.request_assessment_report(messages, summary="", summarized_count=0)
+    ai_assessment, structured = split_structured_assessment(report)
+    header = f"{content[header_start:header_end]}\n\n{ai_assessment}"
+
+    # The sidecar goes first so the report is never visible without its scores; the report is
+    # replaced in one step so readers never see it half written
+    write_assessment_sidecar(path, build_assessment_document(path, header, structured))
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(f"{content[:header_end]}\n\n{ai_assessment}\n{content[transcript_start:]}")
+    os.replace(temp_path, path)
+
+
+def _in_date_range(path: str, date_from: Optional[date], date_to: Optional[date]) -> bool:
+    """Whether a report's interview date is in the range; without a range every report is.
+
+    The store yields reports from the flat layout and the undated shard
+    whatever the range, so their filenames are checked here.
+    """
+    if date_from is None and date_to is None:
+        return True
+    match = REPORT_DATE_PATTERN.search(os.path.basename(path))
+    if match is None:
+        return False
+    try:
+        interview_date = date(*map(int, match.groups()))
+    except ValueError:
+        return False
+    return (date_from or date.min) <= interview_date <= (date_to or date.max)
+
+
+def _format_seconds(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+
+def main() -> None:
+    """Entry point of the `bondsai` command."""
+    app()
+
+
+if __name__ == "__main__":
+    main()
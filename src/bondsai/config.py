@@ -12,13 +12,77 @@ class Config:
         """Initialize configuration with environment variables."""
         load_dotenv()
         
-        # Required configuration
-        self.openai_api_key = self._get_required_env("OPENAI_API_KEY")
+        # Required wherever an LLM client is created (see require_openai_api_key), so tools that
+        # never call the model, such as `bondsai reparse`, run without it
+        self.openai_api_key = self._get_env("OPENAI_API_KEY", "")
         
         # Optional configuration with defaults
         self.openai_model = self._get_env("OPENAI_MODEL", "gpt-4o-mini")
         self.openai_temperature = float(self._get_env("OPENAI_TEMPERATURE", "0.7"))
         self.openai_max_tokens = int(self._get_env("OPENAI_MAX_TOKENS", "1000"))
+        # Empty uses the OpenAI API; point at any compatible server (e.g. tools/loadtest/fake_openai.py)
+        self.openai_base_url = self._get_env("OPENAI_BASE_URL", "")
+        
+        # Shared LLM client pool (one per process, used by every interview session)
+        self.openai_max_connections = int(self._get_env("OPENAI_MAX_CONNECTIONS", "100"))
+        self.openai_max_keepalive_connections = int(self._get_env("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+        self.openai_keepalive_expiry = float(self._get_env("OPENAI_KEEPALIVE_EXPIRY", "60"))
+        self.openai_max_in_flight = int(self._get_env("OPENAI_MAX_IN_FLIGHT", "64"))
+        self.openai_timeout = float(self._get_env("OPENAI_TIMEOUT", "60"))
+        
+        # LLM response cache: "off", "cache" (on-disk LRU), "record" or "replay" (cassette file)
+        self.llm_cache_mode = self._get_env("LLM_CACHE_MODE", "off")
+        self.llm_cache_path = self._get_env("LLM_CACHE_PATH", "llm_cache.sqlite3")
+        self.llm_cache_max_bytes = int(self._get_env("LLM_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+        self.llm_cassette_path = self._get_env("LLM_CASSETTE_PATH", "llm_cassette.jsonl")
+        
+        # Assessment storage (reports are sharded by interview date, see server.AssessmentStore)
+        self.assessments_dir = self._get_env("ASSESSMENTS_DIR", "assessments")
+        self.assessment_index_path = self._get_env(
+            "ASSESSMENT_INDEX_PATH", os.path.join(self.assessments_dir, "index.sqlite3")
+        )
+        self.assessment_cache_bytes = int(self._get_env("ASSESSMENT_CACHE_BYTES", str(32 * 1024 * 1024)))
+        
+        # Background assessment report generation
+        self.assessment_workers = int(self._get_env("ASSESSMENT_WORKERS", "2"))
+        self.assessment_max_attempts = int(self._get_env("ASSESSMENT_MAX_ATTEMPTS", "3"))
+        self.assessment_retry_delay = float(self._get_env("ASSESSMENT_RETRY_DELAY", "2"))
+        
+        # Incremental evaluation: each answer is scored while the interview goes on and the report is
+        # assembled from those scores; "false" writes the whole report in one request at the end instead
+        self.incremental_evaluation = self._get_env("INCREMENTAL_EVALUATION", "true").lower() in ("1", "true", "yes")
+        self.evaluation_max_tokens = int(self._get_env("EVALUATION_MAX_TOKENS", "350"))
+        
+        # Conversation context sent to the model (counted with tiktoken when installed)
+        self.context_token_budget = int(self._get_env("CONTEXT_TOKEN_BUDGET", "3000"))
+        self.context_keep_turns = int(self._get_env("CONTEXT_KEEP_TURNS", "4"))
+        self.context_summary_max_tokens = int(self._get_env("CONTEXT_SUMMARY_MAX_TOKENS", "250"))
+        self.context_report_token_budget = int(self._get_env("CONTEXT_REPORT_TOKEN_BUDGET", "8000"))
+        
+        # Interview sessions: "memory" keeps them in this process; "sqlite" shares them between worker
+        # processes through session_db_path (idle sessions expire, the oldest are evicted past the caps)
+        self.session_backend = self._get_env("SESSION_BACKEND", "memory")
+        self.session_db_path = self._get_env("SESSION_DB_PATH", "sessions.sqlite3")
+        self.session_ttl_seconds = float(self._get_env("SESSION_TTL_SECONDS", "7200"))
+        self.session_max_count = int(self._get_env("SESSION_MAX_COUNT", "1000"))
+        self.session_max_bytes = int(self._get_env("SESSION_MAX_BYTES", str(64 * 1024 * 1024)))
+        
+        # Request tracing: recent traces are kept for /api/traces and any slower than TRACE_SLOW_MS
+        # (0 disables) are logged; PROFILE_REQUESTS lets a request ask for a cProfile dump
+        self.trace_slow_ms = float(self._get_env("TRACE_SLOW_MS", "5000"))
+        self.trace_buffer_size = int(self._get_env("TRACE_BUFFER_SIZE", "200"))
+        self.profile_requests = self._get_env("PROFILE_REQUESTS", "false").lower() in ("1", "true", "yes")
+        self.profile_dir = self._get_env("PROFILE_DIR", "profiles")
+        
+        # Behind a reverse proxy (or under the load-test tool) applicants are identified by X-Forwarded-For
+        self.trust_proxy_headers = self._get_env("TRUST_PROXY_HEADERS", "false").lower() in ("1", "true", "yes")
+        
+        # JSON and text responses at least this large are gzip (or brotli) compressed for clients that accept it
+        self.compress_min_bytes = int(self._get_env("COMPRESS_MIN_BYTES", "1024"))
+    
+    def require_openai_api_key(self) -> str:
+        """Return the OpenAI API key, failing if it is not set."""
+        return self._get_required_env("OPENAI_API_KEY")
     
     def _get_required_env(self, key: str) -> str:
         """Get a required environment variable."""
@@ -41,6 +105,36 @@ class Config:
         
         if self.openai_max_tokens < 1:
             raise ValueError("OPENAI_MAX_TOKENS must be greater than 0")
+        
+        if self.openai_max_connections < 1 or self.openai_max_in_flight < 1:
+            raise ValueError("OPENAI_MAX_CONNECTIONS and OPENAI_MAX_IN_FLIGHT must be greater than 0")
+        
+        if self.llm_cache_mode not in ("off", "cache", "record", "replay"):
+            raise ValueError("LLM_CACHE_MODE must be one of 'off', 'cache', 'record' or 'replay'")
+        
+        if self.assessment_workers < 1 or self.assessment_max_attempts < 1:
+            raise ValueError("ASSESSMENT_WORKERS and ASSESSMENT_MAX_ATTEMPTS must be greater than 0")
+        
+        if self.evaluation_max_tokens < 1:
+            raise ValueError("EVALUATION_MAX_TOKENS must be greater than 0")
+        
+        if self.context_token_budget < 1 or self.context_keep_turns < 1 or self.context_summary_max_tokens < 1:
+            raise ValueError("CONTEXT_TOKEN_BUDGET, CONTEXT_KEEP_TURNS and CONTEXT_SUMMARY_MAX_TOKENS must be greater than 0")
+        
+        if self.session_backend not in ("memory", "sqlite"):
+            raise ValueError("SESSION_BACKEND must be either 'memory' or 'sqlite'")
+        
+        if self.session_ttl_seconds <= 0 or self.session_max_count < 1 or self.session_max_bytes < 1:
+            raise ValueError("SESSION_TTL_SECONDS, SESSION_MAX_COUNT and SESSION_MAX_BYTES must be greater than 0")
+        
+        if self.trace_slow_ms < 0 or self.trace_buffer_size < 1:
+            raise ValueError("TRACE_SLOW_MS cannot be negative and TRACE_BUFFER_SIZE must be greater than 0")
+        
+        if self.compress_min_bytes < 0:
+            raise ValueError("COMPRESS_MIN_BYTES cannot be negative")
+        
+        if self.openai_max_keepalive_connections > self.openai_max_connections:
+            raise ValueError("OPENAI_MAX_KEEPALIVE_CONNECTIONS cannot exceed OPENAI_MAX_CONNECTIONS")
 
 
 # Global configuration instance
@@ -0,0 +1,169 @@
+"""Token-budgeted conversation context with a rolling summary of older turns."""
+
+from typing import Any, Dict, List, Optional
+
+from .config import config
+from server.ProcessWide import process_wide
+
+try:
+    import tiktoken
+except ImportError:  # Optional: fall back to a character-based estimate
+    tiktoken = None
+
+
+# Tokens the chat format adds around every message
+MESSAGE_TOKEN_OVERHEAD = 4
+
+SUMMARY_PROMPT = """You are keeping notes on a mock job interview so the interviewer can continue it without the full transcript.
+
+Notes so far:
+{summary}
+
+New exchanges:
+{exchanges}
+
+Rewrite the notes to cover everything above in under {max_words} words. Keep the candidate's name, background, target role, the questions already asked, and the key facts, examples and figures from their answers. Write plain sentences with no headings."""
+
+
+class ConversationContext:
+    """Decides which parts of a conversation are sent to the model on each turn.
+
+    The last keep_turns exchanges are sent verbatim. Older exchanges are
+    folded into a rolling summary by a side request that runs alongside the
+    turn's own request, so the prompt stops growing after a few turns
+    instead of resending the whole history. Whatever is sent is held to
+    token_budget, dropping the oldest verbatim messages first.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        token_budget: int = 3000,
+        keep_turns: int = 4,
+        summary_max_tokens: int = 250,
+    ):
+        """Store context settings.
+
+        Args:
+            model: Model name, used to pick the tokenizer when tiktoken is installed.
+            token_budget: Most prompt tokens to send per chat request.
+            keep_turns: Most recent exchanges (user + assistant) kept verbatim.
+            summary_max_tokens: Length limit for the rolling summary.
+        """
+        self.token_budget = token_budget
+        self.keep_turns = keep_turns
+        self.summary_max_tokens = summary_max_tokens
+        self._encoding = _load_encoding(model)
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens locally; about 4 characters per token without tiktoken."""
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        return (len(text) + 3) // 4
+
+    def count_message_tokens(self, messages: List[Dict[str, str]]) -> int:
+        """Count the prompt tokens a list of chat messages will use."""
+        return sum(self.count_tokens(m["content"]) + MESSAGE_TOKEN_OVERHEAD for m in messages)
+
+    def build_messages(
+        self,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        summary: str = "",
+        summarized_count: int = 0,
+    ) -> List[Dict[str, str]]:
+        """Assemble a chat request: system prompt, summary, then as many recent messages as fit.
+
+        Messages before summarized_count are covered by the summary. The
+        newest message is always sent, even if it alone exceeds the budget.
+        """
+        request = [{"role": "system", "content": system_prompt}]
+        if summary:
+            request.append({"role": "system", "content": f"Summary of the interview so far:\n{summary}"})
+
+        remaining = self.token_budget - self.count_message_tokens(request)
+        recent: List[Dict[str, str]] = []
+        for message in reversed(messages[summarized_count:]):
+            tokens = self.count_message_tokens([message])
+            if recent and tokens > remaining:
+                break
+            recent.append(message)
+            remaining -= tokens
+
+        request.extend(reversed(recent))
+        return request
+
+    def fold_end(self, messages: List[Dict[str, str]], summarized_count: int) -> Optional[int]:
+        """Return the index up to which messages should be folded into the summary, if any.
+
+        Called once the user's new message has been added, so the verbatim
+        window is that message plus the keep_turns exchanges before it.
+        Folding waits until at least two exchanges have aged out of the
+        window, so the summary is refreshed every other turn rather than on
+        every turn.
+        """
+        end = len(messages) - 1 - 2 * self.keep_turns
+        return end if end - summarized_count >= 4 else None
+
+    def summary_request(self, summary: str, messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Build the side request that folds messages into the summary."""
+        prompt = SUMMARY_PROMPT.format(
+            summary=summary or "(none yet)",
+            exchanges="\n".join(f"{m['role'].upper()}: {m['content']}" for m in messages),
+            max_words=self.summary_max_tokens * 3 // 4,
+        )
+        return [{"role": "user", "content": prompt}]
+
+    def format_transcript(
+        self,
+        messages: List[Dict[str, str]],
+        summary: str = "",
+        summarized_count: int = 0,
+        token_budget: Optional[int] = None,
+    ) -> str:
+        """Render a transcript for a single prompt, within token_budget if given.
+
+        The full transcript is used when it fits. Otherwise the summarized
+        part is replaced by the summary and the oldest remaining lines are
+        dropped until the rest fits.
+        """
+        lines = [f"{m['role'].upper()}: {m['content']}" for m in messages]
+        if token_budget is None or self.count_tokens("\n".join(lines)) <= token_budget:
+            return "\n".join(lines)
+
+        head = [f"SUMMARY OF EARLIER EXCHANGES: {summary}"] if summary else []
+        remaining = token_budget - self.count_tokens("\n".join(head))
+        kept: List[str] = []
+        for line in reversed(lines[summarized_count:]):
+            tokens = self.count_tokens(line) + 1
+            if kept and tokens > remaining:
+                break
+            kept.append(line)
+            remaining -= tokens
+        return "\n".join(head + list(reversed(kept)))
+
+
+def _load_encoding(model: str) -> Any:
+    """Return a tiktoken encoding for the model, or None when tiktoken is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # Encodings are downloaded on first use; estimate rather than fail offline
+        print(f"tiktoken unavailable, estimating token counts: {str(e)}")
+        return None
+
+
+@process_wide
+def get_conversation_context() -> ConversationContext:
+    """Return the process-wide conversation context, creating it from config on first use."""
+    return ConversationContext(
+        model=config.openai_model,
+        token_budget=config.context_token_budget,
+        keep_turns=config.context_keep_turns,
+        summary_max_tokens=config.context_summary_max_tokens,
+    )
@@ -0,0 +1,150 @@
+"""Incremental evaluation of interview answers, merged into the assessment report at the end."""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+from .config import config
+from .report import REPORT_TITLE, SECTION_TITLES, SKILL_LABELS, SKILL_SECTIONS
+from server.AssessmentFileLoader import valid_score
+from server.ProcessWide import process_wide
+
+
+# Insight lists kept on JobCandidate and the most items kept in each; past that the oldest are dropped
+INSIGHT_KEYS = ("strengths", "weaknesses", "recommendations", "cultural_alignment", "technical_gaps")
+MAX_INSIGHTS = 5
+
+# Most feedback sentences kept per skill; the latest answers are the most representative
+MAX_NOTES_PER_SKILL = 3
+
+UNDEMONSTRATED_NOTE = "This did not come up in your answers; prepare a short example that shows it for your next interview."
+
+CLOSING = """This was a practice session, and improvement comes with repetition. Every interview you practise builds skills you will use in real ones and makes you more confident. Review this feedback and focus on the recommended steps before your next practice."""
+
+EVALUATION_PROMPT = """You are scoring one answer from a mock job interview with a university student, as part of a running assessment of the whole interview.
+
+Question: {question}
+Answer: {answer}
+
+Score only the skills this answer gives real evidence for, from 0 to 100, and leave the others out. The skills are:
+{skills}
+
+Respond with only a JSON object of this shape:
+{{"scores": {{"<skill>": <score>}}, "feedback": {{"<skill>": "<one sentence: what the answer showed and how to improve it>"}}, "strengths": [], "weaknesses": [], "recommendations": [], "cultural_alignment": [], "technical_gaps": []}}
+
+Each list holds at most two short items drawn from this answer alone; leave a list empty when the answer shows nothing for it. Recommendations are concrete practice steps."""
+
+
+class AnswerEvaluator:
+    """Scores interview answers one at a time and assembles the report from the results.
+
+    Each answer is scored while the interview goes on, against the skills it
+    gives evidence for, and the scores, feedback and insights are merged into
+    the JobCandidate. When the interview ends the report is built from what
+    has been merged, so no request has to read the whole transcript while
+    the student waits for their results. A skill's score is the mean of the
+    scores its answers were given.
+    """
+
+    def __init__(self, max_tokens: int = 350):
+        """Store evaluation settings.
+
+        Args:
+            max_tokens: Length limit for the evaluation of one answer.
+        """
+        self.max_tokens = max_tokens
+
+    def evaluation_request(self, question: str, answer: str) -> List[Dict[str, str]]:
+        """Build the request that scores one answer to one question."""
+        skills = "\n".join(
+            f"- {skill} ({label})" for labels in SKILL_LABELS.values() for skill, label in labels.items()
+        )
+        prompt = EVALUATION_PROMPT.format(question=question or "(opening)", answer=answer, skills=skills)
+        return [{"role": "user", "content": prompt}]
+
+    def parse(self, text: str) -> Dict[str, Any]:
+        """Read the model's evaluation, dropping unknown skills and invalid scores.
+
+        Raises ValueError if the reply holds no JSON object.
+        """
+        start, end = text.find("{"), text.rfind("}")
+        evaluation = json.loads(text[start:end + 1]) if start != -1 else None
+        if not isinstance(evaluation, dict):
+            raise ValueError(f"Evaluation is not a JSON object: {text[:80]!r}")
+
+        scores = evaluation.get("scores") if isinstance(evaluation.get("scores"), dict) else {}
+        feedback = evaluation.get("feedback") if isinstance(evaluation.get("feedback"), dict) else {}
+        parsed = {"scores": {}, "feedback": {}}
+        for skill, score in scores.items():
+            score = valid_score(score)
+            if skill in SKILL_SECTIONS and score is not None:
+                parsed["scores"][skill] = score
+                if isinstance(feedback.get(skill), str) and feedback[skill].strip():
+                    parsed["feedback"][skill] = feedback[skill].strip()
+        for key in INSIGHT_KEYS:
+            items = evaluation.get(key)
+            parsed[key] = [str(item).strip() for item in items if str(item).strip()] if isinstance(items, list) else []
+        return parsed
+
+    def merge(self, candidate: Any, evaluation: Dict[str, Any], answer_index: int) -> None:
+        """Fold one answer's evaluation into the candidate's evidence, scores and insights."""
+        for skill, score in evaluation["scores"].items():
+            evidence = candidate.evidence.setdefault(skill, {"scores": [], "notes": []})
+            evidence["scores"].append(score)
+            if skill in evaluation["feedback"] and evaluation["feedback"][skill] not in evidence["notes"]:
+                evidence["notes"] = (evidence["notes"] + [evaluation["feedback"][skill]])[-MAX_NOTES_PER_SKILL:]
+            candidate.scores[SKILL_SECTIONS[skill]][skill] = round(sum(evidence["scores"]) / len(evidence["scores"]))
+
+        for key in INSIGHT_KEYS:
+            items = candidate.insights.setdefault(key, [])
+            for item in evaluation[key]:
+                if item.lower() not in (existing.lower() for existing in items):
+                    items.append(item)
+            del items[:-MAX_INSIGHTS]
+
+        candidate.evaluated_answers.append(answer_index)
+
+    def build_report(self, candidate: Any) -> Tuple[str, Dict[str, Any]]:
+        """Assemble the report from the merged evaluations.
+
+        Skills no answer gave evidence for take the mean score of the rest of
+        their section (or of all scored skills), so one missing topic does not
+        sink the final score. Returns the markdown in the layout the report
+        parser expects and the same scores as structured data.
+        """
+        scored = [score for evidence in candidate.evidence.values() for score in evidence["scores"]]
+        overall_mean = round(sum(scored) / len(scored)) if scored else 0
+        for section, skills in SKILL_LABELS.items():
+            section_scores = [candidate.scores[section][skill] for skill in skills if skill in candidate.evidence]
+            fallback = round(sum(section_scores) / len(section_scores)) if section_scores else overall_mean
+            for skill in skills:
+                if skill not in candidate.evidence:
+                    candidate.scores[section][skill] = fallback
+
+        final_score = candidate.calculate_final_score()
+        lines = [REPORT_TITLE, ""]
+        for section, skills in SKILL_LABELS.items():
+            lines.append(f"#### {SECTION_TITLES[section]}")
+            for skill, label in skills.items():
+                notes = candidate.evidence.get(skill, {}).get("notes") or [UNDEMONSTRATED_NOTE]
+                lines.append(f"- **{label}**: {candidate.scores[section][skill]}")
+                lines.append(f"  - {' '.join(notes)}")
+            lines.append("")
+
+        insights = {key: list(candidate.insights.get(key, [])) for key in ("strengths", "weaknesses", "recommendations")}
+        lines += [f"#### {SECTION_TITLES['overall']}", f"- **Final Score**: {final_score}"]
+        for key, label in (("strengths", "Key Strengths"), ("weaknesses", "Areas for Improvement"),
+                           ("recommendations", "Recommended Future Steps")):
+            lines.append(f"- **{label}**:")
+            lines.extend(f"  - {item}" for item in insights[key])
+        lines += ["", CLOSING]
+
+        structured = {section: dict(candidate.scores[section]) for section in SKILL_LABELS}
+        structured["final_score"] = final_score
+        structured["insights"] = insights
+        return "\n".join(lines), structured
+
+
+@process_wide
+def get_answer_evaluator() -> AnswerEvaluator:
+    """Return the process-wide answer evaluator, creating it from config on first use."""
+    return AnswerEvaluator(max_tokens=config.evaluation_max_tokens)
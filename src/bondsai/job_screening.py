@@ -1,18 +1,60 @@
 """Student Interview Coach for Early-Career Roles."""
 
 import asyncio
-import json
+import contextvars
 import os
+import uuid
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from openai import AsyncOpenAI
+from typing import List, Dict, Any, AsyncIterator, Optional
 from .config import config
+from .context import ConversationContext, get_conversation_context
+from .evaluation import AnswerEvaluator, get_answer_evaluator
+from .llm_client import LLMClientPool, get_llm_pool
+from .report import section_requests, stitch_report
 from server.DeltaTimeRecorder import DeltaTimeRecorder
+from server.AssessmentJobQueue import AssessmentJobQueue, get_assessment_queue
+from server.AssessmentIndex import get_assessment_index
+from server.AssessmentStore import get_assessment_store
+from server.Tracing import span
+from server.AssessmentFileLoader import (
+    build_assessment_document,
+    split_structured_assessment,
+    write_assessment_sidecar,
+)
 import re
 
+# Common ways students introduce themselves, tried in order on the first message
+NAME_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"my name is ([A-Za-z][a-zA-Z\-']*(?: [A-Za-z][a-zA-Z\-']*){0,2})",
+        r"i am ([A-Za-z][a-zA-Z\-']*(?: [A-Za-z][a-zA-Z\-']*){0,2})",
+        r"i'm ([A-Za-z][a-zA-Z\-']*(?: [A-Za-z][a-zA-Z\-']*){0,2})",
+        r"this is ([A-Za-z][a-zA-Z\-']*(?: [A-Za-z][a-zA-Z\-']*){0,2})",
+        r"it's ([A-Za-z][a-zA-Z\-']*(?: [A-Za-z][a-zA-Z\-']*){0,2})",
+        r"([A-Za-z][a-zA-Z\-']* [A-Za-z][a-zA-Z\-']*) here",
+    )
+]
+
+
 class JobCandidate:
     """Represents a job candidate with assessment data."""
     
+    __slots__ = (
+        "name",
+        "experience",
+        "education",
+        "skills",
+        "projects",
+        "conversation_count",
+        "conversation_duration",
+        "conversation_timer",
+        "scores",
+        "insights",
+        "evidence",
+        "evaluated_answers",
+    )
+    
     def __init__(self):
         """Initialize candidate profile."""
         self.name = ""
@@ -61,6 +103,38 @@ class JobCandidate:
             "cultural_alignment": [],
             "technical_gaps": []
         }
+        
+        # Scores and feedback notes per skill from the answers evaluated so far (see AnswerEvaluator),
+        # and the message indices of those answers
+        self.evidence = {}
+        self.evaluated_answers = []
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the candidate so a session can be stored outside this process."""
+        return {
+            "name": self.name,
+            "experience": self.experience,
+            "education": self.education,
+            "skills": self.skills,
+            "projects": self.projects,
+            "conversation_count": self.conversation_count,
+            "conversation_duration": self.conversation_duration,
+            "conversation_timer": self.conversation_timer.to_dict(),
+            "scores": self.scores,
+            "insights": self.insights,
+            "evidence": self.evidence,
+            "evaluated_answers": self.evaluated_answers,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobCandidate":
+        """Rebuild a candidate serialized by to_dict()."""
+        candidate = cls()
+        for key, value in data.items():
+            if key == "conversation_timer":
+                value = DeltaTimeRecorder.from_dict(value)
+            setattr(candidate, key, value)
+        return candidate
     
     def get_filename(self) -> str:
         """Generate filename for candidate assessment."""
@@ -100,21 +174,34 @@ class JobCandidate:
 
 
 class JobScreeningAssistant:
-    """AI assistant for screening quant trading candidates."""
+    """AI assistant for screening quant trading candidates.
+
+    The prompt text is the same for every session, so it is defined once on
+    the class and shared instead of being copied into each instance.
+    """
     
-    def __init__(self):
-        """Initialize the job screening assistant."""
-        self.client = AsyncOpenAI(api_key=config.openai_api_key)
-        self.messages: List[Dict[str, str]] = []
-        self.model = config.openai_model
-        self.temperature = config.openai_temperature
-        self.max_tokens = config.openai_max_tokens
-        self.candidate = JobCandidate()
-        self.is_first_message = True
-        self.ready_for_assessment = False
-        
-        # Generic early-career context for students
-        self.job_description = """Student & Graduate Interview Practice Context
+    __slots__ = (
+        "conversation_id",
+        "llm_pool",
+        "assessment_queue",
+        "assessment_job_id",
+        "messages",
+        "model",
+        "temperature",
+        "max_tokens",
+        "candidate",
+        "is_first_message",
+        "ready_for_assessment",
+        "context",
+        "summary",
+        "summarized_count",
+        "evaluator",
+        "evaluations",
+        "background_evaluations",
+    )
+    
+    # Generic early-career context for students
+    job_description = """Student & Graduate Interview Practice Context
 
 You are helping university students and recent graduates prepare for internships, graduate roles and part-time jobs across fields (e.g. software engineering, data science, consulting, finance, marketing, retail, etc.).
 
@@ -127,8 +214,8 @@ Most students have limited experience. Their main material comes from:
 Your goal is to help them practise answering behavioural, motivational and basic role-related questions in a way that would make sense to a real recruiter, without pretending to be one.
 """
 
-        # System prompt for formal mock interview (not coaching during interview)
-        self.system_prompt = f"""You are a professional interviewer conducting a formal mock interview for a student candidate.
+    # System prompt for formal mock interview (not coaching during interview)
+    system_prompt = f"""You are a professional interviewer conducting a formal mock interview for a student candidate.
 
 **Your Role:**
 - Act as a real interviewer would: professional, focused, and evaluative
@@ -163,10 +250,87 @@ Your goal is to help them practise answering behavioural, motivational and basic
 - All teaching and feedback will come in the assessment report after the interview
 
 **Context:**
-{self.job_description}
+{job_description}
 
 Start with: "Hello, thank you for coming in today. Could you start by telling me a bit about yourself?" """
-
+    
+    def __init__(
+        self,
+        llm_pool: Optional[LLMClientPool] = None,
+        assessment_queue: Optional[AssessmentJobQueue] = None,
+        context: Optional[ConversationContext] = None,
+        evaluator: Optional[AnswerEvaluator] = None,
+        background_evaluations: bool = False,
+    ):
+        """Initialize the job screening assistant.
+
+        Args:
+            llm_pool: Shared LLM client pool; defaults to the process-wide pool.
+            assessment_queue: Background queue for assessment reports; defaults
+                to the process-wide queue.
+            context: Token budget and summarization settings; defaults to the
+                process-wide context.
+            evaluator: Scores each answer as it arrives; defaults to the
+                process-wide evaluator, or none when INCREMENTAL_EVALUATION is off.
+            background_evaluations: Let answer evaluations run on past the turn
+                that started them. Only safe when this object outlives the turn,
+                as in the in-memory session store; otherwise each turn waits for
+                its evaluations before the session is saved.
+        """
+        self.conversation_id = uuid.uuid4().hex
+        self.llm_pool = llm_pool or get_llm_pool()
+        self.assessment_queue = assessment_queue or get_assessment_queue()
+        self.assessment_job_id: Optional[str] = None
+        self.messages: List[Dict[str, str]] = []
+        self.model = config.openai_model
+        self.temperature = config.openai_temperature
+        self.max_tokens = config.openai_max_tokens
+        self.candidate = JobCandidate()
+        self.is_first_message = True
+        self.ready_for_assessment = False
+        self.context = context or get_conversation_context()
+        
+        # Rolling summary of messages[:summarized_count], sent in place of those messages
+        self.summary = ""
+        self.summarized_count = 0
+        
+        # In-flight answer evaluations by message index; they belong to this process, so are not serialized
+        self.evaluator = evaluator or (get_answer_evaluator() if config.incremental_evaluation else None)
+        self.evaluations: Dict[int, "asyncio.Task[None]"] = {}
+        self.background_evaluations = background_evaluations
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the conversation state (not the shared clients) for a session backend."""
+        return {
+            "conversation_id": self.conversation_id,
+            "assessment_job_id": self.assessment_job_id,
+            "messages": self.messages,
+            "candidate": self.candidate.to_dict(),
+            "is_first_message": self.is_first_message,
+            "ready_for_assessment": self.ready_for_assessment,
+            "summary": self.summary,
+            "summarized_count": self.summarized_count,
+        }
+    
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        llm_pool: Optional[LLMClientPool] = None,
+        assessment_queue: Optional[AssessmentJobQueue] = None,
+    ) -> "JobScreeningAssistant":
+        """Rebuild an assistant serialized by to_dict(), attached to this process's shared clients."""
+        assistant = cls(llm_pool, assessment_queue)
+        assistant.conversation_id = data["conversation_id"]
+        assistant.assessment_job_id = data["assessment_job_id"]
+        assistant.messages = data["messages"]
+        assistant.candidate = JobCandidate.from_dict(data["candidate"])
+        assistant.is_first_message = data["is_first_message"]
+        assistant.ready_for_assessment = data["ready_for_assessment"]
+        assistant.summary = data.get("summary", "")
+        assistant.summarized_count = data.get("summarized_count", 0)
+        return assistant
+    
     def add_message(self, role: str, content: str) -> None:
         """Add a message to the conversation history."""
         self.messages.append({"role": role, "content": content})
@@ -179,233 +343,210 @@ Start with: "Hello, thank you for coming in today. Could you start by telling me
         self.candidate = JobCandidate()
         self.is_first_message = True
         self.ready_for_assessment = False
+        self.assessment_job_id = None
+        self.summary = ""
+        self.summarized_count = 0
+        self.evaluations = {}
     
-    async def generate_assessment_report(self) -> str:
+    async def generate_assessment_report(self, messages: Optional[List[Dict[str, str]]] = None) -> str:
         """Generate comprehensive assessment report using AI for a student practice session."""
         try:
-            assessment_prompt = f"""You are a supportive interview coach providing detailed feedback to a university student after their practice interview. This was a MOCK INTERVIEW - the student just completed a formal practice session, and now you need to provide comprehensive, student-friendly coaching feedback.
-
-**Important Context:**
-- During the interview, you acted as a formal interviewer (no coaching was given)
-- Now, provide ALL the teaching, coaching, and guidance in this feedback report
-- Be encouraging, specific, and actionable
-- Help them understand what worked, what didn't, and how to improve
-
-Conversation from the mock interview:
-{chr(10).join([f"{msg['role'].upper()}: {msg['content']}" for msg in self.messages])}
-
-Provide a comprehensive, student-friendly assessment with **all** of the following sections (use exact headings for parsing):
-
-1. **Technical Skills Assessment** (Score 0-100 for each, with detailed 2-3 sentence feedback):
-   - Quantitative Reasoning (or Analytical Thinking if non-quant role)
-   - Programming Skills (or relevant hard skills for their field)
-   - Market / Industry Knowledge (adapt to their field)
-   - Data Analysis (or Working With Information if non-technical)
-   
-   For each skill: Give the score, what they did well, specific gaps you noticed, and concrete steps to improve. Include examples from their answers.
-
-2. **Behavioral Traits Assessment** (Score 0-100 for each, with detailed 2-3 sentence feedback):
-   - Problem-solving
-   - Teamwork
-   - Initiative
-   - Resilience
-   - Adaptability
-   
-   For each trait: Give the score, evidence from their answers (quote specific examples), what worked well, what was missing, and concrete ways to strengthen. Teach them how to structure better answers using STAR framework.
-
-3. **Cultural Fit Assessment** (Score 0-100 for each, with detailed 2-3 sentence feedback):
-   - Collaborative Thinking
-   - Continuous Learning
-   - Challenge-seeking
-   - Entrepreneurial Spirit
-   
-   For each: Give the score, how they demonstrated it (or didn't) with examples, and specific ways to better showcase these qualities in future interviews.
-
-4. **Soft Skills Assessment** (Score 0-100 for each, with detailed 2-3 sentence feedback):
-   - Communication (clarity, structure, conciseness)
-   - Decision-making (how they approach choices)
-   - Time Management (organization, prioritization)
-   - Leadership (influence, taking charge)
-   
-   For each: Give the score, specific examples from their answers (what was clear/unclear), and actionable tips for improvement. Include coaching on common student pitfalls like rambling, being too generic, or not quantifying impact.
-
-5. **Overall Assessment**:
-   - Final Score (0-100) representing current interview readiness
-   - Key Strengths: 3-5 bullet points highlighting what they're doing well, with specific examples from their answers
-   - Areas for Improvement: 3-5 bullet points with SPECIFIC weaknesses observed, WHY each matters for real interviews, and HOW to fix it with concrete steps (frame as learning opportunities)
-   - Recommended Future Steps: 5-7 specific, actionable practice actions (e.g., "Prepare 3 STAR stories about teamwork - practice saying them out loud", "Practice quantifying outcomes for 2 projects - add numbers and metrics", "Write a 60-second elevator pitch and time yourself", "Practice answering 'Tell me about yourself' in under 2 minutes")
-   
-   Include a brief coaching section on common student interview mistakes you noticed and how to avoid them.
-
-Format EXACTLY as follows (use these exact markdown headings):
-
-### Student Interview Practice Assessment
-
-#### 1. Technical Skills Assessment
-- **Quantitative Reasoning**: (score)
-  - (2-3 sentences: what they did well, specific gaps, how to improve)
-- **Programming Skills**: (score)
-  - (2-3 sentences: what they did well, specific gaps, how to improve)
-- **Market Knowledge**: (score)
-  - (2-3 sentences: what they did well, specific gaps, how to improve)
-- **Data Analysis**: (score)
-  - (2-3 sentences: what they did well, specific gaps, how to improve)
-
-#### 2. Behavioral Traits Assessment
-- **Problem-solving**: (score)
-  - (2-3 sentences: evidence from answers, what worked, what to improve)
-- **Teamwork**: (score)
-  - (2-3 sentences: evidence from answers, what worked, what to improve)
-- **Initiative**: (score)
-  - (2-3 sentences: evidence from answers, what worked, what to improve)
-- **Resilience**: (score)
-  - (2-3 sentences: evidence from answers, what worked, what to improve)
-- **Adaptability**: (score)
-  - (2-3 sentences: evidence from answers, what worked, what to improve)
-
-#### 3. Cultural Fit Assessment
-- **Collaborative Thinking**: (score)
-  - (2-3 sentences: how they showed this, how to improve)
-- **Continuous Learning**: (score)
-  - (2-3 sentences: how they showed this, how to improve)
-- **Challenge-seeking**: (score)
-  - (2-3 sentences: how they showed this, how to improve)
-- **Entrepreneurial Spirit**: (score)
-  - (2-3 sentences: how they showed this, how to improve)
-
-#### 4. Soft Skills Assessment
-- **Communication**: (score)
-  - (2-3 sentences: clarity/structure examples, specific tips to improve)
-- **Decision-making**: (score)
-  - (2-3 sentences: examples from answers, how to strengthen)
-- **Time Management**: (score)
-  - (2-3 sentences: examples from answers, how to strengthen)
-- **Leadership**: (score)
-  - (2-3 sentences: examples from answers, how to strengthen)
-
-#### 5. Overall Assessment
-- **Final Score**: (score)
-- **Key Strengths**:
-  - (bullet point 1)
-  - (bullet point 2)
-  - (bullet point 3)
-- **Areas for Improvement**:
-  - (bullet point 1 - specific weakness with why it matters and how to fix)
-  - (bullet point 2 - specific weakness with why it matters and how to fix)
-  - (bullet point 3 - specific weakness with why it matters and how to fix)
-- **Recommended Future Steps**:
-  - (actionable step 1)
-  - (actionable step 2)
-  - (actionable step 3)
-  - (actionable step 4)
-  - (actionable step 5)
-
-End with 2-3 encouraging sentences emphasizing that:
-- This was practice and improvement comes with repetition
-- They're building valuable interview skills
-- Each practice session makes them more confident and prepared
-- They should review this feedback and focus on the recommended steps before their next practice
-"""
-
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": assessment_prompt}],
-                temperature=0.3,
-                max_tokens=1000,
-            )
-            
-            return response.choices[0].message.content
-            
+            return await self.request_assessment_report(messages)
         except Exception as e:
             return f"Error generating assessment: {str(e)}"
     
+    async def request_assessment_report(
+        self,
+        messages: Optional[List[Dict[str, str]]] = None,
+        summary: Optional[str] = None,
+        summarized_count: Optional[int] = None,
+    ) -> str:
+        """Ask the model for the assessment report, one section per request, raising if any fails.
+
+        Args:
+            messages: Transcript to assess; defaults to the current conversation.
+            summary: Summary of messages[:summarized_count], used only when the
+                transcript is over the report token budget; defaults to the
+                current conversation's.
+            summarized_count: Number of messages the summary covers.
+        """
+        if messages is None:
+            messages = self.messages
+        transcript = self.context.format_transcript(
+            messages,
+            self.summary if summary is None else summary,
+            self.summarized_count if summarized_count is None else summarized_count,
+            token_budget=config.context_report_token_budget,
+        )
+        
+        # Every section is its own completion with its own token budget, so the report takes about
+        # as long as its longest section and no section is cut short by a shared limit
+        requests = section_requests(transcript)
+        with span("assessment.report", sections=len(requests)):
+            replies = await asyncio.gather(*(
+                self.llm_pool.create_chat_completion(
+                    call_type="assessment",
+                    model=self.model,
+                    messages=section_messages,
+                    temperature=0.3,
+                    max_tokens=max_tokens,
+                )
+                for _, section_messages, max_tokens in requests
+            ))
+        
+        return stitch_report({
+            section: response.choices[0].message.content
+            for (section, _, _), response in zip(requests, replies)
+        })
+    
     async def save_assessment_to_file(self) -> str:
         """Save the assessment report to a text file."""
         try:
-            # Ensure assessments directory exists
-            assessments_dir = "assessments"
-            if not os.path.exists(assessments_dir):
-                os.makedirs(assessments_dir)
-            
-            # Generate filename
-            filename = self.candidate.get_filename()
-            filepath = os.path.join(assessments_dir, filename)
-            
-            # Generate AI assessment
-            ai_assessment = await self.generate_assessment_report()
-            
-            # Create assessment content
-            assessment_content = f"""STUDENT INTERVIEW PRACTICE ASSESSMENT
-Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-Interview Length: {self.candidate.conversation_count} exchanges
-Conversation Duration: {self.candidate.conversation_duration}
+            return await self.write_assessment_file()
+        except Exception as e:
+            return f"Error saving assessment: {str(e)}"
+    
+    async def write_assessment_file(
+        self,
+        messages: Optional[List[Dict[str, str]]] = None,
+        conversation_count: Optional[int] = None,
+        conversation_duration: Optional[str] = None,
+        summary: Optional[str] = None,
+        summarized_count: Optional[int] = None,
+    ) -> str:
+        """Generate the assessment report and write it to a text file, raising on failure.
+
+        The optional arguments let a background job assess a snapshot of the
+        interview taken when it ended, rather than whatever state the session
+        is in by the time the job runs.
+
+        Returns:
+            Path of the written assessment file.
+        """
+        messages = self.messages if messages is None else messages
+        if conversation_count is None:
+            conversation_count = self.candidate.conversation_count
+        if conversation_duration is None:
+            conversation_duration = self.candidate.conversation_duration
+        
+        # Generate filename; the store places it in its date shard
+        filename = self.candidate.get_filename()
+        filepath = get_assessment_store().new_path(filename)
+        
+        # Assemble the report from the answers scored during the interview; the whole transcript is
+        # only sent for a full report when incremental evaluation is off or an answer could not be scored
+        if await self._complete_evaluations(messages):
+            ai_assessment, structured = self.evaluator.build_report(self.candidate)
+        else:
+            # Generate AI assessment; the trailing JSON block is kept out of the text report
+            report = await self.request_assessment_report(messages, summary, summarized_count)
+            ai_assessment, structured = split_structured_assessment(report)
+        
+        # Create assessment content
+        header = f"""Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Interview Length: {conversation_count} exchanges
+Conversation Duration: {conversation_duration}
 
-{ai_assessment}
+{ai_assessment}"""
+        assessment_content = f"""STUDENT INTERVIEW PRACTICE ASSESSMENT
+{header}
 
 ---
 Full Interview Transcript:
 """
-            
-            # Add conversation history
-            for i, message in enumerate(self.messages, 1):
-                assessment_content += f"\n{i}. {message['role'].upper()}: {message['content']}\n"
+        
+        # Add conversation history
+        for i, message in enumerate(messages, 1):
+            assessment_content += f"\n{i}. {message['role'].upper()}: {message['content']}\n"
+        
+        with span("assessment.save", file=filename):
+            # The sidecar goes first so the report is never visible without its scores
+            write_assessment_sidecar(filepath, build_assessment_document(filepath, header, structured))
             
             # Write to file
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(assessment_content)
-            
-            return filepath
-            
+        
+        # Index the report for the recruiter listing; a miss here is repaired by the next sync
+        try:
+            with span("assessment.index"):
+                get_assessment_index().index_file(filepath)
         except Exception as e:
-            return f"Error saving assessment: {str(e)}"
+            print(f"Error indexing assessment {filepath}: {str(e)}")
+        
+        return filepath
+    
+    def queue_assessment(self) -> str:
+        """Hand report generation for the finished interview to the background job queue.
+
+        Must be called from the event loop. Returns the job ID.
+        """
+        messages = list(self.messages)
+        conversation_count = self.candidate.conversation_count
+        conversation_duration = self.candidate.conversation_duration
+        summary, summarized_count = self.summary, self.summarized_count
+        self.assessment_job_id = self.assessment_queue.submit(
+            lambda: self.write_assessment_file(
+                messages, conversation_count, conversation_duration, summary, summarized_count
+            )
+        )
+        return self.assessment_job_id
     
     async def extract_candidate_name(self) -> None:
         """Robustly extract candidate name from the first user message, fallback to OpenAI if needed."""
+        first_msg = self._first_user_message()
+        if first_msg is None:
+            return
+        extracted_name = self._match_candidate_name(first_msg)
+        if not extracted_name:
+            extracted_name = await self._ask_candidate_name(first_msg)
+        self._set_candidate_name(extracted_name)
+
+    def _first_user_message(self) -> Optional[str]:
+        """The first user message, or None if there is none or the name is already known."""
         name = (self.candidate.name or "").strip()
         user_msgs = [m["content"] for m in self.messages if m["role"] == "user"]
         if (name and name.lower() != "unknown") or not user_msgs:
-            return
-        first_msg = user_msgs[0].strip()
-        extracted_name = None
+            return None
+        return user_msgs[0].strip()
+
+    def _match_candidate_name(self, first_msg: str) -> Optional[str]:
+        """Find the name locally: common intro patterns, then the first alphabetic words."""
         # 1. Try common intro patterns (case-insensitive)
-        patterns = [
-            r"my name is ([A-Za-z][a-zA-Z\-']*(?: [A-Za-z][a-zA-Z\-']*){0,2})",
-            r"i am ([A-Za-z][a-zA-Z\-']*(?: [A-Za-z][a-zA-Z\-']*){0,2})",
-            r"i'm ([A-Za-z][a-zA-Z\-']*(?: [A-Za-z][a-zA-Z\-']*){0,2})",
-            r"this is ([A-Za-z][a-zA-Z\-']*(?: [A-Za-z][a-zA-Z\-']*){0,2})",
-            r"it's ([A-Za-z][a-zA-Z\-']*(?: [A-Za-z][a-zA-Z\-']*){0,2})",
-            r"([A-Za-z][a-zA-Z\-']* [A-Za-z][a-zA-Z\-']*) here",
-        ]
-        for pat in patterns:
-            match = re.search(pat, first_msg, re.IGNORECASE)
+        for pattern in NAME_PATTERNS:
+            match = pattern.search(first_msg)
             if match:
                 extracted_name = match.group(1).strip()
-                print(f"[DEBUG] Name extracted by pattern '{pat}': {extracted_name}")
-                break
+                print(f"[DEBUG] Name extracted by pattern '{pattern.pattern}': {extracted_name}")
+                return extracted_name
         # 2. If not found, extract first two alphabetic words (allow single name)
-        if not extracted_name:
-            words = [w for w in first_msg.split() if w.isalpha() and len(w) > 1]
-            if words:
-                extracted_name = words[0]
-                if len(words) > 1:
-                    extracted_name += f" {words[1]}"
-                print(f"[DEBUG] Name extracted by first words: {extracted_name}")
-        # 3. Fallback to OpenAI
-        if not extracted_name:
-            try:
-                name_extraction_prompt = f"""Based on the following candidate response, what is the candidate's name?\n\nResponse:\n{first_msg}\n\nPlease respond with just the candidate's first and last name, or \"Unknown\" if no name was mentioned.\nExamples: \"John Smith\", \"Sarah Johnson\", \"Unknown\" """
-                response = await self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": name_extraction_prompt}],
-                    temperature=0.1,
-                    max_tokens=50,
-                )
-                extracted_name = response.choices[0].message.content.strip()
-                print(f"[DEBUG] Name extracted by OpenAI: {extracted_name}")
-            except Exception as e:
-                print(f"Error extracting candidate name: {str(e)}")
-                extracted_name = None
-        # Only accept if not unknown, not empty, and 3 words or fewer
+        words = [w for w in first_msg.split() if w.isalpha() and len(w) > 1]
+        if words:
+            extracted_name = " ".join(words[:2])
+            print(f"[DEBUG] Name extracted by first words: {extracted_name}")
+            return extracted_name
+        return None
+
+    async def _ask_candidate_name(self, first_msg: str) -> Optional[str]:
+        """Fallback: ask the model for the name."""
+        try:
+            name_extraction_prompt = f"""Based on the following candidate response, what is the candidate's name?\n\nResponse:\n{first_msg}\n\nPlease respond with just the candidate's first and last name, or \"Unknown\" if no name was mentioned.\nExamples: \"John Smith\", \"Sarah Johnson\", \"Unknown\" """
+            response = await self.llm_pool.create_chat_completion(
+                call_type="name",
+                model=self.model,
+                messages=[{"role": "user", "content": name_extraction_prompt}],
+                temperature=0.1,
+                max_tokens=50,
+            )
+            extracted_name = response.choices[0].message.content.strip()
+            print(f"[DEBUG] Name extracted by OpenAI: {extracted_name}")
+            return extracted_name
+        except Exception as e:
+            print(f"Error extracting candidate name: {str(e)}")
+            return None
+
+    def _set_candidate_name(self, extracted_name: Optional[str]) -> None:
+        """Only accept if not unknown, not empty, and 3 words or fewer."""
         if (
             extracted_name
             and extracted_name.lower() != "unknown"
@@ -417,60 +558,223 @@ Full Interview Transcript:
         else:
             print(f"[DEBUG] Name extraction failed or result invalid: '{extracted_name}'")
 
-    async def chat(self, user_input: str = None) -> str:
-        """Send a message to the AI and get a response."""
-        
+    async def _extract_name_with_model(self, first_msg: str) -> None:
+        """Run the model fallback for the name and store the result."""
+        self._set_candidate_name(await self._ask_candidate_name(first_msg))
+
+    async def _begin_turn(self, user_input: Optional[str]) -> Optional[str]:
+        """Record the user's message and wrap up the interview once it is long enough.
+
+        Returns the closing message if the interview just ended, otherwise None.
+        """
         # Add user message to history
         if user_input:
             self.add_message("user", user_input)
-            
-            # Immediately extract candidate name after first user message
-            user_msg_count = len([m for m in self.messages if m["role"] == "user"])
-            if user_msg_count == 1:
-                await self.extract_candidate_name()
         
         # Check if conversation is ready to end (10-15 exchanges)
         if self.candidate.conversation_count >= 10 and not self.ready_for_assessment:
             self.candidate.conversation_timer.update()
             self.candidate.conversation_duration = self.candidate.conversation_timer.get_delta_str()
-            self.ready_for_assessment = True
-            # Save assessment to file
-            filepath = await self.save_assessment_to_file()
-            ending_message = f"Thank you for your time! I've completed your assessment and saved it to: {filepath}\n\nI'll review your responses and get back to you with next steps. Good luck with your application!"
-            self.add_message("assistant", ending_message)
-            return ending_message
+            return self._finish_interview()
         
         # Check if conversation has gone too long (15+ exchanges) and force end
         if self.candidate.conversation_count >= 15 and not self.ready_for_assessment:
-            self.ready_for_assessment = True
-            # Save assessment to file
-            filepath = await self.save_assessment_to_file()
-            ending_message = f"Thank you for your time! I've completed your assessment and saved it to: {filepath}\n\nI'll review your responses and get back to you with next steps. Good luck with your application!"
-            self.add_message("assistant", ending_message)
-            return ending_message
+            return self._finish_interview()
         
-        # Prepare messages for OpenAI API with system prompt
-        messages = [{"role": "system", "content": self.system_prompt}]
-        messages.extend(self.messages)
+        return None
+
+    def _finish_interview(self) -> str:
+        """Mark the interview as complete, queue its assessment and return the closing message."""
+        # The last answer is scored in the background too; the assessment job waits for it
+        self._start_evaluations(background=True)
+        self.ready_for_assessment = True
+        self.queue_assessment()
+        ending_message = "Thank you for your time! Your assessment is being prepared and will appear in your journey shortly.\n\nI'll review your responses and get back to you with next steps. Good luck with your application!"
+        self.add_message("assistant", ending_message)
+        return ending_message
+
+    def _build_request_messages(self) -> List[Dict[str, str]]:
+        """Prepare messages for the OpenAI API: system prompt, summary and recent turns within budget."""
+        return self.context.build_messages(
+            self.system_prompt, self.messages, self.summary, self.summarized_count
+        )
+
+    def _start_side_tasks(self) -> List["asyncio.Task[None]"]:
+        """Start the work a turn needs besides the interviewer reply, to run alongside it.
+
+        On the first message the candidate's name is matched locally; only if
+        that fails is the model asked, concurrently with the reply. Turns that
+        have left the verbatim window are folded into the summary the same
+        way. Await the returned tasks before the turn ends.
+        """
+        tasks = []
+        if self.candidate.conversation_count == 1:
+            first_msg = self._first_user_message()
+            if first_msg is not None:
+                extracted_name = self._match_candidate_name(first_msg)
+                if extracted_name:
+                    self._set_candidate_name(extracted_name)
+                else:
+                    tasks.append(asyncio.create_task(self._extract_name_with_model(first_msg)))
         
+        end = self.context.fold_end(self.messages, self.summarized_count)
+        if end is not None:
+            tasks.append(asyncio.create_task(self._update_summary(end)))
+        
+        # Background evaluations run on through the time the student spends reading and typing;
+        # otherwise the turn waits for them like any other side task
+        evaluation_tasks = self._start_evaluations(self.background_evaluations)
+        if not self.background_evaluations:
+            tasks.extend(evaluation_tasks)
+        return tasks
+
+    def _start_evaluations(self, background: bool) -> List["asyncio.Task[None]"]:
+        """Start scoring every answer that is not scored or being scored yet, until the interview ends.
+
+        Background evaluations get a context of their own, so they are traced
+        on their own rather than under a request that has already finished.
+        """
+        if self.evaluator is None or self.ready_for_assessment:
+            return []
+        tasks = []
+        for index, message in enumerate(self.messages):
+            if message["role"] != "user" or index in self.evaluations or index in self.candidate.evaluated_answers:
+                continue
+            task = asyncio.create_task(
+                self._evaluate_answer(self.messages, index),
+                context=contextvars.Context() if background else None,
+            )
+            self.evaluations[index] = task
+            tasks.append(task)
+        return tasks
+
+    async def _evaluate_answer(self, messages: List[Dict[str, str]], index: int) -> None:
+        """Score messages[index] with the question before it and merge the result into the candidate.
+
+        On failure the answer stays unscored and is tried again when the interview ends.
+        """
+        candidate = self.candidate
+        question = messages[index - 1]["content"] if index and messages[index - 1]["role"] == "assistant" else ""
         try:
-            # Make API call to OpenAI
-            response = await self.client.chat.completions.create(
+            with span("evaluation.answer", answer=index):
+                response = await self.llm_pool.create_chat_completion(
+                    call_type="evaluation",
+                    model=self.model,
+                    messages=self.evaluator.evaluation_request(question, messages[index]["content"]),
+                    temperature=0.2,
+                    max_tokens=self.evaluator.max_tokens,
+                    response_format={"type": "json_object"},
+                )
+                evaluation = self.evaluator.parse(response.choices[0].message.content)
+            if index not in candidate.evaluated_answers:
+                self.evaluator.merge(candidate, evaluation, index)
+        except Exception as e:
+            print(f"Error evaluating answer {index}: {str(e)}")
+        finally:
+            if self.evaluations.get(index) is asyncio.current_task():
+                del self.evaluations[index]
+
+    async def _complete_evaluations(self, messages: List[Dict[str, str]]) -> bool:
+        """Wait for running evaluations and score any answer in messages that was missed.
+
+        Returns True if every answer is now scored, so the report can be built
+        from the evaluations.
+        """
+        if self.evaluator is None:
+            return False
+        await asyncio.gather(*self.evaluations.values())
+        
+        missing = [
+            index for index, message in enumerate(messages)
+            if message["role"] == "user" and index not in self.candidate.evaluated_answers
+        ]
+        await asyncio.gather(*(self._evaluate_answer(messages, index) for index in missing))
+        return all(index in self.candidate.evaluated_answers for index in missing)
+
+    async def _update_summary(self, end: int) -> None:
+        """Fold messages[summarized_count:end] into the summary; on failure they stay verbatim."""
+        try:
+            response = await self.llm_pool.create_chat_completion(
+                call_type="summary",
                 model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
+                messages=self.context.summary_request(self.summary, self.messages[self.summarized_count:end]),
+                temperature=0.2,
+                max_tokens=self.context.summary_max_tokens,
             )
+            self.summary = response.choices[0].message.content.strip()
+            self.summarized_count = end
+        except Exception as e:
+            print(f"Error summarizing conversation: {str(e)}")
+
+    async def chat(self, user_input: str = None) -> str:
+        """Send a message to the AI and get a response."""
+        with span("chat.turn", turn=self.candidate.conversation_count + 1):
+            ending_message = await self._begin_turn(user_input)
+            if ending_message is not None:
+                return ending_message
             
-            # Extract AI response
-            ai_response = response.choices[0].message.content
+            side_tasks = self._start_side_tasks()
+            try:
+                # Make API call to OpenAI
+                response = await self.llm_pool.create_chat_completion(
+                    call_type="turn",
+                    model=self.model,
+                    messages=self._build_request_messages(),
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                )
+                
+                # Extract AI response
+                ai_response = response.choices[0].message.content
+                
+                # Add AI response to history
+                self.add_message("assistant", ai_response)
+                
+                return ai_response
+                
+            except Exception as e:
+                error_msg = f"Error communicating with OpenAI: {str(e)}"
+                self.add_message("assistant", error_msg)
+                return error_msg
             
-            # Add AI response to history
-            self.add_message("assistant", ai_response)
+            finally:
+                await asyncio.gather(*side_tasks)
+
+    async def chat_stream(self, user_input: str = None) -> AsyncIterator[str]:
+        """Send a message to the AI and yield the response as it is generated.
+
+        The complete reply is appended to the conversation history once the
+        stream ends, exactly as chat() does.
+        """
+        with span("chat.turn", turn=self.candidate.conversation_count + 1, stream=True):
+            ending_message = await self._begin_turn(user_input)
+            if ending_message is not None:
+                yield ending_message
+                return
             
-            return ai_response
+            reply_parts: List[str] = []
+            side_tasks = self._start_side_tasks()
+            try:
+                async for delta in self.llm_pool.stream_chat_completion(
+                    call_type="turn",
+                    model=self.model,
+                    messages=self._build_request_messages(),
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                ):
+                    reply_parts.append(delta)
+                    yield delta
+            except GeneratorExit:
+                # Client went away mid-reply; keep what was said so the history stays consistent
+                if reply_parts:
+                    self.add_message("assistant", "".join(reply_parts))
+                raise
+            except Exception as e:
+                error_msg = f"Error communicating with OpenAI: {str(e)}"
+                self.add_message("assistant", error_msg)
+                yield error_msg
+                return
+            finally:
+                await asyncio.gather(*side_tasks)
             
-        except Exception as e:
-            error_msg = f"Error communicating with OpenAI: {str(e)}"
-            self.add_message("assistant", error_msg)
-            return error_msg
+            self.add_message("assistant", "".join(reply_parts))
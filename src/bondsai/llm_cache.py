@@ -0,0 +1,203 @@
+"""Disk cache and record/replay cassette for LLM responses."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from server.SqliteConnections import SqliteConnections
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses (last_used);
+CREATE TABLE IF NOT EXISTS cache_size (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    total INTEGER NOT NULL
+);
+-- Seeded from the entries once, for a cache created before the total was kept
+INSERT OR IGNORE INTO cache_size
+    SELECT 0, COALESCE(SUM(size), 0) FROM responses WHERE NOT EXISTS (SELECT 1 FROM cache_size);
+"""
+
+
+class LLMCacheMiss(LookupError):
+    """Raised in replay mode when a request is not in the cassette."""
+
+
+def request_key(request: Dict[str, Any]) -> str:
+    """Hash a chat completion request (model, messages and sampling parameters).
+
+    The stream flag is left out, so a streamed and a non-streamed request
+    for the same completion share one entry.
+    """
+    payload = {k: v for k, v in request.items() if k != "stream"}
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class DiskLLMCache:
+    """SQLite-backed response cache, evicting least recently used entries past max_bytes.
+
+    Shared by every worker process on the host. Entries never go stale on
+    their own: a request with the same model, messages and sampling
+    parameters gets the stored completion back.
+
+    The total size of the entries is kept in the cache_size row and updated
+    in the same transaction as each write, so a put never sums the table.
+    Every call blocks on SQLite, so async code runs them in a worker thread.
+    """
+
+    def __init__(self, db_path: str, max_bytes: int):
+        """Store cache settings; the database is opened on first use."""
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._connections = SqliteConnections(db_path, SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, creating the database if needed."""
+        return self._connections.get()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored response for key, marking it as recently used, or None."""
+        conn = self._connect()
+        row = conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        with conn:
+            conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, request: Dict[str, Any], response: Dict[str, Any]) -> None:
+        """Store a response, then evict the least recently used entries while over max_bytes."""
+        encoded = json.dumps(response)
+        conn = self._connect()
+        with conn:
+            # Taking the write lock up front keeps the size of a replaced entry and the total in step
+            # with other processes writing the same key
+            conn.execute("BEGIN IMMEDIATE")
+            replaced = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, encoded, len(encoded), time.time()),
+            )
+            total = self._add_to_total(conn, len(encoded) - (replaced[0] if replaced else 0))
+            if total <= self.max_bytes:
+                return
+
+            # Oldest first through the last_used index, reading only as many rows as are evicted
+            evicted = []
+            freed = 0
+            rows = conn.execute("SELECT key, size FROM responses WHERE key != ? ORDER BY last_used", (key,))
+            for old_key, size in rows:
+                if total - freed <= self.max_bytes:
+                    break
+                evicted.append((old_key,))
+                freed += size
+            rows.close()
+            conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+            self._add_to_total(conn, -freed)
+            self.evictions += len(evicted)
+
+    @staticmethod
+    def _add_to_total(conn: sqlite3.Connection, delta: int) -> int:
+        """Change the stored total size by delta and return the new total."""
+        conn.execute("UPDATE cache_size SET total = total + ? WHERE id = 0", (delta,))
+        return conn.execute("SELECT total FROM cache_size WHERE id = 0").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, size and hit/miss counters."""
+        conn = self._connect()
+        entries = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        size = conn.execute("SELECT total FROM cache_size WHERE id = 0").fetchone()[0]
+        return {
+            "mode": "cache",
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class LLMCassette:
+    """Append-only JSONL file of request/response exchanges for offline reruns.
+
+    In record mode every request goes to the API and the exchange is
+    appended. In replay mode responses come only from the cassette and a
+    request that was never recorded raises LLMCacheMiss. Requests are
+    matched by content, so replay does not depend on call order.
+    """
+
+    def __init__(self, path: str, replay: bool):
+        """Load any exchanges already in the cassette."""
+        self.path = path
+        self.replay = replay
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        exchange = json.loads(line)
+                        self._entries[exchange["key"]] = exchange["response"]
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the recorded response when replaying; recording always goes to the API."""
+        if not self.replay:
+            return None
+
+        response = self._entries.get(key)
+        if response is None:
+            self.misses += 1
+            raise LLMCacheMiss(f"Request {key[:12]} is not in cassette {self.path}")
+        self.hits += 1
+        return response
+
+    def put(self, key: str, request: Dict[str, Any], response: Dict[str, Any]) -> None:
+        """Append an exchange to the cassette (a later recording of the same request wins)."""
+        if self.replay:
+            return
+
+        line = json.dumps({"key": key, "request": request, "response": response}, ensure_ascii=False)
+        with self._lock:
+            cassette_dir = os.path.dirname(self.path)
+            if cassette_dir:
+                os.makedirs(cassette_dir, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self._entries[key] = response
+
+    def stats(self) -> Dict[str, Any]:
+        """Exchange count and hit/miss counters."""
+        return {
+            "mode": "replay" if self.replay else "record",
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def create_llm_cache(mode: str, cache_path: str, max_bytes: int, cassette_path: str) -> Any:
+    """Build the cache for an LLM_CACHE_MODE: None for "off", else a DiskLLMCache or LLMCassette."""
+    if mode == "cache":
+        return DiskLLMCache(cache_path, max_bytes)
+    if mode in ("record", "replay"):
+        return LLMCassette(cassette_path, replay=(mode == "replay"))
+    return None
@@ -0,0 +1,224 @@
+"""Process-wide pooled OpenAI client shared by every interview session."""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletion
+
+from .config import config
+from .llm_cache import create_llm_cache, request_key
+from server.Metrics import LLM_REQUEST_SECONDS, LLM_REQUESTS, LLM_TOKENS
+from server.ProcessWide import process_wide
+from server.Tracing import span
+
+
+class LLMClientPool:
+    """One AsyncOpenAI client with a keep-alive connection pool and an in-flight limit.
+
+    With a cache (see llm_cache), completions are looked up by a hash of the
+    request before calling the API and stored afterwards. Cache reads and
+    writes run in a worker thread so disk I/O never stalls the event loop
+    that every session's requests share.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 60.0,
+        max_in_flight: int = 64,
+        timeout: float = 60.0,
+        cache: Optional[Any] = None,
+        base_url: Optional[str] = None,
+    ):
+        """Store pool settings; the client itself is created on first use."""
+        self.api_key = api_key
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.cache = cache
+        self.base_url = base_url
+
+        self._client: Optional[AsyncOpenAI] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_client(self) -> None:
+        """Create the client and semaphore for the running event loop.
+
+        httpx connections and asyncio primitives are bound to the loop that
+        created them, so a new loop (e.g. a CLI run or a forked worker) gets
+        its own client instead of reusing dead connections. The previous
+        client is closed on its own loop if that loop is still running;
+        once a loop has closed its client can no longer be closed, so code
+        that runs a loop of its own calls aclose() before the loop ends.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._loop is loop:
+            return
+        if self._client is not None and self._loop.is_running() and not self._loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self._client.close(), self._loop)
+
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            timeout=self.timeout,
+        )
+        self._client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, http_client=http_client)
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        self._loop = loop
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """The shared AsyncOpenAI client for the running event loop."""
+        self._ensure_client()
+        return self._client
+
+    async def create_chat_completion(self, call_type: str = "other", **kwargs: Any) -> Any:
+        """Run a chat completion, waiting for a free slot if too many are in flight.
+
+        call_type (e.g. "turn", "name", "summary", "assessment") labels the
+        request in the latency and token usage metrics.
+        """
+        key = request_key(kwargs) if self.cache is not None else None
+        if key is not None:
+            cached = await asyncio.to_thread(self.cache.get, key)
+            if cached is not None:
+                LLM_REQUESTS.inc(call_type=call_type, outcome="cached")
+                return ChatCompletion.model_validate(cached)
+        
+        self._ensure_client()
+        with span(f"llm.{call_type}", model=kwargs.get("model")):
+            async with self._semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await self._client.chat.completions.create(**kwargs)
+                except Exception:
+                    LLM_REQUESTS.inc(call_type=call_type, outcome="error")
+                    raise
+                LLM_REQUEST_SECONDS.observe(time.perf_counter() - started, call_type=call_type)
+        
+        LLM_REQUESTS.inc(call_type=call_type, outcome="ok")
+        _record_usage(call_type, response.usage)
+        if key is not None:
+            await asyncio.to_thread(self.cache.put, key, kwargs, response.model_dump(mode="json"))
+        return response
+
+    async def stream_chat_completion(self, call_type: str = "other", **kwargs: Any) -> AsyncIterator[str]:
+        """Stream a chat completion, yielding text deltas as they arrive.
+
+        The in-flight slot is held until the stream is exhausted or closed.
+        A cached reply is yielded as a single delta; a live one is stored
+        only if the stream completes. Token usage is requested in the final
+        chunk for the metrics.
+        """
+        key = request_key(kwargs) if self.cache is not None else None
+        if key is not None:
+            cached = await asyncio.to_thread(self.cache.get, key)
+            if cached is not None:
+                LLM_REQUESTS.inc(call_type=call_type, outcome="cached")
+                yield ChatCompletion.model_validate(cached).choices[0].message.content or ""
+                return
+        
+        parts = []
+        # Anything that ends the stream other than finishing or failing (the client disconnecting,
+        # so the generator is closed, or the task being cancelled) is counted as cancelled
+        outcome = "cancelled"
+        self._ensure_client()
+        with span(f"llm.{call_type}", model=kwargs.get("model"), stream=True) as current:
+            async with self._semaphore:
+                started = time.perf_counter()
+                try:
+                    stream = await self._client.chat.completions.create(
+                        stream=True, stream_options={"include_usage": True}, **kwargs
+                    )
+                    async with stream:
+                        async for chunk in stream:
+                            if chunk.usage is not None:
+                                _record_usage(call_type, chunk.usage)
+                            if chunk.choices and chunk.choices[0].delta.content:
+                                parts.append(chunk.choices[0].delta.content)
+                                yield chunk.choices[0].delta.content
+                    outcome = "ok"
+                    LLM_REQUEST_SECONDS.observe(time.perf_counter() - started, call_type=call_type)
+                except Exception:
+                    outcome = "error"
+                    raise
+                finally:
+                    LLM_REQUESTS.inc(call_type=call_type, outcome=outcome)
+                    current.attrs["outcome"] = outcome
+        
+        if key is not None:
+            completion = _completion_from_stream(kwargs["model"], "".join(parts))
+            await asyncio.to_thread(self.cache.put, key, kwargs, completion)
+
+    async def warm_up(self) -> None:
+        """Open a connection ahead of the first interview turn (skipped when replaying offline)."""
+        if getattr(self.cache, "replay", False):
+            return
+        try:
+            await self.client.models.list()
+        except Exception as e:
+            print(f"LLM client warm-up failed: {str(e)}")
+
+    async def aclose(self) -> None:
+        """Close the shared client and its connections."""
+        if self._client is not None:
+            await self._client.close()
+        self._client = None
+        self._semaphore = None
+        self._loop = None
+
+
+def _record_usage(call_type: str, usage: Any) -> None:
+    """Count the prompt and completion tokens of a response, if the API reported them."""
+    if usage is None:
+        return
+    LLM_TOKENS.inc(usage.prompt_tokens or 0, call_type=call_type, kind="prompt")
+    LLM_TOKENS.inc(usage.completion_tokens or 0, call_type=call_type, kind="completion")
+
+
+def _completion_from_stream(model: str, content: str) -> dict:
+    """Build the stored form of a streamed reply, as a non-streamed completion would be."""
+    return {
+        "id": "chatcmpl-stream",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }
+        ],
+    }
+
+
+@process_wide
+def get_llm_pool() -> LLMClientPool:
+    """Return the process-wide LLM client pool, creating it from config on first use."""
+    return LLMClientPool(
+        api_key=config.require_openai_api_key(),
+        max_connections=config.openai_max_connections,
+        max_keepalive_connections=config.openai_max_keepalive_connections,
+        keepalive_expiry=config.openai_keepalive_expiry,
+        max_in_flight=config.openai_max_in_flight,
+        timeout=config.openai_timeout,
+        cache=create_llm_cache(
+            config.llm_cache_mode,
+            config.llm_cache_path,
+            config.llm_cache_max_bytes,
+            config.llm_cassette_path,
+        ),
+        base_url=config.openai_base_url or None,
+    )
@@ -0,0 +1,236 @@
+"""Assessment report layout, and the full report requested as concurrent per-section completions."""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+from server.AssessmentFileLoader import parse_assessment_text, split_structured_assessment, valid_score
+
+
+# Skills scored in every report, by report section, with the labels the report uses for them
+SKILL_LABELS = {
+    "technical_skills": {
+        "quantitative_reasoning": "Quantitative Reasoning",
+        "programming": "Programming Skills",
+        "market_knowledge": "Market Knowledge",
+        "data_analysis": "Data Analysis",
+    },
+    "behavioral_traits": {
+        "problem_solving": "Problem-solving",
+        "teamwork": "Teamwork",
+        "initiative": "Initiative",
+        "resilience": "Resilience",
+        "adaptability": "Adaptability",
+    },
+    "cultural_fit": {
+        "collaborative_thinking": "Collaborative Thinking",
+        "continuous_learning": "Continuous Learning",
+        "challenge_seeking": "Challenge-seeking",
+        "entrepreneurial_spirit": "Entrepreneurial Spirit",
+    },
+    "soft_skills": {
+        "communication": "Communication",
+        "decision_making": "Decision-making",
+        "time_management": "Time Management",
+        "leadership": "Leadership",
+    },
+}
+
+SECTION_TITLES = {
+    "technical_skills": "1. Technical Skills Assessment",
+    "behavioral_traits": "2. Behavioral Traits Assessment",
+    "cultural_fit": "3. Cultural Fit Assessment",
+    "soft_skills": "4. Soft Skills Assessment",
+    "overall": "5. Overall Assessment",
+}
+
+# Section of each skill; skill names are unique across sections
+SKILL_SECTIONS = {skill: section for section, skills in SKILL_LABELS.items() for skill in skills}
+
+REPORT_TITLE = "### Student Interview Practice Assessment"
+
+# Shared start of every section request; the transcript comes before anything section-specific,
+# so the five requests share one long prefix that the API can serve from its prompt cache
+SECTION_PREAMBLE = """You are a supportive interview coach providing detailed feedback to a university student after their practice interview. This was a MOCK INTERVIEW - the student just completed a formal practice session, and now you need to provide comprehensive, student-friendly coaching feedback.
+
+**Important Context:**
+- During the interview, you acted as a formal interviewer (no coaching was given)
+- Now, provide ALL the teaching, coaching, and guidance in this feedback report
+- Be encouraging, specific, and actionable
+- Help them understand what worked, what didn't, and how to improve
+
+Conversation from the mock interview:
+{transcript}
+
+You are writing one section of the feedback report: "{title}". Other sections are written separately, so cover only this one, and do not repeat its heading."""
+
+SKILL_SECTION_PROMPT = """
+
+Score each of the following from 0 to 100, with detailed 2-3 sentence feedback:
+{skills}
+
+{guidance}
+
+Format EXACTLY as follows:
+{layout}
+
+Then append the same scores as a fenced ```json block with exactly this shape (integers 0-100):
+
+```json
+{template}
+```"""
+
+OVERALL_SECTION_PROMPT = """
+
+The final score is calculated from the skill scores in the other sections, so do not give one. Write:
+- Key Strengths: 3-5 bullet points highlighting what they're doing well, with specific examples from their answers
+- Areas for Improvement: 3-5 bullet points with SPECIFIC weaknesses observed, WHY each matters for real interviews, and HOW to fix it with concrete steps (frame as learning opportunities)
+- Recommended Future Steps: 5-7 specific, actionable practice actions (e.g., "Prepare 3 STAR stories about teamwork - practice saying them out loud", "Practice quantifying outcomes for 2 projects - add numbers and metrics", "Write a 60-second elevator pitch and time yourself", "Practice answering 'Tell me about yourself' in under 2 minutes")
+
+Include a brief coaching section on common student interview mistakes you noticed and how to avoid them.
+
+Format EXACTLY as follows:
+- **Key Strengths**:
+  - (bullet point 1)
+  - (bullet point 2)
+  - (bullet point 3)
+- **Areas for Improvement**:
+  - (bullet point 1 - specific weakness with why it matters and how to fix)
+  - (bullet point 2 - specific weakness with why it matters and how to fix)
+  - (bullet point 3 - specific weakness with why it matters and how to fix)
+- **Recommended Future Steps**:
+  - (actionable step 1)
+  - (actionable step 2)
+  - (actionable step 3)
+  - (actionable step 4)
+  - (actionable step 5)
+
+End with 2-3 encouraging sentences emphasizing that:
+- This was practice and improvement comes with repetition
+- They're building valuable interview skills
+- Each practice session makes them more confident and prepared
+- They should review this feedback and focus on the recommended steps before their next practice
+
+After those sentences, append the same bullet points as a fenced ```json block with exactly this shape (short strings in each list):
+
+```json
+{{"strengths": [], "weaknesses": [], "recommendations": []}}
+```"""
+
+# What each skill section asks for: the skills as the prompt describes them, the coaching guidance,
+# the feedback each bullet should hold, and the token budget for the section's completion
+SKILL_SECTIONS_SPEC = {
+    "technical_skills": {
+        "skills": [
+            "Quantitative Reasoning (or Analytical Thinking if non-quant role)",
+            "Programming Skills (or relevant hard skills for their field)",
+            "Market / Industry Knowledge (adapt to their field)",
+            "Data Analysis (or Working With Information if non-technical)",
+        ],
+        "guidance": "For each skill: Give the score, what they did well, specific gaps you noticed, and concrete steps to improve. Include examples from their answers.",
+        "feedback": "2-3 sentences: what they did well, specific gaps, how to improve",
+        "max_tokens": 500,
+    },
+    "behavioral_traits": {
+        "skills": ["Problem-solving", "Teamwork", "Initiative", "Resilience", "Adaptability"],
+        "guidance": "For each trait: Give the score, evidence from their answers (quote specific examples), what worked well, what was missing, and concrete ways to strengthen. Teach them how to structure better answers using STAR framework.",
+        "feedback": "2-3 sentences: evidence from answers, what worked, what to improve",
+        "max_tokens": 650,
+    },
+    "cultural_fit": {
+        "skills": ["Collaborative Thinking", "Continuous Learning", "Challenge-seeking", "Entrepreneurial Spirit"],
+        "guidance": "For each: Give the score, how they demonstrated it (or didn't) with examples, and specific ways to better showcase these qualities in future interviews.",
+        "feedback": "2-3 sentences: how they showed this, how to improve",
+        "max_tokens": 500,
+    },
+    "soft_skills": {
+        "skills": [
+            "Communication (clarity, structure, conciseness)",
+            "Decision-making (how they approach choices)",
+            "Time Management (organization, prioritization)",
+            "Leadership (influence, taking charge)",
+        ],
+        "guidance": "For each: Give the score, specific examples from their answers (what was clear/unclear), and actionable tips for improvement. Include coaching on common student pitfalls like rambling, being too generic, or not quantifying impact.",
+        "feedback": "2-3 sentences: clarity/structure examples, specific tips to improve",
+        "max_tokens": 550,
+    },
+}
+
+OVERALL_MAX_TOKENS = 700
+
+
+def section_requests(transcript: str) -> List[Tuple[str, List[Dict[str, str]], int]]:
+    """Build the request for every report section.
+
+    Returns:
+        (section, messages, max_tokens) for each section, in report order.
+    """
+    requests = []
+    for section, spec in SKILL_SECTIONS_SPEC.items():
+        layout = "\n".join(
+            f"- **{label}**: (score)\n  - ({spec['feedback']})" for label in SKILL_LABELS[section].values()
+        )
+        prompt = SECTION_PREAMBLE.format(transcript=transcript, title=SECTION_TITLES[section]) + SKILL_SECTION_PROMPT.format(
+            skills="\n".join(f"- {skill}" for skill in spec["skills"]),
+            guidance=spec["guidance"],
+            layout=layout,
+            template=json.dumps({skill: 0 for skill in SKILL_LABELS[section]}, indent=2),
+        )
+        requests.append((section, [{"role": "user", "content": prompt}], spec["max_tokens"]))
+
+    prompt = SECTION_PREAMBLE.format(transcript=transcript, title=SECTION_TITLES["overall"]) + OVERALL_SECTION_PROMPT
+    requests.append(("overall", [{"role": "user", "content": prompt}], OVERALL_MAX_TOKENS))
+    return requests
+
+
+def stitch_report(sections: Dict[str, str]) -> str:
+    """Join section completions into one report with its trailing JSON block.
+
+    The result has the layout a single-completion report had, so it is
+    parsed the same way. Each section's scores come from its JSON block,
+    or from its bullets where the block is missing or invalid. The final
+    score is the equally weighted mean of the four skill sections, as in
+    JobCandidate.calculate_final_score.
+    """
+    lines = [REPORT_TITLE, ""]
+    structured: Dict[str, Any] = {}
+    for section, skills in SKILL_LABELS.items():
+        markdown, block = split_structured_assessment(sections[section])
+        markdown = _strip_heading(markdown)
+        scores = parse_assessment_text(f"#### {SECTION_TITLES[section]}\n{markdown}", _empty_report_data())[section]
+        for skill in skills:
+            score = valid_score((block or {}).get(skill))
+            if score is not None:
+                scores[skill] = score
+        structured[section] = scores
+        if not markdown:
+            markdown = "\n".join(f"- **{label}**: {scores[skill]}" for skill, label in skills.items())
+        lines += [f"#### {SECTION_TITLES[section]}", markdown, ""]
+
+    final_score = round(sum(sum(scores.values()) / len(scores) for scores in structured.values()) / len(structured))
+    markdown, block = split_structured_assessment(sections["overall"])
+    markdown = _strip_heading(markdown)
+    insights = parse_assessment_text(f"#### {SECTION_TITLES['overall']}\n{markdown}", _empty_report_data())["insights"]
+    for key in insights:
+        items = (block or {}).get(key)
+        if isinstance(items, list) and items:
+            insights[key] = [str(item).strip() for item in items if str(item).strip()][:5]
+    lines += [f"#### {SECTION_TITLES['overall']}", f"- **Final Score**: {final_score}", markdown]
+
+    structured["final_score"] = final_score
+    structured["insights"] = insights
+    return "\n".join(lines) + "\n\n```json\n" + json.dumps(structured, indent=2) + "\n```"
+
+
+def _strip_heading(markdown: str) -> str:
+    """Drop a heading the model repeated at the top of its section."""
+    lines = markdown.strip().splitlines()
+    while lines and (lines[0].lstrip().startswith("#") or not lines[0].strip()):
+        lines.pop(0)
+    return "\n".join(lines).strip()
+
+
+def _empty_report_data() -> Dict[str, Any]:
+    """Blank scores and insights for parse_assessment_text to fill."""
+    data: Dict[str, Any] = {section: {skill: 0 for skill in skills} for section, skills in SKILL_LABELS.items()}
+    data.update(final_score=0, insights={"strengths": [], "weaknesses": [], "recommendations": []})
+    return data
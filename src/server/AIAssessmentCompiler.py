@@ -1,4 +1,18 @@
+import threading
 import markdown
 
+MARKDOWN_EXTENSIONS = ['fenced_code', 'tables', 'extra']
+
+_local = threading.local()
+
+# Building a Markdown instance loads and registers every extension, which costs more than converting
+# a report, so each thread keeps one; instances hold per-document state and are not thread-safe,
+# so they are not shared, and reset() clears that state before each document
+def _renderer():
+    renderer = getattr(_local, 'renderer', None)
+    if renderer is None:
+        renderer = _local.renderer = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+    return renderer
+
 def compile_AI_assessment(content):
-    return markdown.markdown(content, extensions=['fenced_code', 'tables', 'extra'])
\ No newline at end of file
+    return _renderer().reset().convert(content)
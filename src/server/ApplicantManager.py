@@ -1,26 +1,35 @@
 from bondsai.job_screening import JobScreeningAssistant
 from server.DeltaTimeRecorder import DeltaTimeRecorder
+from server.SessionStore import ApplicantSession, MemorySessionStore, get_session_store
+from server.Tracing import span
 
 # This class manages applicant by their ip address to ensure they can only apply once
 # Each applicant is represented by their ip, which they can have three states: 'applied' 'not applied' or 'applying'
 # Once an applicant requests the application page, they are set to 'applying' which allows them to request to communicate with the AI
 # Once they submit their application, they are set to 'applied' which prevents them from applying again
+# Sessions live in a session store (see SessionStore), in memory or shared between worker processes;
+# an applicant whose session expired or was evicted is simply 'not applied' again
 class ApplicantManager:
-    def __init__(self):
-        self.applicant_state = {}
-        self.applicant_job_assistant = {}
-        self.applicant_timer = {}
-    
+    def __init__(self, session_store=None):
+        self.session_store = session_store or get_session_store()
+        self.sessions_created = 0
+        # The in-memory store hands back the very assistant it keeps, so answer evaluations can run on
+        # past the turn; a shared store saves a copy once the turn is over, which must include them
+        self.background_evaluations = isinstance(self.session_store, MemorySessionStore)
+
     # Return the status of the applicant based on their IP address
     def get_applicant_status(self, ip_address):
-        return self.applicant_state.get(ip_address, 'not applied')
-    
+        session = self.session_store.get(ip_address)
+        return session.status if session else 'not applied'
+
     # Set the status of the applicant based on their IP address
     def set_applicant_status(self, ip_address, status):
         if status not in ['applied', 'not applied', 'applying']:
             raise ValueError("Status must be either 'applied', 'not applied' or 'applying'")
-        
-        self.applicant_state[ip_address] = status
+
+        session = self.session_store.get(ip_address) or ApplicantSession()
+        session.status = status
+        self.session_store.put(ip_address, session)
 
     # Start or restart a conversation with the applicant by creating a JobScreeningAssistant instance
     def start_conversation(self, ip_address):
@@ -28,41 +37,65 @@ class ApplicantManager:
         For the student training use case, we want to allow many practice runs.
         Each visit to /applicant resets the conversation state for this IP.
         """
-        self.set_applicant_status(ip_address, 'applying')
-        self.applicant_job_assistant[ip_address] = JobScreeningAssistant()
-        self.applicant_timer[ip_address] = DeltaTimeRecorder()
+        job_assistant = JobScreeningAssistant(background_evaluations=self.background_evaluations)
+        self.session_store.put(ip_address, ApplicantSession('applying', job_assistant, DeltaTimeRecorder()))
+        self.sessions_created += 1
 
     # End the conversation for the applicant by removing their JobScreeningAssistant instance
     def end_conversation(self, ip_address):
         if self.get_applicant_status(ip_address) != 'applying':
             print(f"Applicant {ip_address} is not in conversation.")
             return
-        
-        self.set_applicant_status(ip_address, 'not applied')
-        del self.applicant_job_assistant[ip_address]
-        del self.applicant_timer[ip_address]
+
+        # 'not applied' is the default status, so nothing needs to be kept
+        self.session_store.delete(ip_address)
 
     # Get the JobScreeningAssistant instance for the applicant
+    # With a shared store this is a copy; pass it to save_conversation once the turn is over
     def get_job_assistant(self, ip_address):
-        if self.get_applicant_status(ip_address) != 'applying':
-            raise ValueError(f"Applicant {ip_address} is not currently applying.") 
-        
-        job_assistant = self.applicant_job_assistant[ip_address]
-        job_assistant.candidate.conversation_duration = self.get_conversation_duration(ip_address)
+        with span("session.get"):
+            session = self._get_applying_session(ip_address)
+        if session is None:
+            raise ValueError(f"Applicant {ip_address} is not currently applying.")
+
+        job_assistant = session.job_assistant
+        job_assistant.candidate.conversation_duration = session.timer.get_delta_str()
         return job_assistant
-    
+
+    # Write the applicant's conversation back to the session store after a turn
+    # Does nothing if the conversation was ended or restarted (e.g. by a page reload) in the meantime
+    def save_conversation(self, ip_address, job_assistant):
+        with span("session.save"):
+            session = self._get_applying_session(ip_address)
+            if session is None or session.job_assistant.conversation_id != job_assistant.conversation_id:
+                return
+
+            session.job_assistant = job_assistant
+            self.session_store.put(ip_address, session)
+
     # Get the conversation duration for the applicant in datetime format, 0 for unfinished conversations and -1 for finished conversations
     def get_conversation_duration(self, ip_address):
-        if self.get_applicant_status(ip_address) != 'applying':
+        session = self._get_applying_session(ip_address)
+        if session is None:
             return "0h 0m 0s"
-        
-        return self.applicant_timer[ip_address].get_delta_str()
-    
+
+        return session.timer.get_delta_str()
+
     # Stop conversation timer for the applicant
     def stop_conversation_timer(self, ip_address):
-        if self.get_applicant_status(ip_address) != 'applying':
+        session = self._get_applying_session(ip_address)
+        if session is None:
             return
-        
-        self.applicant_timer[ip_address].update()
-        
 
+        session.timer.update()
+        self.session_store.put(ip_address, session)
+
+    # Session counts, memory use and eviction counters for the health endpoint
+    def stats(self):
+        stats = self.session_store.stats()
+        stats["created"] = self.sessions_created
+        return stats
+
+    def _get_applying_session(self, ip_address):
+        session = self.session_store.get(ip_address)
+        return session if session is not None and session.status == 'applying' else None
@@ -0,0 +1,70 @@
+import json
+import sys
+import threading
+from collections import OrderedDict
+
+# This class is a thread-safe LRU cache bounded by an approximate byte budget rather than an entry count
+# Assessment files never change once written, so callers key entries on file identity (path, mtime, size)
+# and a stale entry simply stops being looked up and ages out
+class AssessmentCache:
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    # Return the cached value for key (marking it most recently used), or None on a miss
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    # Store a value, evicting least recently used entries until the cache fits its byte budget
+    def put(self, key, value, size=None):
+        size = estimate_size(value) if size is None else size
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
+
+
+# Approximate memory footprint of a cached value in bytes
+def estimate_size(value):
+    if isinstance(value, str):
+        return sys.getsizeof(value)
+    return len(json.dumps(value))
@@ -1,188 +1,435 @@
 import re
 import os
+import copy
+import hashlib
+import json
+import time
 from datetime import datetime
-from src.server.AIAssessmentCompiler import compile_AI_assessment
+from bondsai.config import config
+from server.Metrics import ASSESSMENT_PARSE_SECONDS
+from server.ProcessWide import process_wide
+from server.Tracing import span
+from server.AIAssessmentCompiler import compile_AI_assessment
+from server.AssessmentCache import AssessmentCache
 
+
+# Return the process-wide cache of parsed assessments, creating it from config on first use
+@process_wide
+def get_assessment_cache():
+    return AssessmentCache(config.assessment_cache_bytes)
+
+# Cache key identifying one version of a file; a rewritten file gets a new key and is re-read
+# Parsed entries also depend on the JSON sidecar, so its identity is part of their key
+def _file_cache_key(kind, filepath):
+    stat = os.stat(filepath)
+    key = (kind, os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
+    if kind == 'parsed':
+        try:
+            sidecar_stat = os.stat(sidecar_path(filepath))
+            key += (sidecar_stat.st_mtime_ns, sidecar_stat.st_size)
+        except FileNotFoundError:
+            pass
+    return key
+
+# Parse an assessment file into candidate data, reusing the cached result while the file is unchanged
+# Callers get their own copy, so adding keys to the result never touches the cache
 def parse_assessment_file(filepath):
     try:
+        key = _file_cache_key('parsed', filepath)
+    except OSError as e:
+        print(f"Error parsing assessment file {filepath}: {str(e)}")
+        return None
+    
+    cache = get_assessment_cache()
+    candidate_data = cache.get(key)
+    if candidate_data is None:
+        with span("assessment.parse", file=os.path.basename(filepath)):
+            candidate_data = _parse_assessment_file(filepath)
+        if candidate_data is None:
+            return None
+        cache.put(key, candidate_data)
+    
+    return copy.deepcopy(candidate_data)
+
+# Version of the JSON sidecar format written next to each assessment
+SIDECAR_VERSION = 1
+
+# Section headings of the assessment report and the candidate_data key each one fills
+SECTION_KEYWORDS = [
+    ("technical skills", "technical_skills"),
+    ("behavioral", "behavioral_traits"),
+    ("behavioural", "behavioral_traits"),
+    ("cultural", "cultural_fit"),
+    ("soft skills", "soft_skills"),
+    ("overall", "overall"),
+]
+
+# Skill bullets in each section, matched by keyword against the bullet's label
+SKILL_KEYWORDS = {
+    "technical_skills": [
+        ("quantitative_reasoning", ("quantitative", "analytical")),
+        ("programming", ("programming", "hard skill")),
+        ("market_knowledge", ("market", "industry")),
+        ("data_analysis", ("data", "information")),
+    ],
+    "behavioral_traits": [
+        ("problem_solving", ("problem",)),
+        ("teamwork", ("teamwork",)),
+        ("initiative", ("initiative",)),
+        ("resilience", ("resilience",)),
+        ("adaptability", ("adaptability",)),
+    ],
+    "cultural_fit": [
+        ("collaborative_thinking", ("collaborative",)),
+        ("continuous_learning", ("learning",)),
+        ("challenge_seeking", ("challenge",)),
+        ("entrepreneurial_spirit", ("entrepreneurial",)),
+    ],
+    "soft_skills": [
+        ("communication", ("communication",)),
+        ("decision_making", ("decision",)),
+        ("time_management", ("time",)),
+        ("leadership", ("leadership",)),
+    ],
+}
+
+# Labels in the Overall Assessment section that start a list of insights
+INSIGHT_KEYWORDS = [
+    ("strength", "strengths"),
+    ("areas for improvement", "weaknesses"),
+    ("weakness", "weaknesses"),
+    ("recommend", "recommendations"),
+]
+
+HEADING_PATTERN = re.compile(r'^(?:#{1,6}|\*\*\s*\d+\.|\d+\.\s*\*\*)')
+BOLD_LABEL_PATTERN = re.compile(r'^(?:[-*•]\s*)?\*\*(?P<label>[^*]+?)\*\*\s*:?(?P<rest>.*)$')
+PLAIN_LABEL_PATTERN = re.compile(r'^(?:[-*•]\s*)?(?P<label>[A-Za-z][^:*]{0,60}):(?P<rest>.*)$')
+LEADING_NUMBER_PATTERN = re.compile(r'^[\s*(]*(\d+)')
+LIST_MARKER_PATTERN = re.compile(r'^(?:[-*•]|\d+\.)\s*')
+FILENAME_PATTERN = re.compile(r'^(?P<name>.+?)_assessment_(?:(?P<date>\d{8})_\d{6}\.txt$)?')
+STRUCTURED_BLOCK_PATTERN = re.compile(r'```json\s*(.*?)(?:```|$)', re.DOTALL)
+COUNT_PATTERN = re.compile(r'Interview Length: (\d+) exchanges')
+DURATION_PATTERN = re.compile(r'Conversation Duration: (\d+)h (\d+)m (\d+)s')
+TRANSCRIPT_MESSAGE_PATTERN = re.compile(r'^(\d+)\. (USER|ASSISTANT|SYSTEM): ', re.MULTILINE)
+
+def _empty_candidate_data(candidate_name, interview_date):
+    return {
+        "name": candidate_name,
+        "interview_date": interview_date,
+        "conversation_count": 0,
+        "conversation_duration": "0h 0m 0s",
+        "final_score": 0,
+        "technical_skills": {
+            "quantitative_reasoning": 0,
+            "programming": 0,
+            "market_knowledge": 0,
+            "data_analysis": 0
+        },
+        "behavioral_traits": {
+            "problem_solving": 0,
+            "teamwork": 0,
+            "initiative": 0,
+            "resilience": 0,
+            "adaptability": 0
+        },
+        "cultural_fit": {
+            "collaborative_thinking": 0,
+            "continuous_learning": 0,
+            "challenge_seeking": 0,
+            "entrepreneurial_spirit": 0
+        },
+        "soft_skills": {
+            "communication": 0,
+            "decision_making": 0,
+            "time_management": 0,
+            "leadership": 0
+        },
+        "insights": {
+            "strengths": [],
+            "weaknesses": [],
+            "recommendations": []
+        }
+    }
+
+# Candidate name and interview date encoded in an assessment filename
+def _filename_info(filepath):
+    filename_match = FILENAME_PATTERN.search(os.path.basename(filepath))
+    candidate_name = filename_match.group('name').replace('_', ' ').title() if filename_match else "Anonymous"
+    if filename_match and filename_match.group('date'):
+        interview_date = datetime.strptime(filename_match.group('date'), '%Y%m%d').strftime('%Y-%m-%d')
+    else:
+        interview_date = "Unknown"
+    return candidate_name, interview_date
+
+# The assessment is everything between the header and transcript, or None without both markers
+def _assessment_slice(content):
+    assessment_start = content.find("Generated on:")
+    transcript_start = content.find("Full Interview Transcript:")
+    if assessment_start != -1 and transcript_start != -1:
+        return content[assessment_start:transcript_start].strip()
+    return None
+
+# Rebuild the chat messages of a report from its "Full Interview Transcript" section; [] without one
+# Messages were written as "<n>. <ROLE>: <content>", so one runs until the line starting the next number
+def parse_transcript(content):
+    transcript_start = content.find("Full Interview Transcript:")
+    if transcript_start == -1:
+        return []
+    
+    messages = []
+    starts = []
+    for match in TRANSCRIPT_MESSAGE_PATTERN.finditer(content, transcript_start):
+        if int(match.group(1)) == len(starts) + 1:
+            starts.append(match)
+    for i, match in enumerate(starts):
+        end = starts[i + 1].start() if i + 1 < len(starts) else len(content)
+        messages.append({"role": match.group(2).lower(), "content": content[match.end():end].strip()})
+    return messages
+
+def _parse_assessment_file(filepath):
+    started = time.perf_counter()
+    try:
+        # Scores from the JSON sidecar are exact; only reports without one are read and parsed
+        candidate_data = read_assessment_sidecar(filepath)
+        source = 'sidecar'
+        if candidate_data is None:
+            source = 'text'
+            with open(filepath, 'r', encoding='utf-8') as f:
+                content = f.read()
+            candidate_data = parse_assessment_content(filepath, content)
+        
+        ASSESSMENT_PARSE_SECONDS.observe(time.perf_counter() - started, source=source)
+        return candidate_data
+        
+    except Exception as e:
+        print(f"Error parsing assessment file {filepath}: {str(e)}")
+        return None
+
+# Parse the text of a report into candidate data, ignoring any sidecar
+# Without the header and transcript markers only the header fields are read
+def parse_assessment_content(filepath, content):
+    candidate_data = _empty_candidate_data(*_filename_info(filepath))
+    assessment_text = _assessment_slice(content)
+    if assessment_text is not None:
+        parse_assessment_text(assessment_text, candidate_data)
+    else:
+        parse_assessment_text(content, candidate_data, header_only=True)
+    return candidate_data
+
+# Parse a report's text again, bypassing the cache, and rewrite its sidecar, e.g. after a parser change
+# Sidecars holding the model's own scores are kept, since the text only restates them, and reports
+# without a sidecar are left without one; returns the candidate data, or None if it cannot be read
+def reparse_assessment_file(filepath):
+    try:
+        candidate_data = read_assessment_sidecar(filepath)
+        if candidate_data is not None and candidate_data.get("score_source") == "model":
+            return candidate_data
+        
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
+        parsed = parse_assessment_content(filepath, content)
+        if candidate_data is not None:
+            parsed["score_source"] = "parsed"
+            parsed["version"] = SIDECAR_VERSION
+            write_assessment_sidecar(filepath, parsed)
+        return parsed
         
-        # Extract basic info from filename and content
-        filename = os.path.basename(filepath)
-        name_match = re.search(r'^(.+?)_assessment_', filename)
-        candidate_name = name_match.group(1).replace('_', ' ').title() if name_match else "Anonymous"
-        
-        # Extract interview date from filename
-        date_match = re.search(r'_(\d{8})_\d{6}\.txt$', filename)
-        if date_match:
-            date_str = date_match.group(1)
-            interview_date = datetime.strptime(date_str, '%Y%m%d').strftime('%Y-%m-%d')
-        else:
-            interview_date = "Unknown"
+    except Exception as e:
+        print(f"Error re-parsing assessment file {filepath}: {str(e)}")
+        return None
+
+# Path of the JSON sidecar that sits next to an assessment .txt file
+def sidecar_path(filepath):
+    return os.path.splitext(filepath)[0] + ".json"
+
+# Load the structured candidate data written next to an assessment, or None if there is none
+def read_assessment_sidecar(filepath):
+    try:
+        with open(sidecar_path(filepath), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Error reading assessment sidecar for {filepath}: {str(e)}")
+        return None
+
+def write_assessment_sidecar(filepath, candidate_data):
+    with open(sidecar_path(filepath), 'w', encoding='utf-8') as f:
+        json.dump(candidate_data, f, indent=2)
+
+# Split the fenced ```json block the model appends to its report from the markdown around it
+# Returns (markdown, structured dict or None); a truncated or malformed block is dropped
+def split_structured_assessment(report):
+    matches = list(STRUCTURED_BLOCK_PATTERN.finditer(report))
+    if not matches:
+        return report.strip(), None
+    
+    match = matches[-1]
+    markdown = (report[:match.start()] + report[match.end():]).strip()
+    try:
+        structured = json.loads(match.group(1))
+    except ValueError:
+        return markdown, None
+    return markdown, structured if isinstance(structured, dict) else None
+
+# Build the sidecar document for a new assessment
+# Scores come from the model's structured output where it supplied valid values, falling back to
+# parsing the markdown report; score_source records which one was used
+def build_assessment_document(filepath, assessment_text, structured=None):
+    candidate_data = _empty_candidate_data(*_filename_info(filepath))
+    parse_assessment_text(assessment_text, candidate_data)
+    
+    complete = bool(structured) and _merge_structured_scores(candidate_data, structured)
+    candidate_data["score_source"] = "model" if complete else "parsed"
+    candidate_data["version"] = SIDECAR_VERSION
+    return candidate_data
+
+# Copy valid scores and insights from structured output; returns True if every score was valid
+def _merge_structured_scores(candidate_data, structured):
+    complete = True
+    for section in SKILL_KEYWORDS:
+        section_scores = structured.get(section)
+        section_scores = section_scores if isinstance(section_scores, dict) else {}
+        for skill in candidate_data[section]:
+            score = valid_score(section_scores.get(skill))
+            if score is None:
+                complete = False
+            else:
+                candidate_data[section][skill] = score
+    
+    final_score = valid_score(structured.get("final_score"))
+    if final_score is None:
+        complete = False
+    else:
+        candidate_data["final_score"] = final_score
+    
+    insights = structured.get("insights")
+    if isinstance(insights, dict):
+        for insight_key in candidate_data["insights"]:
+            items = insights.get(insight_key)
+            if isinstance(items, list) and items:
+                candidate_data["insights"][insight_key] = [str(item).strip() for item in items if str(item).strip()][:5]
+    
+    return complete
+
+# A score clamped to 0-100, or None for anything that is not a number; the one score contract shared
+# by sidecars, the report builder, answer evaluations and the index's score counts
+def valid_score(value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return max(0, min(100, round(value)))
+
+# Fill candidate_data from assessment text in a single pass over its lines
+# A small state machine tracks the current report section (from the #### headings) and, in the
+# Overall Assessment, which insight list is being collected; each "- **Skill**: score" bullet is
+# mapped to its skill key within the current section
+def parse_assessment_text(text, candidate_data, header_only=False):
+    section = None
+    insight_key = None
+    insight_indent = 0
+    seen_skills = set()
+    
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
         
-        # Extract conversation count
-        conversation_count = 0
-        count_match = re.search(r'Interview Length: (\d+) exchanges', content)
-        if count_match:
-            conversation_count = int(count_match.group(1))
-
-        # Extract conversation duration
-        conversation_duration_match = re.search(r'Conversation Duration: (\d+)h (\d+)m (\d+)s', content)
-        if conversation_duration_match:
-            conversation_duration = f"{conversation_duration_match.group(1)}h {conversation_duration_match.group(2)}m {conversation_duration_match.group(3)}s"
-        else:
-            conversation_duration = "0h 0m 0s"
-
-        final_score = 0
-        final_score_match = re.search(r'Final Score: (\d+)', content.replace('**', ''))
-        if final_score_match:
-            final_score = int(final_score_match.group(1))
+        # Header fields
+        if line.startswith("Interview Length:"):
+            count_match = COUNT_PATTERN.match(line)
+            if count_match:
+                candidate_data["conversation_count"] = int(count_match.group(1))
+            continue
+        if line.startswith("Conversation Duration:"):
+            duration_match = DURATION_PATTERN.match(line)
+            if duration_match:
+                candidate_data["conversation_duration"] = f"{duration_match.group(1)}h {duration_match.group(2)}m {duration_match.group(3)}s"
+            continue
         
-        # Initialize default scores
-        candidate_data = {
-            "name": candidate_name,
-            "interview_date": interview_date,
-            "conversation_count": conversation_count,
-            "conversation_duration": conversation_duration,
-            "final_score": final_score,
-            "technical_skills": {
-                "quantitative_reasoning": 0,
-                "programming": 0,
-                "market_knowledge": 0,
-                "data_analysis": 0
-            },
-            "behavioral_traits": {
-                "problem_solving": 0,
-                "teamwork": 0,
-                "initiative": 0,
-                "resilience": 0,
-                "adaptability": 0
-            },
-            "cultural_fit": {
-                "collaborative_thinking": 0,
-                "continuous_learning": 0,
-                "challenge_seeking": 0,
-                "entrepreneurial_spirit": 0
-            },
-            "soft_skills": {
-                "communication": 0,
-                "decision_making": 0,
-                "time_management": 0,
-                "leadership": 0
-            },
-            "insights": {
-                "strengths": [],
-                "weaknesses": [],
-                "recommendations": []
-            },
-            "ai_assessment": ""
-        }
+        # Section headings
+        if HEADING_PATTERN.match(line):
+            heading_section = _section_for_heading(line)
+            if heading_section:
+                section = heading_section
+                insight_key = None
+                continue
         
-        # Try to extract AI assessment content (everything between the header and transcript)
-        assessment_start = content.find("Generated on:")
-        transcript_start = content.find("Full Interview Transcript:")
+        # Every label line has a colon, so most feedback prose skips the label patterns entirely
+        label, rest = _split_label(line) if ':' in line else (None, "")
+        indent = len(raw_line) - len(raw_line.lstrip())
         
-        if assessment_start != -1 and transcript_start != -1:
-            ai_assessment = content[assessment_start:transcript_start].strip()
-            candidate_data["ai_assessment"] = compile_AI_assessment(ai_assessment)
-            
-            # Try to extract scores using regex patterns
-            # Look for patterns like "Technical Skills Assessment (0-100 for each):"
-            # followed by skill names and scores
-            
-            # Extract final score
-            final_score_match = re.search(r'Final Score[:\s]+(\d+)', ai_assessment, re.IGNORECASE)
-            if final_score_match:
-                candidate_data["final_score"] = int(final_score_match.group(1))
-            
-            # Extract technical skills scores
-            tech_section = re.search(r'Technical Skills.*?(?=Behavioral|Cultural|Soft|Overall|$)', ai_assessment, re.DOTALL | re.IGNORECASE)
-            if tech_section:
-                tech_text = tech_section.group(0)
-                candidate_data["technical_skills"]["quantitative_reasoning"] = extract_score(tech_text, "quantitative")
-                candidate_data["technical_skills"]["programming"] = extract_score(tech_text, "programming")
-                candidate_data["technical_skills"]["market_knowledge"] = extract_score(tech_text, "market")
-                candidate_data["technical_skills"]["data_analysis"] = extract_score(tech_text, "data")
-            
-            # Extract behavioral traits scores
-            behavioral_section = re.search(r'Behavioral.*?(?=Technical|Cultural|Soft|Overall|$)', ai_assessment, re.DOTALL | re.IGNORECASE)
-            if behavioral_section:
-                behavioral_text = behavioral_section.group(0)
-                candidate_data["behavioral_traits"]["problem_solving"] = extract_score(behavioral_text, "problem")
-                candidate_data["behavioral_traits"]["teamwork"] = extract_score(behavioral_text, "teamwork")
-                candidate_data["behavioral_traits"]["initiative"] = extract_score(behavioral_text, "initiative")
-                candidate_data["behavioral_traits"]["resilience"] = extract_score(behavioral_text, "resilience")
-                candidate_data["behavioral_traits"]["adaptability"] = extract_score(behavioral_text, "adaptability")
-            
-            # Extract cultural fit scores
-            cultural_section = re.search(r'Cultural.*?(?=Technical|Behavioral|Soft|Overall|$)', ai_assessment, re.DOTALL | re.IGNORECASE)
-            if cultural_section:
-                cultural_text = cultural_section.group(0)
-                candidate_data["cultural_fit"]["collaborative_thinking"] = extract_score(cultural_text, "collaborative")
-                candidate_data["cultural_fit"]["continuous_learning"] = extract_score(cultural_text, "learning")
-                candidate_data["cultural_fit"]["challenge_seeking"] = extract_score(cultural_text, "challenge")
-                candidate_data["cultural_fit"]["entrepreneurial_spirit"] = extract_score(cultural_text, "entrepreneurial")
+        if label:
+            label_lower = label.lower()
+            if "final score" in label_lower:
+                score = _leading_number(rest)
+                if score is not None:
+                    candidate_data["final_score"] = score
+                insight_key = None
+                continue
             
-            # Extract soft skills scores
-            soft_section = re.search(r'Soft Skills.*?(?=Technical|Behavioral|Cultural|Overall|$)', ai_assessment, re.DOTALL | re.IGNORECASE)
-            if soft_section:
-                soft_text = soft_section.group(0)
-                candidate_data["soft_skills"]["communication"] = extract_score(soft_text, "communication")
-                candidate_data["soft_skills"]["decision_making"] = extract_score(soft_text, "decision")
-                candidate_data["soft_skills"]["time_management"] = extract_score(soft_text, "time")
-                candidate_data["soft_skills"]["leadership"] = extract_score(soft_text, "leadership")
+            if header_only:
+                continue
             
-            # Extract insights from Overall Assessment section
-            overall_section = re.search(r'####?\s*5\.\s*Overall Assessment.*?(?=####?\s*[1-4]\.|$)', ai_assessment, re.DOTALL | re.IGNORECASE)
-            if overall_section:
-                overall_text = overall_section.group(0)
-                
-                # Extract strengths
-                strengths_match = re.search(r'(?:Key )?Strengths?[:\s]+(.*?)(?=Areas|Weaknesses|Recommended|Final|$)', overall_text, re.DOTALL | re.IGNORECASE)
-                if strengths_match:
-                    strengths_text = strengths_match.group(1)
-                    candidate_data["insights"]["strengths"] = extract_list_items(strengths_text)
-                
-                # Extract areas for improvement
-                weaknesses_match = re.search(r'Areas for Improvement[:\s]+(.*?)(?=Recommended|Strengths|Final|$)', overall_text, re.DOTALL | re.IGNORECASE)
-                if weaknesses_match:
-                    weaknesses_text = weaknesses_match.group(1)
-                    candidate_data["insights"]["weaknesses"] = extract_list_items(weaknesses_text)
-                
-                # Extract recommended future steps
-                recommendations_match = re.search(r'Recommended Future Steps[:\s]+(.*?)(?=Strengths|Areas|Final|$)', overall_text, re.DOTALL | re.IGNORECASE)
-                if recommendations_match:
-                    recommendations_text = recommendations_match.group(1)
-                    candidate_data["insights"]["recommendations"] = extract_list_items(recommendations_text)
-                else:
-                    # Fallback to old format
-                    recommendations_match = re.search(r'Recommendations?[:\s]+(.*?)(?=Strengths|Weaknesses|Areas|Final|$)', overall_text, re.DOTALL | re.IGNORECASE)
-                    if recommendations_match:
-                        recommendations_text = recommendations_match.group(1)
-                        candidate_data["insights"]["recommendations"] = extract_list_items(recommendations_text)
+            if section == "overall":
+                new_insight_key = _insight_key(label_lower)
+                if new_insight_key:
+                    insight_key = new_insight_key
+                    insight_indent = indent
+                    _add_insight(candidate_data, insight_key, rest)
+                    continue
+            elif section in SKILL_KEYWORDS:
+                score = _leading_number(rest)
+                if score is not None:
+                    skill = _skill_key(section, label_lower)
+                    if skill and (section, skill) not in seen_skills:
+                        candidate_data[section][skill] = score
+                        seen_skills.add((section, skill))
+                    continue
         
-        return candidate_data
-        
-    except Exception as e:
-        print(f"Error parsing assessment file {filepath}: {str(e)}")
-        return None
-
-# Extract a score for a specific skill from text.
-def extract_score(text, skill_keyword):
-    # Look for patterns like "Programming: 85" or "Programming Skills: 85/100"
-    pattern = rf'{skill_keyword}[^:]*:\s*(\d+)'
-    match = re.search(pattern, text, re.IGNORECASE)
-    if match:
-        return int(match.group(1))
-    
-    # Look for patterns like "- Programming: 85"
-    pattern = rf'-\s*{skill_keyword}[^:]*:\s*(\d+)'
-    match = re.search(pattern, text, re.IGNORECASE)
-    if match:
-        return int(match.group(1))
+        # Items of the current insight list are bullets or lines nested under its label
+        if insight_key:
+            if indent > insight_indent or LIST_MARKER_PATTERN.match(line):
+                _add_insight(candidate_data, insight_key, line)
+            else:
+                insight_key = None
     
-    return 0
+    return candidate_data
+
+def _section_for_heading(line):
+    heading = line.lower()
+    for keyword, section in SECTION_KEYWORDS:
+        if keyword in heading:
+            return section
+    return None
+
+# Split a "- **Label**: rest" or "- Label: rest" line into its label and the text after it
+def _split_label(line):
+    match = BOLD_LABEL_PATTERN.match(line) or PLAIN_LABEL_PATTERN.match(line)
+    if not match:
+        return None, ""
+    return match.group('label').strip().rstrip(':'), match.group('rest').strip()
+
+def _leading_number(text):
+    match = LEADING_NUMBER_PATTERN.match(text)
+    return int(match.group(1)) if match else None
+
+def _skill_key(section, label):
+    for skill, keywords in SKILL_KEYWORDS[section]:
+        if any(keyword in label for keyword in keywords):
+            return skill
+    return None
+
+def _insight_key(label):
+    for keyword, insight_key in INSIGHT_KEYWORDS:
+        if keyword in label:
+            return insight_key
+    return None
+
+def _add_insight(candidate_data, insight_key, line):
+    items = candidate_data["insights"][insight_key]
+    item = LIST_MARKER_PATTERN.sub('', line.strip(), count=1)
+    if len(item) > 5 and len(items) < 5:  # Only include meaningful items, up to 5
+        items.append(item)
 
 # Extract list items from text (bullet points, numbered lists, etc.).
 def extract_list_items(text):
@@ -239,21 +486,49 @@ def extract_skill_feedback(category_text, skill_name):
     
     return ""
 
-# Get raw assessment text from file
+# Get raw assessment text from file, reusing the cached slice while the file is unchanged
 def get_raw_assessment_text(filepath):
     """Get the raw assessment text from a file."""
+    try:
+        key = _file_cache_key('raw', filepath)
+    except OSError as e:
+        print(f"Error reading assessment file {filepath}: {str(e)}")
+        return ""
+    
+    cache = get_assessment_cache()
+    raw_text = cache.get(key)
+    if raw_text is None:
+        raw_text = _read_raw_assessment_text(filepath)
+        if raw_text:
+            cache.put(key, raw_text)
+    
+    return raw_text
+
+# Get an assessment rendered as HTML, for showing one report on demand; listings carry no HTML
+# Rendered HTML is cached by a hash of the text, so a file that is rewritten with the same text
+# is not rendered again, and a regenerated report gets a new entry
+def get_assessment_html(filepath):
+    raw_text = get_raw_assessment_text(filepath)
+    if not raw_text:
+        return ""
+    
+    key = ('html', hashlib.sha256(raw_text.encode('utf-8')).hexdigest())
+    cache = get_assessment_cache()
+    html = cache.get(key)
+    if html is None:
+        html = compile_AI_assessment(raw_text)
+        cache.put(key, html)
+    
+    return html
+
+def _read_raw_assessment_text(filepath):
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
         
         # Extract just the assessment part (before transcript)
-        assessment_start = content.find("Generated on:")
-        transcript_start = content.find("Full Interview Transcript:")
-        
-        if assessment_start != -1 and transcript_start != -1:
-            return content[assessment_start:transcript_start].strip()
-        
-        return content
+        assessment_text = _assessment_slice(content)
+        return content if assessment_text is None else assessment_text
     except Exception as e:
         print(f"Error reading assessment file {filepath}: {str(e)}")
         return ""
\ No newline at end of file
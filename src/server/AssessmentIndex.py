@@ -0,0 +1,323 @@
+import base64
+import binascii
+import json
+import os
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from bondsai.config import config
+from server.AssessmentFileLoader import parse_assessment_file, valid_score
+from server.ProcessWide import process_wide
+from server.SqliteConnections import SqliteConnections
+
+# Below this many files a process pool costs more to start than it saves
+PARALLEL_PARSE_THRESHOLD = 32
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assessments (
+    filename TEXT PRIMARY KEY,
+    filepath TEXT NOT NULL,
+    name TEXT NOT NULL,
+    interview_date TEXT NOT NULL,
+    interview_ts TEXT NOT NULL,
+    final_score INTEGER NOT NULL,
+    conversation_count INTEGER NOT NULL,
+    conversation_duration TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_assessments_ts ON assessments (interview_ts, filename);
+CREATE TABLE IF NOT EXISTS index_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL,
+    modified REAL NOT NULL
+);
+INSERT OR IGNORE INTO index_state VALUES (1, 0, (julianday('now') - 2440587.5) * 86400.0);
+CREATE TABLE IF NOT EXISTS score_counts (
+    week TEXT NOT NULL,
+    skill TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (week, skill, score)
+) WITHOUT ROWID;
+"""
+
+# Bumped (as PRAGMA user_version) when rows already indexed have to be filled in or rewritten
+SCHEMA_VERSION = 2
+
+# Sections of candidate data whose skill scores are counted in score_counts, with the final score
+SCORED_SECTIONS = ('technical_skills', 'behavioral_traits', 'cultural_fit', 'soft_skills')
+
+# This class keeps an on-disk SQLite index of parsed assessment files
+# Each row holds the scores and metadata used for sorting and filtering, plus the full parsed
+# candidate data as JSON, so listing applicants is one indexed query instead of parsing every file
+# Reports are added as they are saved; sync() picks up files written by other means and can
+# parse them across a process pool
+# Every write bumps a version and records its time in the same transaction (see state()), so
+# clients can tell whether anything changed without the rows being read
+# Every write also updates score_counts, the number of reports from each interview week that gave
+# each skill each score, so cohort statistics are computed from at most 101 counts per skill and
+# week rather than from every report, and adding a report costs one small update per skill
+class AssessmentIndex:
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._connections = SqliteConnections(db_path, SCHEMA, on_open=_upgrade_if_needed)
+        self._sync_lock = threading.Lock()
+        self._synced = False
+
+    def _connect(self):
+        return self._connections.get()
+
+    # Insert or replace the index row for one parsed assessment file
+    def add(self, filepath, candidate_data):
+        self.add_many([(filepath, candidate_data)])
+
+    def add_many(self, parsed_files):
+        # Keyed by filename, so a report listed twice is counted once, as its last version
+        rows = list({row[0]: row for row in (_to_row(filepath, data) for filepath, data in parsed_files if data)}.values())
+        if not rows:
+            return
+        conn = self._connect()
+        with conn:
+            # Rows being replaced stop counting towards the score distribution before their new versions do
+            _count_scores(conn, _indexed_rows(conn, [row[0] for row in rows]), -1)
+            conn.executemany(
+                "INSERT OR REPLACE INTO assessments VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            _count_scores(conn, [(row[4], row[8]) for row in rows], 1)
+            _touch(conn)
+
+    # Parse one assessment file and add it to the index
+    def index_file(self, filepath):
+        candidate_data = parse_assessment_file(filepath)
+        if candidate_data:
+            self.add(filepath, candidate_data)
+        return candidate_data
+
+    def remove(self, filenames):
+        conn = self._connect()
+        with conn:
+            _count_scores(conn, _indexed_rows(conn, list(filenames)), -1)
+            conn.executemany("DELETE FROM assessments WHERE filename = ?", [(f,) for f in filenames])
+            _touch(conn)
+
+    # Return the most recent assessments in ascending interview order, as parsed candidate data
+    def latest(self, limit=5):
+        return self.page(limit)[0]
+
+    # Return one page of assessments and the cursor for the next (older) page, or None after the last
+    # Pages walk back through (interview_ts, filename) from the newest report and are keyset paginated,
+    # so each one is a single indexed range scan however deep it is; each page is in ascending order
+    # Filters: case-insensitive name substring, inclusive date range (date objects), minimum final score
+    def page(self, limit=5, cursor=None, name=None, date_from=None, date_to=None, min_score=None):
+        clauses, params = [], []
+        if cursor:
+            clauses.append("(interview_ts, filename) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+        if name:
+            clauses.append("name LIKE ? ESCAPE '\\'")
+            params.append("%" + re.sub(r'([\\%_])', r'\\\1', name) + "%")
+        if date_from:
+            clauses.append("interview_ts >= ?")
+            params.append(date_from.strftime('%Y%m%d'))
+        if date_to:
+            clauses.append("interview_ts < ?")
+            params.append((date_to + timedelta(days=1)).strftime('%Y%m%d'))
+        if min_score is not None:
+            clauses.append("final_score >= ?")
+            params.append(min_score)
+
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        # One extra row tells whether another page follows
+        rows = self._connect().execute(
+            "SELECT filepath, data, interview_ts, filename FROM assessments" + where +
+            " ORDER BY interview_ts DESC, filename DESC LIMIT ?",
+            params + [limit + 1]
+        ).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1][2], rows[-1][3])
+        return [_from_row(filepath, data) for filepath, data, _, _ in reversed(rows)], next_cursor
+
+    # (version, modified) of the last write to the index by any process; modified is a Unix timestamp
+    def state(self):
+        return self._connect().execute("SELECT version, modified FROM index_state WHERE id = 1").fetchone()
+
+    def count(self):
+        return self._connect().execute("SELECT COUNT(*) FROM assessments").fetchone()[0]
+
+    # (week, skill, score, count) for every score given by indexed reports; week is the Monday of the
+    # interview week as YYYY-MM-DD ('' for undated reports) and skill is a skill key or 'final_score'
+    # With recent_weeks, only the last recent_weeks weeks up to the latest interview are kept apart, and
+    # older weeks are summed into the undated ones, so the rows returned do not grow with the history
+    def score_counts(self, recent_weeks=None):
+        conn = self._connect()
+        latest = conn.execute("SELECT MAX(week) FROM score_counts").fetchone()[0]
+        if recent_weeks is None or not latest:
+            return conn.execute("SELECT week, skill, score, count FROM score_counts").fetchall()
+
+        since = (datetime.strptime(latest, '%Y-%m-%d') - timedelta(weeks=recent_weeks - 1)).strftime('%Y-%m-%d')
+        return conn.execute(
+            "SELECT week, skill, score, count FROM score_counts WHERE week >= ? "
+            "UNION ALL SELECT '', skill, score, SUM(count) FROM score_counts WHERE week < ? GROUP BY skill, score",
+            (since, since)
+        ).fetchall()
+
+    # Bring the index in line with the assessment store: parse reports that are not indexed yet (in
+    # parallel when there are many), repoint rows of reports that have moved (e.g. by migration),
+    # and drop rows whose files are gone
+    def sync(self, store, workers=None):
+        on_disk = {os.path.basename(path): path for path in store.iter_reports()}
+        indexed = dict(self._connect().execute("SELECT filename, filepath FROM assessments"))
+
+        missing = [path for name, path in on_disk.items() if name not in indexed]
+        if missing:
+            self.add_many(zip(missing, parse_files(missing, workers)))
+
+        moved = [(path, name) for name, path in on_disk.items() if name in indexed and indexed[name] != path]
+        if moved:
+            conn = self._connect()
+            with conn:
+                conn.executemany("UPDATE assessments SET filepath = ? WHERE filename = ?", moved)
+                _touch(conn)
+
+        stale = indexed.keys() - on_disk.keys()
+        if stale:
+            self.remove(stale)
+
+        return len(missing), len(moved), len(stale)
+
+    # Sync once per process, the first time the index is needed
+    def sync_once(self, store, workers=None):
+        with self._sync_lock:
+            if not self._synced:
+                self.sync(store, workers)
+                self._synced = True
+
+    # Drop every row and re-parse every stored report
+    def rebuild(self, store, workers=None):
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM assessments")
+            conn.execute("DELETE FROM score_counts")
+            _touch(conn)
+        return self.sync(store, workers)
+
+
+# Parse assessment files, across a process pool when there are enough of them to be worth it
+def parse_files(filepaths, workers=None):
+    if len(filepaths) < PARALLEL_PARSE_THRESHOLD or workers == 1:
+        return [parse_assessment_file(path) for path in filepaths]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(parse_assessment_file, filepaths, chunksize=16))
+
+# Cursors are opaque to clients: the (interview_ts, filename) of the last row of a page
+def encode_cursor(interview_ts, filename):
+    return base64.urlsafe_b64encode(f"{interview_ts}|{filename}".encode('utf-8')).decode('ascii')
+
+# Raises ValueError for a cursor that was not produced by encode_cursor
+def decode_cursor(cursor):
+    try:
+        interview_ts, filename = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8').split('|', 1)
+    except (UnicodeError, binascii.Error, ValueError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return interview_ts, filename
+
+# Record a write to the index, inside the caller's transaction
+def _touch(conn):
+    conn.execute("UPDATE index_state SET version = version + 1, modified = ? WHERE id = 1", (time.time(),))
+
+def _upgrade_if_needed(conn):
+    if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        _upgrade(conn)
+
+# Bring rows indexed by an older version up to date: fill tables added since, rewrite stale data
+# The write lock is taken before the version is checked again, so only one process does the work
+def _upgrade(conn):
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            conn.execute("DELETE FROM score_counts")
+            _count_scores(conn, conn.execute("SELECT interview_ts, data FROM assessments"), 1)
+        if version < 2:
+            # Rendered reports are no longer part of the listing; they are fetched one at a time
+            conn.execute("UPDATE assessments SET data = json_remove(data, '$.ai_assessment')")
+            _touch(conn)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+# (interview_ts, data) of the indexed rows among filenames
+def _indexed_rows(conn, filenames):
+    rows = []
+    for start in range(0, len(filenames), 500):
+        batch = filenames[start:start + 500]
+        rows += conn.execute(
+            f"SELECT interview_ts, data FROM assessments WHERE filename IN ({', '.join('?' * len(batch))})", batch
+        ).fetchall()
+    return rows
+
+# Add (delta=1) or take away (delta=-1) the scores of indexed rows, given as (interview_ts, data JSON)
+def _count_scores(conn, rows, delta):
+    counts = Counter()
+    for interview_ts, data in rows:
+        counts.update(_score_keys(interview_ts, json.loads(data)))
+    if not counts:
+        return
+    conn.executemany(
+        "INSERT INTO score_counts VALUES (?, ?, ?, ?) "
+        "ON CONFLICT (week, skill, score) DO UPDATE SET count = count + excluded.count",
+        [(week, skill, score, delta * count) for (week, skill, score), count in counts.items()]
+    )
+    if delta < 0:
+        conn.executemany(
+            "DELETE FROM score_counts WHERE week = ? AND skill = ? AND score = ? AND count <= 0", list(counts)
+        )
+
+# (week, skill, score) for each score in one report's candidate data; scores are clamped to 0-100
+def _score_keys(interview_ts, data):
+    try:
+        interview_date = datetime.strptime(interview_ts[:8], '%Y%m%d').date()
+        week = (interview_date - timedelta(days=interview_date.weekday())).isoformat()
+    except ValueError:
+        week = ''
+
+    scores = [('final_score', data.get('final_score'))]
+    for section in SCORED_SECTIONS:
+        if isinstance(data.get(section), dict):
+            scores.extend(data[section].items())
+    return [(week, skill, score) for skill, score in ((skill, valid_score(score)) for skill, score in scores) if score is not None]
+
+def _to_row(filepath, data):
+    filename = os.path.basename(filepath)
+    ts_match = re.search(r'_(\d{8}_\d{6})\.txt$', filename)
+    return (
+        filename,
+        filepath,
+        data.get("name", ""),
+        data.get("interview_date", ""),
+        ts_match.group(1) if ts_match else "",
+        data.get("final_score", 0),
+        data.get("conversation_count", 0),
+        data.get("conversation_duration", ""),
+        json.dumps(data)
+    )
+
+def _from_row(filepath, data):
+    candidate_data = json.loads(data)
+    candidate_data['filepath'] = filepath
+    return candidate_data
+
+
+# Return the process-wide assessment index, creating it from config on first use
+@process_wide
+def get_assessment_index():
+    return AssessmentIndex(config.assessment_index_path)
@@ -0,0 +1,156 @@
+import asyncio
+import contextvars
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from bondsai.config import config
+from server.ProcessWide import process_wide
+from server.Tracing import span
+
+# One background assessment job and its lifecycle: 'queued' -> 'running' -> 'done' or 'failed'
+class AssessmentJob:
+    def __init__(self, job_fn):
+        self.job_id = uuid.uuid4().hex
+        self.job_fn = job_fn
+        self.status = 'queued'
+        self.attempts = 0
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+
+    def to_dict(self):
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "attempts": self.attempts,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at
+        }
+
+# This class runs assessment report generation in the background on the server's event loop
+# Jobs are async callables (called again on every retry) whose return value becomes the job result
+# A fixed number of worker tasks bounds how many reports are generated at once, failed attempts are
+# retried with exponential backoff, and job status can be read from any thread by job ID
+# With a job_store (see SessionStore) every status change is also recorded there, so other worker
+# processes can answer status polls for jobs they are not running
+class AssessmentJobQueue:
+    def __init__(self, concurrency=2, max_attempts=3, retry_delay=2.0, max_finished_jobs=1000, job_store=None):
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.max_finished_jobs = max_finished_jobs
+        self.job_store = job_store
+        self.jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._queue = None
+        self._loop = None
+        self._workers = []
+
+    # Queue a job and return its ID; must be called from the event loop that should run it
+    def submit(self, job_fn):
+        self._ensure_workers()
+        job = AssessmentJob(job_fn)
+        with self._lock:
+            self.jobs[job.job_id] = job
+            self._prune_finished_jobs()
+        self._publish(job)
+        self._queue.put_nowait(job)
+        return job.job_id
+
+    # Return the status of a job as a dict, or None if the job ID is unknown
+    def get_job(self, job_id):
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job:
+                return job.to_dict()
+        return self.job_store.get_job(job_id) if self.job_store else None
+
+    # Wait until a job has finished and return its status; intended for CLI use and shutdown
+    async def wait(self, job_id, poll_interval=0.1):
+        while True:
+            job = self.get_job(job_id)
+            if job is None or job["status"] in ('done', 'failed'):
+                return job
+            await asyncio.sleep(poll_interval)
+
+    # Start the worker tasks on the running loop (again, if the loop has changed since last time)
+    # Workers get an empty context, so jobs are traced on their own rather than under the submitting request
+    def _ensure_workers(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._workers = [
+            loop.create_task(self._worker(), context=contextvars.Context()) for _ in range(self.concurrency)
+        ]
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            try:
+                with span("assessment.job", job_id=job.job_id):
+                    await self._run_job(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job):
+        while True:
+            job.status = 'running'
+            job.attempts += 1
+            self._publish(job)
+            try:
+                result = await job.job_fn()
+            except Exception as e:
+                print(f"Assessment job {job.job_id} attempt {job.attempts} failed: {str(e)}")
+                if job.attempts < self.max_attempts:
+                    job.status = 'queued'
+                    await asyncio.sleep(self.retry_delay * 2 ** (job.attempts - 1))
+                    continue
+
+                job.status = 'failed'
+                job.error = str(e)
+            else:
+                job.status = 'done'
+                job.result = result
+
+            # The job function closes over the interview (assistant, history, transcript); only the
+            # status is kept for finished jobs, so it is dropped rather than held until pruning
+            job.job_fn = None
+            job.finished_at = time.time()
+            self._publish(job)
+            return
+
+    # Share a job's status through the job store; a failure here must not fail the job itself
+    def _publish(self, job):
+        if self.job_store is None:
+            return
+        try:
+            self.job_store.save_job(job.to_dict())
+        except Exception as e:
+            print(f"Error recording status of assessment job {job.job_id}: {str(e)}")
+
+    # Forget the oldest finished jobs once more than max_finished_jobs are being kept
+    def _prune_finished_jobs(self):
+        finished = [job_id for job_id, job in self.jobs.items() if job.status in ('done', 'failed')]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self.jobs[job_id]
+
+
+# Return the process-wide assessment job queue, creating it from config on first use
+@process_wide
+def get_assessment_queue():
+    # SessionStore imports bondsai.job_screening, which imports this module, so it is imported here
+    from server.SessionStore import get_session_store
+
+    return AssessmentJobQueue(
+        concurrency=config.assessment_workers,
+        max_attempts=config.assessment_max_attempts,
+        retry_delay=config.assessment_retry_delay,
+        job_store=get_session_store()
+    )
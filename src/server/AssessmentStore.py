@@ -0,0 +1,121 @@
+import os
+import re
+from datetime import date
+from bondsai.config import config
+from server.ProcessWide import process_wide
+
+# Assessment report filenames: <name>_assessment_<YYYYMMDD>_<HHMMSS>.txt
+REPORT_FILENAME_PATTERN = re.compile(r'^[^/\\\x00]+_assessment_[^/\\\x00]*\.txt$')
+REPORT_DATE_PATTERN = re.compile(r'_assessment_(\d{4})(\d{2})(\d{2})_\d{6}\.txt$')
+
+# Shard for reports whose filename carries no date
+UNDATED_SHARD = "undated"
+
+# This class decides where assessment reports live and is the only place paths are built from filenames
+# Reports are sharded by interview date, <root>/YYYY/MM/DD/<filename>, so no directory grows without
+# bound and a date range only touches the shards inside it; the filename alone locates a report
+# Reports saved in the old flat layout (<root>/<filename>) are still found until they are migrated
+# Each report's JSON sidecar sits next to it, so moving a report means moving both
+class AssessmentStore:
+    def __init__(self, root):
+        self.root = root
+
+    # Raises ValueError unless filename is a bare report filename (no directories, no traversal)
+    def validate_filename(self, filename):
+        if not REPORT_FILENAME_PATTERN.match(filename) or filename != os.path.basename(filename):
+            raise ValueError(f"Invalid assessment filename: {filename}")
+        return filename
+
+    # Shard directory for a report, relative to the root
+    def shard_for(self, filename):
+        match = REPORT_DATE_PATTERN.search(filename)
+        if match is None:
+            return UNDATED_SHARD
+        return os.path.join(*match.groups())
+
+    # Where a report belongs in the sharded layout (whether or not it exists yet)
+    def path_for(self, filename):
+        self.validate_filename(filename)
+        return os.path.join(self.root, self.shard_for(filename), filename)
+
+    # Path for a new report, creating its shard directory
+    def new_path(self, filename):
+        path = self.path_for(filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
+    # Path of an existing report, checking the sharded layout and then the old flat one; None if missing
+    # Raises ValueError for an invalid filename
+    def resolve(self, filename):
+        path = self.path_for(filename)
+        if os.path.isfile(path):
+            return path
+
+        legacy_path = os.path.join(self.root, filename)
+        return legacy_path if os.path.isfile(legacy_path) else None
+
+    # Yield the paths of stored reports, only scanning shards inside the date range when one is given
+    # (date_from and date_to are inclusive date objects); unsharded and undated reports are always included
+    def iter_reports(self, date_from=None, date_to=None):
+        low = date_from or date.min
+        high = date_to or date.max
+        yield from self._reports_in(self.root)
+        yield from self._reports_in(os.path.join(self.root, UNDATED_SHARD))
+
+        for year in _numbered_dirs(self.root):
+            if not low.year <= year <= high.year:
+                continue
+            year_dir = os.path.join(self.root, f"{year:04d}")
+            for month in _numbered_dirs(year_dir):
+                if not (low.year, low.month) <= (year, month) <= (high.year, high.month):
+                    continue
+                month_dir = os.path.join(year_dir, f"{month:02d}")
+                for day in _numbered_dirs(month_dir):
+                    try:
+                        in_range = low <= date(year, month, day) <= high
+                    except ValueError:
+                        continue
+                    if in_range:
+                        yield from self._reports_in(os.path.join(month_dir, f"{day:02d}"))
+
+    # Move reports saved in the flat layout into their shards; returns the number moved
+    # The sidecar moves first, so a report is never found in its new place without its scores
+    def migrate(self, dry_run=False):
+        moved = 0
+        for legacy_path in list(self._reports_in(self.root)):
+            filename = os.path.basename(legacy_path)
+            if dry_run:
+                moved += 1
+                continue
+
+            target = self.new_path(filename)
+            legacy_sidecar = os.path.splitext(legacy_path)[0] + ".json"
+            if os.path.exists(legacy_sidecar):
+                os.replace(legacy_sidecar, os.path.splitext(target)[0] + ".json")
+            os.replace(legacy_path, target)
+            moved += 1
+        return moved
+
+    def _reports_in(self, directory):
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and REPORT_FILENAME_PATTERN.match(entry.name):
+                        yield entry.path
+        except FileNotFoundError:
+            return
+
+
+# Numeric subdirectory names of a directory (year, month or day shards), ascending
+def _numbered_dirs(directory):
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(int(entry.name) for entry in entries if entry.is_dir() and entry.name.isdigit())
+    except FileNotFoundError:
+        return []
+
+
+# Return the process-wide assessment store rooted at ASSESSMENTS_DIR, creating it on first use
+@process_wide
+def get_assessment_store():
+    return AssessmentStore(config.assessments_dir)
@@ -0,0 +1,91 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+
+# This class owns a single long-lived asyncio event loop running on a background thread
+# Flask handlers are synchronous, so instead of creating and closing a new event loop per request
+# they submit coroutines to this loop and wait for the result. Because the loop outlives requests,
+# async clients created on it (e.g. AsyncOpenAI and its HTTP connection pool) stay usable and warm,
+# and any number of in-flight interviews share the one loop thread.
+# Coroutines run with a copy of the caller's context variables (e.g. the current trace span).
+class AsyncLoopRunner:
+    def __init__(self, name="bondsai-event-loop"):
+        self.name = name
+        self.loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    # Start the loop thread if it is not already running and return the loop
+    # Safe to call repeatedly; a forked worker process (e.g. gunicorn with --preload) gets a fresh loop
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return self.loop
+
+            self.loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            self._thread = threading.Thread(target=self._run_loop, args=(ready,), name=self.name, daemon=True)
+            self._thread.start()
+            ready.wait()
+            return self.loop
+
+    def _run_loop(self, ready):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(ready.set)
+        self.loop.run_forever()
+
+    # Run a coroutine on the shared loop and block the calling thread until it finishes
+    # Raises TimeoutError (and cancels the coroutine) if it does not finish within timeout seconds
+    def run(self, coro, timeout=None):
+        loop = self.start()
+        future = asyncio.run_coroutine_threadsafe(_in_context(coro, contextvars.copy_context()), loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Coroutine did not finish within {timeout} seconds")
+
+    # Drive an async generator on the shared loop and yield its items to the calling thread
+    # Used to stream responses from synchronous Flask handlers; closing the returned generator closes agen
+    # Every step runs in the same context, so context variables set by agen persist between items
+    def iterate(self, agen, timeout=None):
+        loop = self.start()
+        context = contextvars.copy_context()
+        try:
+            while True:
+                done, item = asyncio.run_coroutine_threadsafe(_in_context(_next_item(agen), context), loop).result(timeout)
+                if done:
+                    return
+                yield item
+        finally:
+            asyncio.run_coroutine_threadsafe(_in_context(agen.aclose(), context), loop).result(timeout)
+
+    # Schedule a coroutine on the shared loop without waiting for it
+    def submit(self, coro):
+        loop = self.start()
+        return asyncio.run_coroutine_threadsafe(_in_context(coro, contextvars.copy_context()), loop)
+
+    # Stop the loop and wait for its thread to exit
+    def stop(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                return
+
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self.loop.close()
+            self._thread = None
+
+
+# Fetch the next item of an async generator as a (done, item) pair
+# StopAsyncIteration cannot cross the thread boundary as a future result, so it is turned into a flag
+async def _next_item(agen):
+    try:
+        return False, await agen.__anext__()
+    except StopAsyncIteration:
+        return True, None
+
+# Await a coroutine as a task running in the given context rather than the loop thread's own
+async def _in_context(coro, context):
+    return await asyncio.get_running_loop().create_task(coro, context=context)
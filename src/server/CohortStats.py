@@ -0,0 +1,84 @@
+from datetime import date, timedelta
+import numpy as np
+
+# Percentiles reported for every skill
+PERCENTILES = (10, 25, 50, 75, 90)
+
+# Histogram bins of width 10 over scores 0-100; the last bin also holds 100
+HISTOGRAM_BINS = [[low, low + 9] for low in range(0, 90, 10)] + [[90, 100]]
+
+# Default and largest number of weeks a trend covers
+DEFAULT_TREND_WEEKS = 8
+MAX_TREND_WEEKS = 52
+
+# Cohort statistics for every skill from the index's score counts (see AssessmentIndex.score_counts)
+# sections maps each section of candidate data to its skill keys, in the order to report them
+# Counts go into one (week, skill, score) array, so each statistic is a single vectorised pass
+# over at most 101 scores per skill and week, however many reports there are; percentiles are
+# nearest-rank, and a trend is the mean score of each of the last `weeks` calendar weeks up to the
+# latest interview, with the change from the week before (None where a week had no interviews)
+def cohort_stats(score_counts, sections, weeks=DEFAULT_TREND_WEEKS):
+    skills = ['final_score'] + [skill for skill_keys in sections.values() for skill in skill_keys]
+    skill_index = {skill: i for i, skill in enumerate(skills)}
+    dated_weeks = sorted({week for week, _, _, _ in score_counts if week})
+    trend_weeks = _trend_weeks(dated_weeks[-1], weeks) if dated_weeks else []
+    week_index = {week: i for i, week in enumerate(trend_weeks)}
+
+    # Every week outside the trend (including undated reports) shares the last row
+    counts = np.zeros((len(trend_weeks) + 1, len(skills), 101), dtype=np.int64)
+    for week, skill, score, count in score_counts:
+        if skill in skill_index:
+            counts[week_index.get(week, len(trend_weeks)), skill_index[skill], score] += count
+
+    scores = np.arange(101)
+    totals = counts.sum(axis=0)
+    n = totals.sum(axis=1)
+    means = _safe_divide(totals @ scores, n)
+    stds = np.sqrt(np.maximum(_safe_divide(totals @ scores ** 2, n) - means ** 2, 0))
+    cumulative = totals.cumsum(axis=1)
+    percentiles = {
+        f"p{p}": (cumulative >= np.ceil(n * p / 100)[:, None].clip(min=1)).argmax(axis=1)
+        for p in PERCENTILES
+    }
+    histograms = totals[:, :100].reshape(len(skills), 10, 10).sum(axis=2)
+    histograms[:, -1] += totals[:, 100]
+
+    weekly = counts[:-1]
+    weekly_n = weekly.sum(axis=2)
+    weekly_means = _safe_divide(weekly @ scores, weekly_n)
+
+    def skill_stats(i):
+        if not n[i]:
+            return {"count": 0, "mean": None, "std": None, "percentiles": {f"p{p}": None for p in PERCENTILES},
+                    "histogram": histograms[i].tolist(), "trend": [None] * len(trend_weeks), "change": None}
+        trend = [round(float(weekly_means[w, i]), 1) if weekly_n[w, i] else None for w in range(len(trend_weeks))]
+        change = round(trend[-1] - trend[-2], 1) if len(trend) > 1 and None not in trend[-2:] else None
+        return {
+            "count": int(n[i]),
+            "mean": round(float(means[i]), 1),
+            "std": round(float(stds[i]), 1),
+            "percentiles": {key: int(values[i]) for key, values in percentiles.items()},
+            "histogram": histograms[i].tolist(),
+            "trend": trend,
+            "change": change,
+        }
+
+    stats = {"final_score": skill_stats(0), "sections": {}}
+    for section, skill_keys in sections.items():
+        stats["sections"][section] = {skill: skill_stats(skill_index[skill]) for skill in skill_keys}
+    stats.update(
+        count=int(n[0]),
+        histogram_bins=HISTOGRAM_BINS,
+        weeks=trend_weeks,
+        weekly_counts=weekly_n[:, 0].tolist(),
+    )
+    return stats
+
+# The `weeks` Mondays (YYYY-MM-DD) ending with latest, oldest first
+def _trend_weeks(latest, weeks):
+    last = date.fromisoformat(latest)
+    return [(last - timedelta(weeks=i)).isoformat() for i in range(weeks - 1, -1, -1)]
+
+# numerator / denominator, with 0 where the denominator is 0
+def _safe_divide(numerator, denominator):
+    return np.divide(numerator, denominator, out=np.zeros(np.shape(numerator)), where=denominator > 0)
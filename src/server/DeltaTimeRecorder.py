@@ -1,6 +1,8 @@
 from datetime import datetime
 
 class DeltaTimeRecorder:
+    __slots__ = ('start_time', 'end_time')
+
     def __init__(self):
         self.start_time = datetime.now()
         self.end_time = self.start_time
@@ -21,5 +23,14 @@ class DeltaTimeRecorder:
         minutes = int((delta % 3600) // 60)
         seconds = int(delta % 60)
         return f"{hours}h {minutes}m {seconds}s"
-        
-    
\ No newline at end of file
+
+    # Times are wall clock, so a recorder saved by one process can be resumed by another
+    def to_dict(self):
+        return {"start_time": self.start_time.isoformat(), "end_time": self.end_time.isoformat()}
+
+    @classmethod
+    def from_dict(cls, data):
+        recorder = cls()
+        recorder.start_time = datetime.fromisoformat(data["start_time"])
+        recorder.end_time = datetime.fromisoformat(data["end_time"])
+        return recorder
@@ -0,0 +1,189 @@
+import threading
+import time
+from contextlib import contextmanager
+
+# Latency buckets in seconds, from cached lookups up to slow assessment reports
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Base class for a metric family: one value per combination of label values
+class Metric:
+    type_name = 'untyped'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    # Lines of the Prometheus text format for this family, without the HELP/TYPE header
+    def samples(self):
+        raise NotImplementedError
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        return "\n".join(lines + self.samples())
+
+# A value that only goes up, e.g. requests served or tokens used
+class Counter(Metric):
+    type_name = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{format_labels(self.labelnames, key)} {format_value(value)}" for key, value in values]
+
+# A value that can go up and down, e.g. live sessions; set when the metrics are scraped
+class Gauge(Metric):
+    type_name = 'gauge'
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def samples(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{format_labels(self.labelnames, key)} {format_value(value)}" for key, value in values]
+
+# Observations counted into cumulative buckets, with their sum and count, e.g. request latency
+class Histogram(Metric):
+    type_name = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            self._values[key] = (counts, total + value)
+
+    # Observe how long the with-block takes, using the monotonic clock
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self):
+        with self._lock:
+            values = sorted((key, (list(counts), total)) for key, (counts, total) in self._values.items())
+
+        lines = []
+        for key, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                labels = format_labels(self.labelnames + ('le',), key + (format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+# This class holds every metric of the process and renders them for GET /api/metrics
+# Metrics are per process; with several worker processes each reports its own
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            if metric.name in self.metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    # The Prometheus text exposition format (version 0.0.4)
+    def render(self):
+        with self._lock:
+            metrics = list(self.metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+def format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+def format_labels(names, values):
+    if not names:
+        return ''
+    escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for v in values)
+    return '{' + ','.join(f'{name}="{value}"' for name, value in zip(names, escaped)) + '}'
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = registry.histogram(
+    'bondsai_http_request_duration_seconds',
+    'Time to serve an API request, until the response (or stream) is closed',
+    ('method', 'route', 'status')
+)
+HTTP_RESPONSE_BYTES = registry.counter(
+    'bondsai_http_response_bytes_total',
+    'Bytes of buffered API response bodies sent, by content coding (identity, gzip or br)',
+    ('encoding',)
+)
+LLM_REQUEST_SECONDS = registry.histogram(
+    'bondsai_llm_request_duration_seconds',
+    'Time for an LLM completion, from sending the request to the last token',
+    ('call_type',)
+)
+LLM_REQUESTS = registry.counter(
+    'bondsai_llm_requests_total',
+    'LLM completions requested, by outcome (ok, error, cancelled or cached)',
+    ('call_type', 'outcome')
+)
+LLM_TOKENS = registry.counter(
+    'bondsai_llm_tokens_total',
+    'Tokens reported in the usage of LLM responses',
+    ('call_type', 'kind')
+)
+SESSIONS = registry.gauge(
+    'bondsai_sessions',
+    'Interview sessions held by the session store, and the bytes they use',
+    ('state',)
+)
+SESSION_EVENTS = registry.gauge(
+    'bondsai_session_events',
+    'Sessions created, expired and evicted since this process started',
+    ('event',)
+)
+ASSESSMENT_PARSE_SECONDS = registry.histogram(
+    'bondsai_assessment_parse_duration_seconds',
+    'Time to load an assessment report, from its JSON sidecar or by parsing its text',
+    ('source',),
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+)
@@ -0,0 +1,19 @@
+import functools
+import threading
+
+# Decorator for the get_*() functions that return one shared instance per process (the LLM pool,
+# session store, assessment index and so on): the first call runs the decorated factory under a
+# lock, and every later call returns what it built
+def process_wide(factory):
+    instance = None
+    lock = threading.Lock()
+
+    @functools.wraps(factory)
+    def get():
+        nonlocal instance
+        with lock:
+            if instance is None:
+                instance = factory()
+            return instance
+
+    return get
@@ -0,0 +1,233 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from bondsai.config import config
+from bondsai.job_screening import JobScreeningAssistant
+from server.DeltaTimeRecorder import DeltaTimeRecorder
+from server.ProcessWide import process_wide
+from server.SqliteConnections import SqliteConnections
+
+# Approximate memory held by a session before any messages, and by each message on top of its text
+# (measured with tracemalloc; the prompt text is shared by every session and not counted)
+SESSION_BASE_BYTES = 2048
+MESSAGE_OVERHEAD_BYTES = 240
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    ip_address TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_last_seen ON sessions (last_seen);
+CREATE TABLE IF NOT EXISTS assessment_jobs (
+    job_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_assessment_jobs_updated ON assessment_jobs (updated_at);
+"""
+
+# Everything kept for one applicant: their status and, while applying, their interview and its timer
+class ApplicantSession:
+    __slots__ = ('status', 'job_assistant', 'timer', 'last_seen', 'size')
+
+    def __init__(self, status='not applied', job_assistant=None, timer=None):
+        self.status = status
+        self.job_assistant = job_assistant
+        self.timer = timer
+        self.last_seen = time.time()
+        self.size = estimate_session_size(self)
+
+    def to_dict(self):
+        return {
+            "status": self.status,
+            "job_assistant": self.job_assistant.to_dict() if self.job_assistant else None,
+            "timer": self.timer.to_dict() if self.timer else None
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        job_assistant = JobScreeningAssistant.from_dict(data["job_assistant"]) if data["job_assistant"] else None
+        timer = DeltaTimeRecorder.from_dict(data["timer"]) if data["timer"] else None
+        return cls(data["status"], job_assistant, timer)
+
+# This class keeps sessions in this process's memory, in least recently used order
+# Sessions are evicted once idle for longer than the TTL, or (oldest first) once there are more than
+# max_sessions of them or they hold more than max_bytes; get() returns the live session object
+class MemorySessionStore:
+    def __init__(self, ttl_seconds, max_sessions, max_bytes):
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.sessions = OrderedDict()
+        self.current_bytes = 0
+        self.expired = 0
+        self.evicted = 0
+        self._lock = threading.Lock()
+
+    # Return a session and mark it as just used, or None if it is unknown or has expired
+    def get(self, ip_address):
+        with self._lock:
+            self._evict()
+            session = self.sessions.get(ip_address)
+            if session is None:
+                return None
+
+            session.last_seen = time.time()
+            self.sessions.move_to_end(ip_address)
+            return session
+
+    # Store a session as the most recently used, re-estimating its size
+    def put(self, ip_address, session):
+        with self._lock:
+            self._discard(ip_address)
+            session.last_seen = time.time()
+            session.size = estimate_session_size(session)
+            self.sessions[ip_address] = session
+            self.current_bytes += session.size
+            self._evict(keep=ip_address)
+
+    def delete(self, ip_address):
+        with self._lock:
+            self._discard(ip_address)
+
+    def stats(self):
+        with self._lock:
+            self._evict()
+            return {
+                "backend": "memory",
+                "live": len(self.sessions),
+                "bytes": self.current_bytes,
+                "max_sessions": self.max_sessions,
+                "max_bytes": self.max_bytes,
+                "expired": self.expired,
+                "evicted": self.evicted
+            }
+
+    # Job status is only shared between processes by the SQLite store
+    def save_job(self, job):
+        pass
+
+    def get_job(self, job_id):
+        return None
+
+    def _discard(self, ip_address):
+        session = self.sessions.pop(ip_address, None)
+        if session is not None:
+            self.current_bytes -= session.size
+
+    # Drop expired sessions, then the least recently used ones while over the count or memory cap
+    # The session in keep (the one being served) is never evicted; caller holds the lock
+    def _evict(self, keep=None):
+        expire_before = time.time() - self.ttl_seconds
+        while self.sessions:
+            ip_address, session = next(iter(self.sessions.items()))
+            if ip_address == keep:
+                break
+
+            if session.last_seen < expire_before:
+                self.expired += 1
+            elif len(self.sessions) > self.max_sessions or self.current_bytes > self.max_bytes:
+                self.evicted += 1
+            else:
+                break
+            self._discard(ip_address)
+
+# This class keeps sessions as JSON rows in a SQLite database shared by every worker process on the
+# host, so consecutive requests from one applicant can be served by different workers
+# get() returns a fresh copy, so changes must be written back with put(); the last write wins
+# Idle sessions expire after the TTL and the least recently used are deleted past max_sessions
+# Background assessment job status is shared the same way, so any worker can answer a status poll
+class SqliteSessionStore:
+    def __init__(self, db_path, ttl_seconds, max_sessions):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self.expired = 0
+        self.evicted = 0
+        self._connections = SqliteConnections(db_path, SQLITE_SCHEMA)
+
+    def _connect(self):
+        return self._connections.get()
+
+    def get(self, ip_address):
+        row = self._connect().execute(
+            "SELECT data, last_seen FROM sessions WHERE ip_address = ?", (ip_address,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        if row[1] < time.time() - self.ttl_seconds:
+            self.delete(ip_address)
+            self.expired += 1
+            return None
+        return ApplicantSession.from_dict(json.loads(row[0]))
+
+    def put(self, ip_address, session):
+        session.last_seen = time.time()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?)",
+                (ip_address, json.dumps(session.to_dict()), session.last_seen)
+            )
+            self._evict(conn, keep=ip_address)
+
+    def delete(self, ip_address):
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM sessions WHERE ip_address = ?", (ip_address,))
+
+    def stats(self):
+        conn = self._connect()
+        live, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM sessions").fetchone()
+        return {
+            "backend": "sqlite",
+            "live": live,
+            "bytes": size,
+            "max_sessions": self.max_sessions,
+            "expired": self.expired,
+            "evicted": self.evicted
+        }
+
+    # Record the latest status of a background assessment job
+    def save_job(self, job):
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO assessment_jobs VALUES (?, ?, ?)",
+                (job["job_id"], json.dumps(job), time.time())
+            )
+            conn.execute("DELETE FROM assessment_jobs WHERE updated_at < ?", (time.time() - self.ttl_seconds,))
+
+    def get_job(self, job_id):
+        row = self._connect().execute("SELECT data FROM assessment_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    # Delete expired sessions, then the least recently used past max_sessions, within the caller's transaction
+    def _evict(self, conn, keep=None):
+        self.expired += conn.execute(
+            "DELETE FROM sessions WHERE last_seen < ? AND ip_address != ?", (time.time() - self.ttl_seconds, keep)
+        ).rowcount
+        self.evicted += conn.execute(
+            "DELETE FROM sessions WHERE ip_address IN ("
+            "SELECT ip_address FROM sessions WHERE ip_address != ? ORDER BY last_seen DESC LIMIT -1 OFFSET ?)",
+            (keep, self.max_sessions - 1)
+        ).rowcount
+
+
+# Approximate memory held by a session, dominated by its message history
+def estimate_session_size(session):
+    size = SESSION_BASE_BYTES
+    if session.job_assistant is not None:
+        size += sum(MESSAGE_OVERHEAD_BYTES + len(message["content"]) for message in session.job_assistant.messages)
+    return size
+
+
+# Return the process-wide session store selected by SESSION_BACKEND, creating it on first use
+@process_wide
+def get_session_store():
+    if config.session_backend == 'sqlite':
+        return SqliteSessionStore(config.session_db_path, config.session_ttl_seconds, config.session_max_count)
+    return MemorySessionStore(config.session_ttl_seconds, config.session_max_count, config.session_max_bytes)
@@ -0,0 +1,29 @@
+import os
+import sqlite3
+import threading
+
+# This class gives each thread its own connection to a SQLite database shared by every worker process
+# on the host, opened on first use: the database's directory is created if needed, WAL lets readers
+# carry on while another process writes, and the schema (CREATE ... IF NOT EXISTS statements) is applied
+# on_open, if given, is then called with each new connection, e.g. to upgrade an older schema
+class SqliteConnections:
+    def __init__(self, db_path, schema, on_open=None):
+        self.db_path = db_path
+        self.schema = schema
+        self.on_open = on_open
+        self._local = threading.local()
+
+    # Return this thread's connection, opening it if needed
+    def get(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.schema)
+            if self.on_open is not None:
+                self.on_open(conn)
+            self._local.conn = conn
+        return conn
@@ -0,0 +1,204 @@
+import contextvars
+import cProfile
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from bondsai.config import config
+from server.ProcessWide import process_wide
+
+# The span that new spans are nested under; each request thread and asyncio task sees its own
+_current_span = contextvars.ContextVar('bondsai_current_span', default=None)
+
+# One timed step of a request, with the steps it made nested under it
+# Times come from the monotonic perf_counter clock, so they are unaffected by wall clock changes;
+# they are only comparable within one process (DeltaTimeRecorder keeps wall clock times for that reason)
+class Span:
+    __slots__ = ('name', 'attrs', 'parent', 'children', 'start', 'end')
+
+    def __init__(self, name, parent=None, attrs=None):
+        self.name = name
+        self.attrs = attrs or {}
+        self.parent = parent
+        self.children = []
+        self.start = time.perf_counter_ns()
+        self.end = None
+
+    @property
+    def duration_ms(self):
+        end = self.end if self.end is not None else time.perf_counter_ns()
+        return (end - self.start) / 1e6
+
+    def to_dict(self, root_start=None):
+        root_start = self.start if root_start is None else root_start
+        return {
+            "name": self.name,
+            "attrs": self.attrs,
+            "offset_ms": round((self.start - root_start) / 1e6, 3),
+            "duration_ms": round(self.duration_ms, 3),
+            "children": [child.to_dict(root_start) for child in self.children]
+        }
+
+    # Indented one-line-per-span rendering for the slow request log
+    def format(self, depth=0, root_start=None):
+        root_start = self.start if root_start is None else root_start
+        attrs = " ".join(f"{key}={value}" for key, value in self.attrs.items())
+        lines = [f"{'  ' * depth}{self.name} {self.duration_ms:.1f}ms (+{(self.start - root_start) / 1e6:.1f}ms) {attrs}".rstrip()]
+        for child in self.children:
+            lines.extend(child.format(depth + 1, root_start))
+        return lines
+
+# Start a span under the current one and make it current; pair with finish_span
+# Prefer the span() context manager; this form is for spans that start and end in different hooks
+def start_span(name, **attrs):
+    parent = _current_span.get()
+    new_span = Span(name, parent, attrs)
+    if parent is not None:
+        parent.children.append(new_span)
+    _current_span.set(new_span)
+    return new_span
+
+# Start a new trace: a root span made current whatever was current before (e.g. in a reused thread)
+def start_trace(name, **attrs):
+    _current_span.set(None)
+    return start_span(name, **attrs)
+
+# End a span and make its parent current again; a finished root span is handed to the tracer
+# The parent is set rather than the previous value restored, so a span may end in a different
+# context from the one it started in (e.g. an async generator resumed by a later task)
+def finish_span(ended):
+    if ended.end is not None:
+        return
+    ended.end = time.perf_counter_ns()
+    _current_span.set(ended.parent)
+    if ended.parent is None:
+        get_tracer().record(ended)
+
+@contextmanager
+def span(name, **attrs):
+    current = start_span(name, **attrs)
+    try:
+        yield current
+    finally:
+        finish_span(current)
+
+def current_span():
+    return _current_span.get()
+
+# Server-Timing header value for a finished span's direct children, e.g. for browser dev tools
+def server_timing(root):
+    entries = []
+    for child in root.children:
+        if child.end is not None:
+            entries.append(f"{re.sub(r'[^A-Za-z0-9_.-]', '_', child.name)};dur={child.duration_ms:.1f}")
+    return ", ".join(entries)
+
+# This class keeps the most recent finished traces (root spans) for GET /api/traces
+# and prints the span tree of any trace slower than slow_ms (0 turns the log off)
+class Tracer:
+    def __init__(self, buffer_size, slow_ms):
+        self.slow_ms = slow_ms
+        self.traces = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+
+    def record(self, root):
+        with self._lock:
+            self.traces.append(root)
+        if self.slow_ms and root.duration_ms >= self.slow_ms:
+            print("Slow trace:\n" + "\n".join(root.format()))
+
+    # Recent traces taking at least min_ms, slowest first
+    def recent(self, min_ms=0, limit=50):
+        with self._lock:
+            traces = [root for root in self.traces if root.duration_ms >= min_ms]
+        traces.sort(key=lambda root: root.duration_ms, reverse=True)
+        return [root.to_dict() for root in traces[:limit]]
+
+# From Python 3.12 cProfile is built on sys.monitoring, so one profiler sees every thread and a
+# second one cannot be enabled; before that a profiler only sees the thread that enabled it
+PROFILER_SEES_ALL_THREADS = sys.version_info >= (3, 12)
+
+# This class profiles single requests with cProfile when asked to (see PROFILE_REQUESTS)
+# A request's own thread and the shared event loop thread (where interview turns and LLM calls run)
+# are both profiled into one .prof file: by one profiler from Python 3.12, otherwise by one per
+# thread, merged when writing. The loop thread's profile also catches any other request being
+# served at the same time. One request is profiled at a time; others run unprofiled
+class RequestProfiler:
+    def __init__(self, profile_dir):
+        self.profile_dir = profile_dir
+        self._lock = threading.Lock()
+
+    # Start profiling this thread and the loop's thread; returns a handle, or None if busy
+    # If a profiler cannot be enabled (e.g. another profiling tool is active) the request runs unprofiled
+    def start(self, loop=None):
+        if not self._lock.acquire(blocking=False):
+            return None
+
+        profiles = [cProfile.Profile()]
+        loop = None if PROFILER_SEES_ALL_THREADS else loop
+        try:
+            profiles[0].enable()
+            if loop is not None:
+                profiles.append(cProfile.Profile())
+                _call_in_loop(loop, profiles[1].enable)
+        except Exception as e:
+            self._disable(profiles, loop)
+            self._lock.release()
+            print(f"Request profiling could not start: {str(e)}")
+            return None
+        return (profiles, loop)
+
+    # Stop profiling and write the merged stats; returns the file path
+    # Open with `python -m pstats <file>`, snakeviz or flameprof
+    def stop(self, handle, label):
+        profiles, loop = handle
+        try:
+            self._disable(profiles, loop)
+
+            os.makedirs(self.profile_dir, exist_ok=True)
+            filename = f"{time.strftime('%Y%m%d-%H%M%S')}-{re.sub(r'[^A-Za-z0-9]+', '_', label).strip('_')}.prof"
+            path = os.path.join(self.profile_dir, filename)
+            stats = pstats.Stats(profiles[0])
+            for profile in profiles[1:]:
+                stats.add(profile)
+            stats.dump_stats(path)
+            return path
+        finally:
+            self._lock.release()
+
+    # Disable each profiler on the thread that enabled it; disabling one that never started is a no-op
+    @staticmethod
+    def _disable(profiles, loop):
+        try:
+            profiles[0].disable()
+        finally:
+            if len(profiles) > 1:
+                _call_in_loop(loop, profiles[1].disable)
+
+
+# Run fn on the loop's own thread and wait for it, since a profiler only sees the thread that enabled it
+# An exception raised by fn is raised again here
+def _call_in_loop(loop, fn, timeout=5):
+    done = threading.Event()
+    errors = []
+    def run():
+        try:
+            fn()
+        except Exception as e:
+            errors.append(e)
+        finally:
+            done.set()
+    loop.call_soon_threadsafe(run)
+    done.wait(timeout)
+    if errors:
+        raise errors[0]
+
+
+# Return the process-wide tracer, creating it from config on first use
+@process_wide
+def get_tracer():
+    return Tracer(config.trace_buffer_size, config.trace_slow_ms)
@@ -1,6 +1,8 @@
 let sessionsData = [];
 let currentSessionIndex = -1;
 let pathPoints = [];
+// Raw assessment text by report filename, fetched in one batch for the sessions on the roadmap
+const rawAssessments = {};
 
 document.addEventListener('DOMContentLoaded', function () {
   loadSessions();
@@ -94,6 +96,30 @@ function displayRoadmap() {
     const lockedLandmark = createLandmark(null, i, maxSessions, pathPoints, true);
     landmarksContainer.appendChild(lockedLandmark);
   }
+
+  prefetchRawAssessments(sessionsToShow);
+}
+
+function assessmentFilename(session) {
+  return session.filepath ? session.filepath.split(/[/\\]/).pop() : null;
+}
+
+// Load the raw assessments of the given sessions with a single request, so opening a session
+// does not wait on its own fetch; the server answers 304 while the browser's copy is current
+async function prefetchRawAssessments(sessions) {
+  const filenames = sessions.map(assessmentFilename).filter((f) => f && !(f in rawAssessments));
+  if (filenames.length === 0) return;
+
+  const params = new URLSearchParams();
+  filenames.forEach((f) => params.append('filename', f));
+  try {
+    const response = await fetch(`/api/assessment/raw?${params.toString()}`);
+    if (!response.ok) return;
+    const data = await response.json();
+    Object.assign(rawAssessments, data.assessments || {});
+  } catch (error) {
+    console.error('Error prefetching raw assessments:', error);
+  }
 }
 
 function drawPath(svg, numSessions) {
@@ -243,12 +269,16 @@ async function showSessionDetails(index) {
   } exchanges • Score: ${session.final_score || 0}/100`;
 
   let rawAssessmentText = '';
-  if (session.filepath) {
+  const filename = assessmentFilename(session);
+  if (filename && filename in rawAssessments) {
+    rawAssessmentText = rawAssessments[filename];
+  } else if (filename) {
+    // Not prefetched (e.g. the batch request is still in flight or failed)
     try {
-      const filename = encodeURIComponent(session.filepath.split(/[/\\]/).pop());
-      const response = await fetch(`/api/assessment/raw/${filename}`);
+      const response = await fetch(`/api/assessment/raw/${encodeURIComponent(filename)}`);
       const data = await response.json();
       rawAssessmentText = data.assessment_text || '';
+      rawAssessments[filename] = rawAssessmentText;
     } catch (error) {
       console.error('Error loading raw assessment:', error);
     }
@@ -1,4 +1,6 @@
 let applicantsData = [];
+// Rendered assessments by report filename, fetched when a candidate's card is first opened
+const assessmentHtml = {};
 
 // Load applicants when page loads
 document.addEventListener('DOMContentLoaded', function() {
@@ -214,18 +216,52 @@ function showCharacteristics(index) {
         }
     }
 
-    // AI Assessment Summary
-    if (applicant.ai_assessment) {
+    // AI Assessment Summary, filled in once the rendered report has loaded
+    const filename = assessmentFilename(applicant);
+    if (filename) {
         content += `
-            <div class="characteristics-section">
+            <div class="characteristics-section" id="ai-assessment-section">
                 <div class="section-title">AI Assessment Summary</div>
-                <div style="background: rgba(59, 130, 246, 0.1); border-radius: 10px; padding: 15px; white-space: pre-wrap; color: rgb(197, 228, 255);">${applicant.ai_assessment}</div>
+                <div id="ai-assessment-summary" data-filename="${filename}" style="background: rgba(59, 130, 246, 0.1); border-radius: 10px; padding: 15px; white-space: pre-wrap; color: rgb(197, 228, 255);">Loading assessment...</div>
             </div>
         `;
     }
 
     contentElement.innerHTML = content;
     modal.style.display = 'flex';
+
+    if (filename) {
+        showAssessmentHtml(filename);
+    }
+}
+
+function assessmentFilename(applicant) {
+    return applicant.filepath ? applicant.filepath.split(/[/\\]/).pop() : null;
+}
+
+// Load one rendered assessment (the server answers 304 while the browser's copy is current) and
+// show it, unless another candidate's card has been opened in the meantime
+async function showAssessmentHtml(filename) {
+    let html = assessmentHtml[filename] || '';
+    if (!(filename in assessmentHtml)) {
+        try {
+            const response = await fetch(`/api/assessment/html/${encodeURIComponent(filename)}`);
+            if (response.ok) {
+                const data = await response.json();
+                html = assessmentHtml[filename] = data.assessment_html || '';
+            }
+        } catch (error) {
+            console.error('Error loading assessment:', error);
+        }
+    }
+
+    const summary = document.getElementById('ai-assessment-summary');
+    if (!summary || summary.dataset.filename !== filename) return;
+    if (html) {
+        summary.innerHTML = html;
+    } else {
+        document.getElementById('ai-assessment-section').remove();
+    }
 }
 
 function closeModal() {
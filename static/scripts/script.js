@@ -140,14 +140,15 @@ class BondsAI {
         this.showTypingIndicator(type);
         
         try {
-            // Send message to backend
-            const response = await this.callAPI(type, message);
-            
-            // Hide typing indicator
-            this.hideTypingIndicator(type);
-            
-            // Add AI response to UI
-            this.addMessageToUI(type, response.message, 'ai');
+            // Stream the reply from the backend, falling back to the plain JSON endpoint
+            let response;
+            if (window.ReadableStream && window.TextDecoder) {
+                response = await this.streamAPI(type, message);
+            } else {
+                response = await this.callAPI(type, message);
+                this.hideTypingIndicator(type);
+                this.addMessageToUI(type, response.message, 'ai');
+            }
             
             // Check if conversation is complete and show profile with a one second delay
             if (response.isComplete && response.profile && !this.isComplete) {
@@ -164,6 +165,74 @@ class BondsAI {
         }
     }
 
+    async streamAPI(type, message) {
+        const endpoint = '/applicant/chat/stream';
+        const response = await fetch(`${this.API_BASE}${endpoint}`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ message: message })
+        });
+        
+        if (!response.ok || !response.body) {
+            const errorData = await response.json().catch(() => ({}));
+            throw new Error(errorData.error || 'Network response was not ok');
+        }
+        
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let bubble = null;
+        let text = '';
+        
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+            
+            // Server-Sent Events are separated by a blank line
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const rawEvent = buffer.slice(0, boundary);
+                buffer = buffer.slice(boundary + 2);
+                
+                let eventName = 'message';
+                let data = '';
+                rawEvent.split('\n').forEach(line => {
+                    if (line.startsWith('event: ')) eventName = line.slice(7);
+                    else if (line.startsWith('data: ')) data += line.slice(6);
+                });
+                const payload = JSON.parse(data || '{}');
+                
+                if (eventName === 'error') {
+                    throw new Error(payload.error || 'Stream error');
+                }
+                if (eventName === 'done') {
+                    if (!bubble) {
+                        this.hideTypingIndicator(type);
+                        this.addMessageToUI(type, payload.message, 'ai');
+                    } else {
+                        this.jobMessages.push({ sender: 'ai', message: payload.message });
+                    }
+                    return payload;
+                }
+                
+                // First token replaces the typing indicator with a live message bubble
+                if (!bubble) {
+                    this.hideTypingIndicator(type);
+                    bubble = this.createMessageBubble(type, 'ai');
+                }
+                text += payload.token;
+                bubble.textContent = text;
+                const messagesContainer = document.getElementById(`${type}-messages`);
+                messagesContainer.scrollTop = messagesContainer.scrollHeight;
+            }
+        }
+        
+        throw new Error('Stream ended before the reply was complete');
+    }
+
     async callAPI(type, message) {
         const endpoint = '/applicant/chat';
         const response = await fetch(`${this.API_BASE}${endpoint}`, {
@@ -182,7 +251,7 @@ class BondsAI {
         return await response.json();
     }
 
-    addMessageToUI(type, message, sender) {
+    createMessageBubble(type, sender) {
         const messagesContainer = document.getElementById(`${type}-messages`);
         const messageDiv = document.createElement('div');
         messageDiv.className = `message ${sender}-message`;
@@ -194,9 +263,15 @@ class BondsAI {
             bubbleDiv.className = 'message-bubble';
         }
         
-        bubbleDiv.textContent = message;
         messageDiv.appendChild(bubbleDiv);
         messagesContainer.appendChild(messageDiv);
+        return bubbleDiv;
+    }
+
+    addMessageToUI(type, message, sender) {
+        const messagesContainer = document.getElementById(`${type}-messages`);
+        const bubbleDiv = this.createMessageBubble(type, sender);
+        bubbleDiv.textContent = message;
         
         // Store message
         if (type === 'dating') {
@@ -238,7 +313,7 @@ class BondsAI {
                 <strong>Candidate:</strong> ${profileData.name}
             </div>
             <div class="profile-section">
-                <strong>Your assessment results have been recorded. Thank you for your time.</strong><br>
+                <strong id="${type}-assessment-status">Your assessment is being prepared...</strong><br>
             </div>
             <div class="profile-section">
                 <strong>Interview Duration:</strong> ${profileData.conversation_duration}
@@ -249,6 +324,10 @@ class BondsAI {
         profileContent.innerHTML = profileHTML;
         profileDisplay.style.display = 'block';
 
+        if (profileData.assessment_job_id) {
+            this.waitForAssessment(type, profileData.assessment_job_id);
+        }
+
         const closeButton = document.getElementById('apply-button')
 
         closeButton.addEventListener('click', () => {
@@ -261,6 +340,28 @@ class BondsAI {
         });
     }
 
+    async waitForAssessment(type, jobId) {
+        // Poll the background assessment job until the report has been saved
+        const status = document.getElementById(`${type}-assessment-status`);
+        while (true) {
+            try {
+                const response = await fetch(`${this.API_BASE}/api/assessment/jobs/${encodeURIComponent(jobId)}`);
+                const job = await response.json();
+                if (!response.ok || job.status === 'failed') {
+                    status.textContent = 'We could not prepare your assessment this time. Please try another practice session.';
+                    return;
+                }
+                if (job.status === 'done') {
+                    status.textContent = 'Your assessment results have been recorded. Thank you for your time.';
+                    return;
+                }
+            } catch (error) {
+                console.error('Error checking assessment status:', error);
+            }
+            await new Promise(resolve => setTimeout(resolve, 2000));
+        }
+    }
+
     async showConfirmationPage() {
         // After a practice session, send students to their journey view
         window.location.href = '/journey';
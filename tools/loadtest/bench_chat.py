@@ -0,0 +1,95 @@
+"""Measure /applicant/chat throughput and latency with concurrent students, in one process.
+
+A fake OpenAI server (fake_openai.py) runs on a background thread and the
+app is driven through Flask's test client from one thread per student, so
+the numbers reflect how the app handles concurrent turns rather than HTTP
+serving. --app-dir runs the same benchmark against another checkout, which
+is how a change is compared with the revision before it:
+
+    git worktree add /tmp/bondsai-before <revision>
+    python tools/loadtest/bench_chat.py --app-dir /tmp/bondsai-before
+    python tools/loadtest/bench_chat.py
+
+The OpenAI SDK reads OPENAI_BASE_URL itself, so older revisions without
+that setting are pointed at the fake server too.
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import threading
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_openai import FakeOpenAIServer  # noqa: E402
+
+
+# Nearest-rank percentile of an already sorted list
+def percentile(values, pct):
+    rank = max(1, -(-len(values) * pct // 100))
+    return values[int(rank) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /applicant/chat with concurrent students")
+    parser.add_argument("--students", type=int, default=40)
+    parser.add_argument("--turns", type=int, default=6)
+    parser.add_argument("--latency", type=float, default=0.1, help="fake OpenAI seconds before the first token")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0, help="0 sends each reply at once")
+    parser.add_argument("--app-dir", default=REPO_ROOT, help="checkout whose api_server is benchmarked")
+    args = parser.parse_args()
+
+    fake = FakeOpenAIServer(("127.0.0.1", 0), latency=args.latency, jitter=0.0,
+                            tokens_per_second=args.tokens_per_second, seed=1)
+    threading.Thread(target=fake.serve_forever, daemon=True).start()
+    os.environ["OPENAI_BASE_URL"] = fake.base_url
+    os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+    app_dir = os.path.abspath(args.app_dir)
+    os.chdir(app_dir)
+    sys.path[:0] = [os.path.join(app_dir, "src"), app_dir]
+    import api_server
+
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+
+    def student(index):
+        nonlocal errors
+        client = api_server.app.test_client()
+        environ = {"REMOTE_ADDR": f"10.0.{index // 250}.{index % 250}"}
+        client.get("/applicant", environ_base=environ)
+        for turn in range(args.turns):
+            message = "Hi, my name is Jane Doe." if turn == 0 else "Here is my answer."
+            started = time.perf_counter()
+            response = client.post("/applicant/chat", json={"message": message}, environ_base=environ)
+            elapsed = time.perf_counter() - started
+            body = response.get_json(silent=True) or {}
+            with lock:
+                latencies.append(elapsed)
+                if response.status_code != 200 or "Error" in (body.get("message") or ""):
+                    errors += 1
+
+    # The app's own prints would drown the result
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        started = time.perf_counter()
+        threads = [threading.Thread(target=student, args=(i,)) for i in range(args.students)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"{len(latencies)} turns in {wall:.2f}s: {len(latencies) / wall:.1f} req/s, "
+          f"p50 {percentile(latencies, 50) * 1000:.0f} ms, p95 {percentile(latencies, 95) * 1000:.0f} ms, "
+          f"{errors} errors")
+    # Session and loop threads of older revisions are not daemons
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""Local stand-in for the OpenAI chat completions API, for load testing without network access.
+
+Serves GET /v1/models and POST /v1/chat/completions (plain and streamed) with
+configurable latency, token rate and injected errors. Replies are canned but
+shaped like the real ones: interviewer questions, rolling summaries, name
+extraction, per-answer evaluations, and assessment report sections with their
+JSON blocks, so the whole interview and report pipeline runs against it.
+
+Run standalone:
+    python tools/loadtest/fake_openai.py --port 9100 --latency 0.3 --tokens-per-second 80
+then start the server with OPENAI_BASE_URL=http://127.0.0.1:9100/v1
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+QUESTIONS = [
+    "Thank you. Could you tell me about a project you worked on recently and your role in it?",
+    "What was the most difficult part of that project, and how did you handle it?",
+    "Tell me about a time you had to work with a teammate who was not pulling their weight.",
+    "Why are you interested in this kind of role?",
+    "Describe a situation where you had to learn something new quickly.",
+    "How do you prioritise when several deadlines land in the same week?",
+    "Tell me about a time you made a mistake. What did you do next?",
+    "What would your previous manager or lecturer say is your biggest strength?",
+    "How would you approach a problem you have never seen before?",
+    "Do you have any questions for me?",
+]
+
+SKILLS = {
+    "technical_skills": [
+        ("Quantitative Reasoning", "quantitative_reasoning"),
+        ("Programming Skills", "programming"),
+        ("Market Knowledge", "market_knowledge"),
+        ("Data Analysis", "data_analysis"),
+    ],
+    "behavioral_traits": [
+        ("Problem-solving", "problem_solving"),
+        ("Teamwork", "teamwork"),
+        ("Initiative", "initiative"),
+        ("Resilience", "resilience"),
+        ("Adaptability", "adaptability"),
+    ],
+    "cultural_fit": [
+        ("Collaborative Thinking", "collaborative_thinking"),
+        ("Continuous Learning", "continuous_learning"),
+        ("Challenge-seeking", "challenge_seeking"),
+        ("Entrepreneurial Spirit", "entrepreneurial_spirit"),
+    ],
+    "soft_skills": [
+        ("Communication", "communication"),
+        ("Decision-making", "decision_making"),
+        ("Time Management", "time_management"),
+        ("Leadership", "leadership"),
+    ],
+}
+
+SECTION_TITLES = {
+    "technical_skills": "1. Technical Skills Assessment",
+    "behavioral_traits": "2. Behavioral Traits Assessment",
+    "cultural_fit": "3. Cultural Fit Assessment",
+    "soft_skills": "4. Soft Skills Assessment",
+}
+
+FEEDBACK = (
+    "You gave a concrete example and explained your own contribution clearly. "
+    "The answer would be stronger with a measurable result at the end. "
+    "Practise closing each story with the outcome and what you learned."
+)
+
+
+INSIGHTS = {
+    "strengths": ["Clear, specific project examples", "Calm and structured delivery", "Honest about gaps"],
+    "weaknesses": ["Rarely quantifies impact", "Long answers to simple questions", "Little research on the role"],
+    "recommendations": [
+        "Prepare 3 STAR stories and practise them aloud",
+        "Add one number to every project story",
+        "Write and time a 60-second introduction",
+        "Research two companies in the target industry",
+        "Do another practice session within a week",
+    ],
+}
+
+
+# Build one section of the assessment report, in the layout the section prompt asks for, with its JSON block
+def report_section(rng, prompt):
+    for section, title in SECTION_TITLES.items():
+        if f'"{title}"' in prompt:
+            break
+    else:
+        lines = [
+            "- **Key Strengths**:",
+            *[f"  - {item}" for item in INSIGHTS["strengths"]],
+            "- **Areas for Improvement**:",
+            *[f"  - {item}" for item in INSIGHTS["weaknesses"]],
+            "- **Recommended Future Steps**:",
+            *[f"  - {item}" for item in INSIGHTS["recommendations"]],
+            "",
+            "This was practice, and every session makes you more confident. Review this feedback and focus on the recommended steps before your next practice.",
+        ]
+        return "\n".join(lines + ["", "```json", json.dumps(INSIGHTS, indent=2), "```"])
+
+    scores = {}
+    lines = []
+    for label, key in SKILLS[section]:
+        scores[key] = rng.randint(45, 90)
+        lines.append(f"- **{label}**: {scores[key]}")
+        lines.append(f"  - {FEEDBACK}")
+    return "\n".join(lines + ["", "```json", json.dumps(scores, indent=2), "```"])
+
+
+# Score a few skills for one answer, as the incremental evaluation prompt asks
+def answer_evaluation(rng):
+    skills = rng.sample([key for section in SKILLS.values() for _, key in section], 3)
+    return json.dumps({
+        "scores": {skill: rng.randint(45, 90) for skill in skills},
+        "feedback": {skill: "The answer gave a concrete example; add the measurable result next time." for skill in skills},
+        "strengths": [rng.choice(["Clear, specific example", "Calm, structured delivery", "Honest about gaps"])],
+        "weaknesses": [rng.choice(["Did not quantify the impact", "Answer ran long", "Generic motivation"])],
+        "recommendations": [rng.choice(["Add one number to every project story", "Practise a 60-second introduction"])],
+        "cultural_alignment": [],
+        "technical_gaps": [],
+    })
+
+
+# Pick a reply that fits the request, based on the prompt the server sent
+def reply_for(request, rng):
+    last = request["messages"][-1]["content"]
+    if "You are writing one section of the feedback report" in last:
+        return report_section(rng, last)
+    if "You are scoring one answer from a mock job interview" in last:
+        return answer_evaluation(rng)
+    if "You are keeping notes on a mock job interview" in last:
+        return "The candidate described a group project they led, a deadline they recovered, and their interest in the role."
+    if "what is the candidate's name" in last:
+        return "Unknown"
+    turn = sum(1 for m in request["messages"] if m["role"] == "user")
+    return QUESTIONS[(turn - 1) % len(QUESTIONS)]
+
+
+class FakeOpenAIServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency=0.3, jitter=0.1, tokens_per_second=80.0, error_rate=0.0, seed=None):
+        super().__init__(address, FakeOpenAIHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    # Seconds before the first token, drawn around the configured latency
+    def first_token_delay(self):
+        with self.rng_lock:
+            return max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter))
+
+    def should_fail(self):
+        with self.rng_lock:
+            self.requests += 1
+            if self.rng.random() < self.error_rate:
+                self.errors += 1
+                return True
+            return False
+
+    def new_rng(self):
+        with self.rng_lock:
+            return random.Random(self.rng.random())
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/models"):
+            self._send_json(200, {"object": "list", "data": [{"id": "gpt-4o-mini", "object": "model"}]})
+        else:
+            self._send_json(404, {"error": {"message": "Not found", "type": "invalid_request_error"}})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "Not found", "type": "invalid_request_error"}})
+            return
+
+        server = self.server
+        time.sleep(server.first_token_delay())
+        if server.should_fail():
+            self._send_json(500, {"error": {"message": "Injected failure", "type": "server_error"}})
+            return
+
+        text = reply_for(request, server.new_rng())
+        words = [word + " " for word in text.split(" ")]
+        usage = {
+            "prompt_tokens": sum(len(m["content"]) for m in request["messages"]) // 4,
+            "completion_tokens": len(words),
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        seconds_per_token = 1.0 / server.tokens_per_second if server.tokens_per_second > 0 else 0.0
+        if request.get("stream"):
+            include_usage = (request.get("stream_options") or {}).get("include_usage", False)
+            self._stream(request["model"], words, seconds_per_token, usage if include_usage else None)
+        else:
+            time.sleep(seconds_per_token * len(words))
+            self._send_json(200, {
+                "id": "chatcmpl-fake",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request["model"],
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+                "usage": usage,
+            })
+
+    def _stream(self, model, words, seconds_per_token, usage=None):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for word in words:
+            chunk = {
+                "id": "chatcmpl-fake",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": word}, "finish_reason": None}],
+            }
+            self._write_chunk(f"data: {json.dumps(chunk)}\n\n")
+            time.sleep(seconds_per_token)
+        if usage is not None:
+            chunk = {
+                "id": "chatcmpl-fake",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [],
+                "usage": usage,
+            }
+            self._write_chunk(f"data: {json.dumps(chunk)}\n\n")
+        self._write_chunk("data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, text):
+        data = text.encode("utf-8")
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def _send_json(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible stand-in for load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency", type=float, default=0.3, help="seconds before the first token")
+    parser.add_argument("--jitter", type=float, default=0.1, help="+/- seconds of random latency")
+    parser.add_argument("--tokens-per-second", type=float, default=80.0, help="0 sends the whole reply at once")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with HTTP 500")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = FakeOpenAIServer(
+        (args.host, args.port),
+        latency=args.latency,
+        jitter=args.jitter,
+        tokens_per_second=args.tokens_per_second,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    print(f"Fake OpenAI API listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
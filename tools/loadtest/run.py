@@ -0,0 +1,337 @@
+"""Drive simulated students through full practice interviews and report latency per endpoint.
+
+Each student loads /applicant, answers until the interviewer closes the
+interview (10-15 turns), then polls the background assessment job until the
+report is saved. Unless --target is given, a fake OpenAI server
+(fake_openai.py) and the API server are started locally, so the run needs
+no network access and no API key.
+
+    python tools/loadtest/run.py --students 50 --latency 0.3 --tokens-per-second 80
+
+Every student sends its own X-Forwarded-For address, so against an already
+running server (--target) start it with TRUST_PROXY_HEADERS=true, or all
+students share one session.
+"""
+
+import argparse
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+FAKE_OPENAI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_openai.py")
+
+# Serve the app without the debug reloader, on a chosen port
+SERVER_BOOTSTRAP = """
+import sys
+import api_server
+api_server.async_runner.start()
+api_server.app.run(host="127.0.0.1", port=int(sys.argv[1]), threaded=True)
+"""
+
+FIRST_NAMES = ["Alex", "Priya", "Sam", "Mei", "Jordan", "Lucas", "Aisha", "Tom", "Hana", "Omar"]
+LAST_NAMES = ["Chen", "Patel", "Nguyen", "Smith", "Kim", "Garcia", "Brown", "Tanaka", "Ali", "Jones"]
+
+ANSWERS = [
+    "In my second year I led a group project building a budgeting app. I split the work, ran weekly check-ins and wrote most of the backend.",
+    "The hardest part was a teammate dropping out two weeks before the deadline. We re-planned, I took over the reports module and we shipped on time.",
+    "One teammate kept missing meetings, so I asked them privately what was going on. They were overloaded, so we swapped tasks and it worked out.",
+    "I like roles where I can work with data to make decisions, and this one mixes analysis with working directly with people.",
+    "For an internship I had to learn SQL in a week. I did a short course every evening and practised on the company's test database.",
+    "I list everything with its deadline, estimate the effort, and do the riskiest piece first. I also tell people early if something will slip.",
+    "I once sent a client the wrong version of a spreadsheet. I told my manager straight away, sent the right one and now I double-check file names.",
+    "They would probably say I stay calm under pressure and I am good at explaining technical things to non-technical people.",
+    "I break it into smaller parts, look for anything similar I have solved before, and ask questions early instead of guessing.",
+    "Yes, what does a typical first month look like for a graduate in this team?",
+    "I also volunteer as a maths tutor, which taught me to explain ideas in several different ways.",
+    "I have been reading about how the industry is using automation, and I would like to build skills there.",
+    "Outside study I play in a football team, which has taught me a lot about communication.",
+    "I would like to grow into a role where I lead small projects within two or three years.",
+    "Thank you, I have really enjoyed this conversation.",
+]
+
+
+class Metrics:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.sessions_completed = 0
+        self.sessions_failed = 0
+        self.lock = threading.Lock()
+
+    def record(self, name, seconds, ok=True):
+        with self.lock:
+            self.latencies[name].append(seconds)
+            if not ok:
+                self.errors[name] += 1
+
+    def session_done(self, ok):
+        with self.lock:
+            if ok:
+                self.sessions_completed += 1
+            else:
+                self.sessions_failed += 1
+
+
+# Nearest-rank percentile of an already sorted list
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    rank = max(1, -(-len(values) * pct // 100))
+    return values[int(rank) - 1]
+
+
+# One HTTP request to the API server; returns (status, body bytes), with status 0 for a connection error
+def http_request(base_url, path, ip_address, body=None, timeout=300):
+    headers = {"X-Forwarded-For": ip_address}
+    data = None
+    if body is not None:
+        data = json.dumps(body).encode("utf-8")
+        headers["Content-Type"] = "application/json"
+    req = urllib.request.Request(base_url + path, data=data, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+    except (urllib.error.URLError, OSError) as e:
+        return 0, str(e).encode("utf-8")
+
+
+# Send a turn to /applicant/chat/stream; returns (status, done event body, seconds to first token)
+def stream_turn(base_url, ip_address, message, started, timeout=300):
+    req = urllib.request.Request(
+        base_url + "/applicant/chat/stream",
+        data=json.dumps({"message": message}).encode("utf-8"),
+        headers={"X-Forwarded-For": ip_address, "Content-Type": "application/json"},
+    )
+    first_token = None
+    event = None
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            for raw_line in response:
+                line = raw_line.decode("utf-8").strip()
+                if line.startswith("event:"):
+                    event = line[len("event:"):].strip()
+                elif line.startswith("data:"):
+                    if first_token is None:
+                        first_token = time.perf_counter() - started
+                    if event in ("done", "error"):
+                        return (200 if event == "done" else 500), json.loads(line[len("data:"):]), first_token
+        return 500, None, first_token
+    except urllib.error.HTTPError as e:
+        return e.code, None, first_token
+    except (urllib.error.URLError, OSError):
+        return 0, None, first_token
+
+
+# One student's whole practice session: load the page, answer every question, wait for the report
+def run_student(index, args, metrics):
+    rng = random.Random(args.seed * 100003 + index)
+    ip_address = f"10.{(index >> 16) & 255}.{(index >> 8) & 255}.{index & 255}"
+    session_started = time.perf_counter()
+
+    started = time.perf_counter()
+    status, _ = http_request(args.target, "/applicant", ip_address)
+    metrics.record("GET /applicant", time.perf_counter() - started, status == 200)
+    if status != 200:
+        metrics.session_done(False)
+        return
+
+    answers = list(ANSWERS)
+    rng.shuffle(answers)
+    messages = [f"Hi, I'm {rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}, a final-year business and computing student."] + answers
+    chat_endpoint = "POST /applicant/chat/stream" if args.stream else "POST /applicant/chat"
+
+    result = None
+    for message in messages[:args.max_turns]:
+        time.sleep(rng.uniform(0, 2 * args.think_time))
+        started = time.perf_counter()
+        if args.stream:
+            status, result, first_token = stream_turn(args.target, ip_address, message, started)
+            if first_token is not None:
+                metrics.record("first token", first_token)
+        else:
+            status, body = http_request(args.target, "/applicant/chat", ip_address, {"message": message})
+            result = json.loads(body) if status == 200 else None
+        metrics.record(chat_endpoint, time.perf_counter() - started, status == 200)
+        if status != 200:
+            metrics.session_done(False)
+            return
+        if result.get("isComplete"):
+            break
+
+    job_id = ((result or {}).get("profile") or {}).get("assessment_job_id")
+    if not job_id:
+        metrics.session_done(False)
+        return
+
+    assessment_started = time.perf_counter()
+    deadline = assessment_started + args.assessment_timeout
+    job_status = None
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        status, body = http_request(args.target, f"/api/assessment/jobs/{job_id}", ip_address)
+        metrics.record("GET /api/assessment/jobs/<id>", time.perf_counter() - started, status == 200)
+        job_status = json.loads(body).get("status") if status == 200 else None
+        if job_status in ("done", "failed"):
+            break
+        time.sleep(args.poll_interval)
+
+    ok = job_status == "done"
+    metrics.record("assessment (queued to saved)", time.perf_counter() - assessment_started, ok)
+    metrics.record("whole session", time.perf_counter() - session_started, ok)
+    metrics.session_done(ok)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_up(url, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=2):
+                return
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.2)
+    raise RuntimeError(f"{url} did not come up within {timeout}s")
+
+
+# Start the fake OpenAI server and the API server pointed at it; returns (processes, API base URL)
+def start_local_servers(args, workdir):
+    fake_port = free_port()
+    fake = subprocess.Popen([
+        sys.executable, FAKE_OPENAI,
+        "--port", str(fake_port),
+        "--latency", str(args.latency),
+        "--jitter", str(args.jitter),
+        "--tokens-per-second", str(args.tokens_per_second),
+        "--error-rate", str(args.error_rate),
+        "--seed", str(args.seed),
+    ], stdout=subprocess.DEVNULL)
+    wait_until_up(f"http://127.0.0.1:{fake_port}/v1/models")
+
+    env = dict(os.environ)
+    env.update({
+        "PYTHONPATH": os.pathsep.join([os.path.join(REPO_ROOT, "src"), REPO_ROOT]),
+        "OPENAI_API_KEY": "loadtest",
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{fake_port}/v1",
+        "TRUST_PROXY_HEADERS": "true",
+        "LLM_CACHE_MODE": "off",
+        "ASSESSMENTS_DIR": os.path.join(workdir, "assessments"),
+        "SESSION_DB_PATH": os.path.join(workdir, "sessions.sqlite3"),
+        "SESSION_MAX_COUNT": str(max(1000, args.students)),
+    })
+    api_port = free_port()
+    log = open(os.path.join(workdir, "api_server.log"), "w")
+    api = subprocess.Popen(
+        [sys.executable, "-c", SERVER_BOOTSTRAP, str(api_port)],
+        cwd=workdir, env=env, stdout=log, stderr=subprocess.STDOUT,
+    )
+    base_url = f"http://127.0.0.1:{api_port}"
+    wait_until_up(base_url + "/api/health")
+    return [api, fake], base_url
+
+
+def print_report(metrics, elapsed, students):
+    total_requests = sum(len(v) for k, v in metrics.latencies.items() if k.startswith(("GET /", "POST /")))
+    print()
+    print(f"Students: {students}  completed: {metrics.sessions_completed}  failed: {metrics.sessions_failed}")
+    print(f"Elapsed: {elapsed:.1f}s  throughput: {total_requests / elapsed:.1f} req/s, "
+          f"{metrics.sessions_completed / elapsed * 60:.1f} sessions/min")
+    print()
+    print(f"{'endpoint':<34}{'count':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, values in metrics.latencies.items():
+        ordered = sorted(values)
+        print(
+            f"{name:<34}{len(ordered):>7}{metrics.errors[name]:>8}"
+            f"{percentile(ordered, 50) * 1000:>10.0f}{percentile(ordered, 95) * 1000:>10.0f}"
+            f"{percentile(ordered, 99) * 1000:>10.0f}{ordered[-1] * 1000:>10.0f}"
+        )
+
+
+def summary_dict(metrics, elapsed, students):
+    endpoints = {}
+    for name, values in metrics.latencies.items():
+        ordered = sorted(values)
+        endpoints[name] = {
+            "count": len(ordered),
+            "errors": metrics.errors[name],
+            "p50_ms": round(percentile(ordered, 50) * 1000, 1),
+            "p95_ms": round(percentile(ordered, 95) * 1000, 1),
+            "p99_ms": round(percentile(ordered, 99) * 1000, 1),
+            "max_ms": round(ordered[-1] * 1000, 1),
+        }
+    return {
+        "students": students,
+        "completed": metrics.sessions_completed,
+        "failed": metrics.sessions_failed,
+        "elapsed_s": round(elapsed, 2),
+        "endpoints": endpoints,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the practice interview flow against a fake OpenAI server")
+    parser.add_argument("--students", type=int, default=20, help="simulated students, all running at once")
+    parser.add_argument("--ramp-up", type=float, default=5.0, help="seconds over which students start")
+    parser.add_argument("--think-time", type=float, default=0.5, help="mean seconds a student waits between turns")
+    parser.add_argument("--max-turns", type=int, default=15, help="answers sent before giving up on the interview ending")
+    parser.add_argument("--stream", action="store_true", help="chat through /applicant/chat/stream")
+    parser.add_argument("--target", help="URL of a running API server; by default one is started locally")
+    parser.add_argument("--latency", type=float, default=0.3, help="fake API seconds before the first token")
+    parser.add_argument("--jitter", type=float, default=0.1, help="fake API +/- seconds of random latency")
+    parser.add_argument("--tokens-per-second", type=float, default=80.0, help="fake API token rate")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of fake API requests that fail")
+    parser.add_argument("--poll-interval", type=float, default=0.5, help="seconds between assessment status polls")
+    parser.add_argument("--assessment-timeout", type=float, default=300.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    processes = []
+    workdir = tempfile.mkdtemp(prefix="bondsai-loadtest-")
+    try:
+        if args.target is None:
+            processes, args.target = start_local_servers(args, workdir)
+            print(f"API server {args.target} (log: {os.path.join(workdir, 'api_server.log')})")
+        args.target = args.target.rstrip("/")
+
+        metrics = Metrics()
+        threads = []
+        started = time.perf_counter()
+        for index in range(args.students):
+            thread = threading.Thread(target=run_student, args=(index + 1, args, metrics), daemon=True)
+            thread.start()
+            threads.append(thread)
+            if args.students > 1:
+                time.sleep(args.ramp_up / args.students)
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        print_report(metrics, elapsed, args.students)
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(summary_dict(metrics, elapsed, args.students), f, indent=2)
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
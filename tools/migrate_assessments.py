@@ -0,0 +1,50 @@
+"""Move assessment reports from the flat assessments/ directory into date shards.
+
+Reports (and their JSON sidecars) move to ASSESSMENTS_DIR/YYYY/MM/DD/, then the
+assessment index is synced so its rows point at the new paths, without
+re-parsing them. Safe to rerun: reports already in a shard are left alone, and
+the server keeps finding unmigrated reports in the flat layout, so it can stay
+up while this runs.
+
+    python tools/migrate_assessments.py --dry-run
+    python tools/migrate_assessments.py
+
+Reads the same .env as the server.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(REPO_ROOT, "src"), REPO_ROOT]
+
+from bondsai.config import config  # noqa: E402
+from server.AssessmentIndex import get_assessment_index  # noqa: E402
+from server.AssessmentStore import AssessmentStore  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shard assessment reports by interview date")
+    parser.add_argument("--assessments-dir", default=config.assessments_dir)
+    parser.add_argument("--dry-run", action="store_true", help="only count the reports that would move")
+    parser.add_argument("--workers", type=int, default=None, help="processes for indexing reports not yet indexed")
+    args = parser.parse_args()
+
+    store = AssessmentStore(args.assessments_dir)
+    started = time.perf_counter()
+    moved = store.migrate(dry_run=args.dry_run)
+    if args.dry_run:
+        print(f"{moved} reports would be moved into date shards under {args.assessments_dir}")
+        return
+
+    print(f"Moved {moved} reports into date shards in {time.perf_counter() - started:.1f}s")
+    started = time.perf_counter()
+    added, repointed, removed = get_assessment_index().sync(store, args.workers)
+    print(f"Index updated in {time.perf_counter() - started:.1f}s: {repointed} rows moved, "
+          f"{added} new reports indexed, {removed} stale rows removed")
+
+
+if __name__ == "__main__":
+    main()
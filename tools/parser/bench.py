@@ -0,0 +1,40 @@
+"""Time the old regex cascade against the single-pass parser on the fixture reports.
+
+Both parsers get the report's content, so the numbers cover parsing alone,
+without file reads, the JSON sidecar or the cache. Each parser runs over
+every fixture --number times, and the best of --repeat runs is reported
+per report.
+
+    python tools/parser/bench.py --number 300 --repeat 5
+
+Run parity.py first; a faster parser that reads different scores is no use.
+"""
+
+import argparse
+import timeit
+
+from parity import load_fixtures, parse_current, parse_legacy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the assessment report parsers")
+    parser.add_argument("--number", type=int, default=300, help="passes over the fixtures per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs, of which the fastest is reported")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures()
+    reports = args.number * len(fixtures)
+    timings = {}
+    for label, parse in (("regex cascade", parse_legacy), ("single pass", parse_current)):
+        def run():
+            for _, path, content in fixtures:
+                parse(path, content)
+        timings[label] = min(timeit.repeat(run, number=args.number, repeat=args.repeat)) / reports
+        print(f"{label:>13}: {timings[label] * 1e6:7.1f} us per report")
+
+    print(f"{len(fixtures)} fixture reports, {reports} parses per run: "
+          f"{timings['regex cascade'] / timings['single pass']:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
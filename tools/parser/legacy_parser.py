@@ -0,0 +1,201 @@
+"""The regex cascade that parsed assessment reports before the single-pass parser.
+
+A frozen copy of the old _parse_assessment_file, kept only so parity.py and
+bench.py can compare the two parsers; nothing in the app imports it. It
+takes the report's content instead of a path and leaves out the markdown
+render of ai_assessment, which listings no longer carry.
+"""
+
+import os
+import re
+from datetime import datetime
+
+
+def parse_assessment_content(filepath, content):
+    # Extract basic info from filename and content
+    filename = os.path.basename(filepath)
+    name_match = re.search(r'^(.+?)_assessment_', filename)
+    candidate_name = name_match.group(1).replace('_', ' ').title() if name_match else "Anonymous"
+
+    # Extract interview date from filename
+    date_match = re.search(r'_(\d{8})_\d{6}\.txt$', filename)
+    if date_match:
+        date_str = date_match.group(1)
+        interview_date = datetime.strptime(date_str, '%Y%m%d').strftime('%Y-%m-%d')
+    else:
+        interview_date = "Unknown"
+
+    # Extract conversation count
+    conversation_count = 0
+    count_match = re.search(r'Interview Length: (\d+) exchanges', content)
+    if count_match:
+        conversation_count = int(count_match.group(1))
+
+    # Extract conversation duration
+    conversation_duration_match = re.search(r'Conversation Duration: (\d+)h (\d+)m (\d+)s', content)
+    if conversation_duration_match:
+        conversation_duration = f"{conversation_duration_match.group(1)}h {conversation_duration_match.group(2)}m {conversation_duration_match.group(3)}s"
+    else:
+        conversation_duration = "0h 0m 0s"
+
+    final_score = 0
+    final_score_match = re.search(r'Final Score: (\d+)', content.replace('**', ''))
+    if final_score_match:
+        final_score = int(final_score_match.group(1))
+
+    # Initialize default scores
+    candidate_data = {
+        "name": candidate_name,
+        "interview_date": interview_date,
+        "conversation_count": conversation_count,
+        "conversation_duration": conversation_duration,
+        "final_score": final_score,
+        "technical_skills": {
+            "quantitative_reasoning": 0,
+            "programming": 0,
+            "market_knowledge": 0,
+            "data_analysis": 0
+        },
+        "behavioral_traits": {
+            "problem_solving": 0,
+            "teamwork": 0,
+            "initiative": 0,
+            "resilience": 0,
+            "adaptability": 0
+        },
+        "cultural_fit": {
+            "collaborative_thinking": 0,
+            "continuous_learning": 0,
+            "challenge_seeking": 0,
+            "entrepreneurial_spirit": 0
+        },
+        "soft_skills": {
+            "communication": 0,
+            "decision_making": 0,
+            "time_management": 0,
+            "leadership": 0
+        },
+        "insights": {
+            "strengths": [],
+            "weaknesses": [],
+            "recommendations": []
+        }
+    }
+
+    # Try to extract AI assessment content (everything between the header and transcript)
+    assessment_start = content.find("Generated on:")
+    transcript_start = content.find("Full Interview Transcript:")
+
+    if assessment_start != -1 and transcript_start != -1:
+        ai_assessment = content[assessment_start:transcript_start].strip()
+
+        # Extract final score
+        final_score_match = re.search(r'Final Score[:\s]+(\d+)', ai_assessment, re.IGNORECASE)
+        if final_score_match:
+            candidate_data["final_score"] = int(final_score_match.group(1))
+
+        # Extract technical skills scores
+        tech_section = re.search(r'Technical Skills.*?(?=Behavioral|Cultural|Soft|Overall|$)', ai_assessment, re.DOTALL | re.IGNORECASE)
+        if tech_section:
+            tech_text = tech_section.group(0)
+            candidate_data["technical_skills"]["quantitative_reasoning"] = extract_score(tech_text, "quantitative")
+            candidate_data["technical_skills"]["programming"] = extract_score(tech_text, "programming")
+            candidate_data["technical_skills"]["market_knowledge"] = extract_score(tech_text, "market")
+            candidate_data["technical_skills"]["data_analysis"] = extract_score(tech_text, "data")
+
+        # Extract behavioral traits scores
+        behavioral_section = re.search(r'Behavioral.*?(?=Technical|Cultural|Soft|Overall|$)', ai_assessment, re.DOTALL | re.IGNORECASE)
+        if behavioral_section:
+            behavioral_text = behavioral_section.group(0)
+            candidate_data["behavioral_traits"]["problem_solving"] = extract_score(behavioral_text, "problem")
+            candidate_data["behavioral_traits"]["teamwork"] = extract_score(behavioral_text, "teamwork")
+            candidate_data["behavioral_traits"]["initiative"] = extract_score(behavioral_text, "initiative")
+            candidate_data["behavioral_traits"]["resilience"] = extract_score(behavioral_text, "resilience")
+            candidate_data["behavioral_traits"]["adaptability"] = extract_score(behavioral_text, "adaptability")
+
+        # Extract cultural fit scores
+        cultural_section = re.search(r'Cultural.*?(?=Technical|Behavioral|Soft|Overall|$)', ai_assessment, re.DOTALL | re.IGNORECASE)
+        if cultural_section:
+            cultural_text = cultural_section.group(0)
+            candidate_data["cultural_fit"]["collaborative_thinking"] = extract_score(cultural_text, "collaborative")
+            candidate_data["cultural_fit"]["continuous_learning"] = extract_score(cultural_text, "learning")
+            candidate_data["cultural_fit"]["challenge_seeking"] = extract_score(cultural_text, "challenge")
+            candidate_data["cultural_fit"]["entrepreneurial_spirit"] = extract_score(cultural_text, "entrepreneurial")
+
+        # Extract soft skills scores
+        soft_section = re.search(r'Soft Skills.*?(?=Technical|Behavioral|Cultural|Overall|$)', ai_assessment, re.DOTALL | re.IGNORECASE)
+        if soft_section:
+            soft_text = soft_section.group(0)
+            candidate_data["soft_skills"]["communication"] = extract_score(soft_text, "communication")
+            candidate_data["soft_skills"]["decision_making"] = extract_score(soft_text, "decision")
+            candidate_data["soft_skills"]["time_management"] = extract_score(soft_text, "time")
+            candidate_data["soft_skills"]["leadership"] = extract_score(soft_text, "leadership")
+
+        # Extract insights from Overall Assessment section
+        overall_section = re.search(r'####?\s*5\.\s*Overall Assessment.*?(?=####?\s*[1-4]\.|$)', ai_assessment, re.DOTALL | re.IGNORECASE)
+        if overall_section:
+            overall_text = overall_section.group(0)
+
+            # Extract strengths
+            strengths_match = re.search(r'(?:Key )?Strengths?[:\s]+(.*?)(?=Areas|Weaknesses|Recommended|Final|$)', overall_text, re.DOTALL | re.IGNORECASE)
+            if strengths_match:
+                strengths_text = strengths_match.group(1)
+                candidate_data["insights"]["strengths"] = extract_list_items(strengths_text)
+
+            # Extract areas for improvement
+            weaknesses_match = re.search(r'Areas for Improvement[:\s]+(.*?)(?=Recommended|Strengths|Final|$)', overall_text, re.DOTALL | re.IGNORECASE)
+            if weaknesses_match:
+                weaknesses_text = weaknesses_match.group(1)
+                candidate_data["insights"]["weaknesses"] = extract_list_items(weaknesses_text)
+
+            # Extract recommended future steps
+            recommendations_match = re.search(r'Recommended Future Steps[:\s]+(.*?)(?=Strengths|Areas|Final|$)', overall_text, re.DOTALL | re.IGNORECASE)
+            if recommendations_match:
+                recommendations_text = recommendations_match.group(1)
+                candidate_data["insights"]["recommendations"] = extract_list_items(recommendations_text)
+            else:
+                # Fallback to old format
+                recommendations_match = re.search(r'Recommendations?[:\s]+(.*?)(?=Strengths|Weaknesses|Areas|Final|$)', overall_text, re.DOTALL | re.IGNORECASE)
+                if recommendations_match:
+                    recommendations_text = recommendations_match.group(1)
+                    candidate_data["insights"]["recommendations"] = extract_list_items(recommendations_text)
+
+    return candidate_data
+
+
+# Extract a score for a specific skill from text.
+def extract_score(text, skill_keyword):
+    # Look for patterns like "Programming: 85" or "Programming Skills: 85/100"
+    pattern = rf'{skill_keyword}[^:]*:\s*(\d+)'
+    match = re.search(pattern, text, re.IGNORECASE)
+    if match:
+        return int(match.group(1))
+
+    # Look for patterns like "- Programming: 85"
+    pattern = rf'-\s*{skill_keyword}[^:]*:\s*(\d+)'
+    match = re.search(pattern, text, re.IGNORECASE)
+    if match:
+        return int(match.group(1))
+
+    return 0
+
+
+# Extract list items from text (bullet points, numbered lists, etc.).
+def extract_list_items(text):
+    items = []
+
+    # Split by lines and look for list patterns
+    lines = text.strip().split('\n')
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        # Remove common list markers
+        line = re.sub(r'^[-*•]\s*', '', line)
+        line = re.sub(r'^\d+\.\s*', '', line)
+
+        if line and len(line) > 5:  # Only include meaningful items
+            items.append(line)
+
+    return items[:5]  # Limit to 5 items
@@ -0,0 +1,125 @@
+"""Check that the single-pass parser reads the fixture reports as the old regex cascade did.
+
+Every report in fixtures/ is parsed by both parsers (legacy_parser.py and
+server.AssessmentFileLoader.parse_assessment_content) and every field is
+compared: header fields, the final score, the 17 skill scores and the three
+insight lists. The only differences allowed are the ones listed in
+KNOWN_FIXES, where the old parser read the report wrongly; each is pinned
+to the exact old and new value, so a fix that stops applying fails too.
+
+    python tools/parser/parity.py
+
+Exits with status 1 and lists the differing fields if the parsers disagree.
+"""
+
+import glob
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+sys.path[:0] = [os.path.dirname(os.path.abspath(__file__)), os.path.join(REPO_ROOT, "src")]
+
+from legacy_parser import parse_assessment_content as parse_legacy  # noqa: E402
+from server.AssessmentFileLoader import parse_assessment_content as parse_current  # noqa: E402
+
+# Insight lists of the reports that follow the layout the assessment prompt asks for
+STRENGTHS = [
+    "Clear explanations of technical projects with relevant detail",
+    "Genuine enthusiasm for learning and self-improvement",
+    "Good teamwork examples from group assignments",
+]
+WEAKNESSES = [
+    "Answers lacked measurable outcomes; add numbers to show impact",
+    "Limited industry knowledge; research the company and its competitors",
+    "Some answers rambled; use STAR to keep them structured",
+]
+RECOMMENDATIONS = [
+    "Prepare 3 STAR stories about teamwork and practise them aloud",
+    "Quantify outcomes for 2 projects with numbers and metrics",
+    "Write a 60-second elevator pitch and time yourself",
+    "Read two industry news articles each week",
+    "Practise answering 'Tell me about yourself' in under 2 minutes",
+]
+
+# The old parser took the first "data" or "time" followed by a colon anywhere in the section
+# ("data structures you chose. Explain why... Market Knowledge**: 55"), not the skill's own bullet
+MISREAD_SCORES = {
+    "technical_skills.data_analysis": (55, 68),
+    "soft_skills.time_management": (69, 71),
+}
+# Its "Strengths?[:\s]+" pattern never matched "**Key Strengths**:", so the lists stayed empty
+MISSED_BOLD_INSIGHTS = {
+    "insights.strengths": ([], STRENGTHS),
+    "insights.weaknesses": ([], WEAKNESSES),
+    "insights.recommendations": ([], RECOMMENDATIONS),
+}
+
+# Fixture filename -> {field: (old value, new value)} for every difference that is a fix
+KNOWN_FIXES = {
+    "Alex_Chen_assessment_20260105_101112.txt": {**MISREAD_SCORES, **MISSED_BOLD_INSIGHTS},
+    "Maria_Garcia_assessment_20260415_110000.txt": {**MISREAD_SCORES, **MISSED_BOLD_INSIGHTS},
+    "Sam_Lee_assessment_20260303_141516.txt": {**MISREAD_SCORES, **MISSED_BOLD_INSIGHTS},
+    # Plain "Key Strengths:" labels did match, so only the scores differ
+    "Priya_Nair_assessment_20260212_093000.txt": MISREAD_SCORES,
+    # The old parser only knew "Areas for Improvement", not a "Weaknesses:" list
+    "Jordan_Smith_assessment_20251120_160501.txt": {
+        "insights.weaknesses": ([], [
+            "Little research into the company before the interview",
+            "Answers stop before describing the outcome",
+        ]),
+    },
+}
+
+
+# (filename, path, content) of every fixture report, sorted by filename
+def load_fixtures():
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.txt"))):
+        with open(path, "r", encoding="utf-8") as f:
+            fixtures.append((os.path.basename(path), path, f.read()))
+    return fixtures
+
+
+# Nested candidate data as {"section.field": value}
+def flatten(candidate_data, prefix=""):
+    fields = {}
+    for key, value in candidate_data.items():
+        if isinstance(value, dict):
+            fields.update(flatten(value, f"{prefix}{key}."))
+        else:
+            fields[f"{prefix}{key}"] = value
+    return fields
+
+
+# Descriptions of every way the two parsers' output for one report departs from KNOWN_FIXES
+def compare(filename, legacy, current):
+    fixes = KNOWN_FIXES.get(filename, {})
+    problems = []
+    for field in sorted(set(legacy) | set(current)):
+        old, new = legacy.get(field), current.get(field)
+        if field in fixes:
+            if (old, new) != fixes[field]:
+                problems.append(f"{field}: expected fix {fixes[field][0]!r} -> {fixes[field][1]!r}, got {old!r} -> {new!r}")
+        elif old != new:
+            problems.append(f"{field}: old {old!r}, new {new!r}")
+    return problems
+
+
+def main():
+    fixtures = load_fixtures()
+    failed = 0
+    for filename, path, content in fixtures:
+        problems = compare(filename, flatten(parse_legacy(path, content)), flatten(parse_current(path, content)))
+        fixed = len(KNOWN_FIXES.get(filename, {}))
+        print(f"{'FAIL' if problems else 'ok  '} {filename} ({fixed} known fixes)")
+        for problem in problems:
+            print(f"       {problem}")
+        failed += bool(problems)
+
+    print(f"{len(fixtures) - failed}/{len(fixtures)} reports parsed identically apart from known fixes")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()